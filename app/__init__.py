@@ -27,10 +27,12 @@ def create_app():
     from app.api.routes.config import config_bp
     from app.api.routes.control import control_bp
     from app.api.routes.system import system_bp
+    from app.api.routes.history import history_bp
 
     app.register_blueprint(web)
     app.register_blueprint(config_bp)
     app.register_blueprint(control_bp)
     app.register_blueprint(system_bp)
+    app.register_blueprint(history_bp)
 
     return app
@@ -103,6 +103,10 @@ def update_system():
         data = SystemUpdate(**request.json)
         if data.output_dir is not None:
             config.system.output_dir = data.output_dir
+            # Release pooled connections to the previous database
+            from app.core.database import db_manager
+
+            db_manager.close_all_connections()
             _save_and_notify({"outputDir": data.output_dir})
             processor.reload_history()
         return jsonify({"status": "ok"})
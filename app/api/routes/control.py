@@ -16,12 +16,15 @@ from app.services.control_service import (
     play_audio_handler,
     delete_audio_handler,
     update_text_handler,
+    synthesize_batch_handler,
 )
 from app.api.schemas.control import (
     ControlStateResponse,
     PlayResponse,
     DeleteResponse,
     ItemIdRequest,
+    BatchSynthesisRequest,
+    BatchSynthesisResponse,
 )
 from app.api.schemas.system import BrowseResponse
 from app.web.routes import (
@@ -29,6 +32,7 @@ from app.web.routes import (
     audio_manager,
     ffmpeg_client,
     processor,
+    audio_archiver,
     get_resolve_client,
 )
 from app.config import config
@@ -91,7 +95,12 @@ def handle_resolve_insert():
         from app.core.database import db_manager
 
         resolve_insert_handler(
-            db_id, audio_manager, processor, get_resolve_client, db_manager
+            db_id,
+            audio_manager,
+            processor,
+            get_resolve_client,
+            db_manager,
+            audio_archiver,
         )
         return jsonify({"status": "ok"})
     except ValueError as e:
@@ -158,6 +167,32 @@ def handle_update_text():
         return jsonify({"status": "error", "message": str(e)}), 500
 
 
+@control_bp.route("/api/control/synthesize_batch", methods=["GET", "POST"])
+def handle_synthesize_batch():
+    if request.method == "GET":
+        status = processor.batch_synthesizer.get_status()
+        if status is None:
+            return jsonify({"status": "error", "message": "No batch has run"}), 404
+        return jsonify(BatchSynthesisResponse(**status).model_dump())
+
+    try:
+        req = BatchSynthesisRequest(**(request.get_json(silent=True) or {}))
+    except Exception:
+        return jsonify({"status": "error", "message": "Invalid ids"}), 400
+
+    try:
+        from app.core.database import db_manager
+
+        status = synthesize_batch_handler(req.ids, vv_client, processor, db_manager)
+        return jsonify(BatchSynthesisResponse(**status).model_dump())
+    except ConnectionError as e:
+        return jsonify({"status": "error", "message": str(e)}), 503
+    except RuntimeError as e:
+        return jsonify({"status": "error", "message": str(e)}), 409
+    except Exception as e:
+        return jsonify({"status": "error", "message": str(e)}), 500
+
+
 @control_bp.route("/api/system/browse", methods=["POST"])
 def browse_directory():
     try:
@@ -0,0 +1,63 @@
+"""
+API Implementation for History Domain.
+
+IMPORTANT:
+The implementation in this file must strictly follow the specifications
+documented in `docs/specification/api-server.md`.
+Please ensure any changes here are synchronized with the specification.
+"""
+
+from flask import Blueprint, request, jsonify, Response
+from pydantic import ValidationError
+from app.config import config
+from app.core.database import db_manager
+from app.web.routes import audio_manager
+from app.services.history_service import export_handler, get_phonemes_handler
+from app.api.schemas.history import ExportRequest, IdRangeRequest
+
+history_bp = Blueprint("history_api", __name__)
+
+
+def invalid_argument(message: str):
+    return (
+        jsonify(
+            {"status": "error", "error_code": "INVALID_ARGUMENT", "message": message}
+        ),
+        400,
+    )
+
+
+def handle_validation_error(e: ValidationError):
+    error = e.errors()[0]
+    field = error["loc"][0] if error["loc"] else "from/to"
+    return invalid_argument(f"{field}: {error['msg']}")
+
+
+@history_bp.route("/api/phonemes", methods=["GET"])
+def get_phonemes():
+    try:
+        req = IdRangeRequest(**request.args.to_dict())
+    except ValidationError as e:
+        return handle_validation_error(e)
+    return jsonify(get_phonemes_handler(req, db_manager).model_dump())
+
+
+@history_bp.route("/api/export", methods=["GET"])
+def export():
+    try:
+        req = ExportRequest(**request.args.to_dict())
+    except ValidationError as e:
+        return handle_validation_error(e)
+
+    try:
+        body, mimetype, length, filename = export_handler(
+            req, db_manager, audio_manager.get_output_dir(), config.synthesis
+        )
+    except ValueError as e:
+        return invalid_argument(str(e))
+
+    response = Response(body, mimetype=mimetype)
+    response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    if length is not None:
+        response.headers["Content-Length"] = str(length)
+    return response
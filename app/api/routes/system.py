@@ -9,8 +9,17 @@ Please ensure any changes here are synchronized with the specification.
 
 from flask import Blueprint, jsonify
 from app.config import config
-from app.web.routes import ffmpeg_client
-from app.services.system_service import get_audio_devices_handler, heartbeat_handler
+from app.web.routes import ffmpeg_client, audio_cache, audio_archiver, vv_client
+from app.core.events import event_manager
+from app.services.system_service import (
+    get_audio_devices_handler,
+    heartbeat_handler,
+    get_archive_stats_handler,
+    get_cache_stats_handler,
+    get_event_stats_handler,
+    get_voicevox_queue_stats_handler,
+    run_archive_handler,
+)
 
 system_bp = Blueprint("system_api", __name__)
 
@@ -27,3 +36,31 @@ def get_audio_devices():
 @system_bp.route("/api/heartbeat", methods=["GET"])
 def heartbeat():
     return jsonify(heartbeat_handler())
+
+
+@system_bp.route("/api/system/cache", methods=["GET"])
+def get_cache_stats():
+    return jsonify(get_cache_stats_handler(audio_cache).model_dump())
+
+
+@system_bp.route("/api/system/archive", methods=["GET"])
+def get_archive_stats():
+    return jsonify(get_archive_stats_handler(audio_archiver).model_dump())
+
+
+@system_bp.route("/api/system/archive", methods=["POST"])
+def run_archive():
+    try:
+        return jsonify(run_archive_handler(audio_archiver).model_dump())
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+
+@system_bp.route("/api/system/voicevox_queue", methods=["GET"])
+def get_voicevox_queue_stats():
+    return jsonify(get_voicevox_queue_stats_handler(vv_client).model_dump())
+
+
+@system_bp.route("/api/system/events", methods=["GET"])
+def get_event_stats():
+    return jsonify(get_event_stats_handler(event_manager).model_dump())
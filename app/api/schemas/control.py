@@ -40,6 +40,22 @@ class DeleteResponse(BaseResponse):
     deleted: List[str]
 
 
+class BatchSynthesisRequest(BaseModel):
+    # Omitted: every record that has no audio yet
+    ids: Optional[List[int]] = None
+
+
+class BatchSynthesisResponse(BaseResponse):
+    job_id: int
+    state: str  # running | done | cancelled
+    total: int
+    completed: int
+    cached: int
+    failed: int
+    failed_ids: List[int]
+    remaining: int
+
+
 class ControlStateRequest(BaseModel):
     enabled: bool
 
@@ -0,0 +1,43 @@
+"""
+API Schemas for History Domain.
+
+IMPORTANT:
+The definitions in this file must strictly follow the specifications
+documented in `docs/specification/api-server.md`.
+Please ensure any changes here are synchronized with the specification.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from typing import List, Literal
+from app.api.schemas.base import BaseResponse
+
+
+class IdRangeRequest(BaseModel):
+    """Inclusive ID range, given as the query parameters `from` and `to`."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    start_id: int = Field(alias="from")
+    end_id: int = Field(alias="to")
+
+    @model_validator(mode="after")
+    def check_order(self):
+        if self.end_id < self.start_id:
+            raise ValueError("to must not be smaller than from")
+        return self
+
+
+class ExportRequest(IdRangeRequest):
+    export_format: Literal["srt", "vtt", "wav"] = Field("srt", alias="format")
+
+
+class PhonemeTimelineEntry(BaseModel):
+    id: int
+    t: List[float]  # Start of each phoneme, seconds
+    p: List[str]
+
+
+class PhonemesResponse(BaseResponse):
+    timelines: List[PhonemeTimelineEntry]
+    # More records follow: request again from the last id + 1
+    truncated: bool
@@ -7,7 +7,8 @@ documented in `docs/specification/api-server.md`.
 Please ensure any changes here are synchronized with the specification.
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional
+from pydantic import BaseModel
 from app.api.schemas.base import BaseResponse
 
 
@@ -17,3 +18,64 @@ class DevicesResponse(BaseResponse):
 
 class BrowseResponse(BaseResponse):
     path: Optional[str] = None
+
+
+class CacheStatsResponse(BaseResponse):
+    enabled: bool
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    entries: int
+    total_bytes: int
+    shared_bytes: int
+    max_bytes: int
+
+
+class ArchiveRunStats(BaseModel):
+    started_at: float
+    duration_sec: float
+    archived: int
+    failed: int
+    original_bytes: int
+    archived_bytes: int
+    freed_bytes: int
+
+
+class ArchiveStatsResponse(BaseResponse):
+    enabled: bool
+    format: str
+    after_days: float
+    running: bool
+    archived_files: int
+    original_bytes: int
+    archived_bytes: int
+    freed_bytes: int
+    saved_bytes: int
+    ratio: float
+    pending_removal: int
+    last_run: Optional[ArchiveRunStats] = None
+
+
+class QueueClassStats(BaseModel):
+    queued: int
+    started: int
+    avg_wait_ms: float
+    max_wait_ms: float
+
+
+class VoiceVoxQueueStatsResponse(BaseResponse):
+    max_concurrency: int
+    active: int
+    max_queued: int
+    # interactive | live | background
+    classes: Dict[str, QueueClassStats]
+
+
+class EventStatsResponse(BaseResponse):
+    subscribers: int
+    published: int
+    coalesced: int
+    dropped: int
+    buffer_size: int
+    buffered: int
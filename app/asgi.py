@@ -0,0 +1,224 @@
+"""
+ASGI entry point for the optional asyncio serving mode (`server.mode = "asgi"`).
+
+`/api/stream` and the whisper receiver (`POST /`) run as coroutines, so open
+SSE tabs and long transcription uploads do not pin server threads. Every
+other route is handed to the Flask app unchanged through a small WSGI bridge
+that runs it on a worker thread, so both modes share the route contracts in
+`docs/specification/api-server.md`.
+"""
+
+import asyncio
+import io
+import sys
+from typing import Callable, Optional
+from urllib.parse import parse_qs
+
+from app.core.events import event_manager
+
+SSE_HEADERS = [
+    (b"content-type", b"text/event-stream; charset=utf-8"),
+    (b"cache-control", b"no-cache"),
+    (b"x-accel-buffering", b"no"),
+]
+
+
+def create_asgi_app(flask_app=None, on_request: Optional[Callable] = None):
+    """
+    Wraps the Flask app. `on_request` is called for every HTTP request
+    (the controller uses it for its inactivity watchdog).
+    """
+    if flask_app is None:
+        from app import create_app
+
+        flask_app = create_app()
+
+    async def app(scope, receive, send):
+        if scope["type"] == "lifespan":
+            await _lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+
+        if on_request is not None:
+            on_request()
+
+        path, method = scope["path"], scope["method"]
+        if path == "/api/stream" and method == "GET":
+            await _stream(scope, receive, send)
+        elif path == "/" and method == "POST":
+            await _whisper_receiver(receive, send)
+        else:
+            await _call_wsgi(flask_app, scope, receive, send)
+
+    return app
+
+
+async def _stream(scope, receive, send):
+    """Same contract as the Flask /api/stream route (ids, Last-Event-ID, resync)."""
+    last_event_id = _header(scope, b"last-event-id") or _query(scope, "lastEventId")
+    sub = event_manager.subscribe(last_event_id)
+    disconnected = asyncio.ensure_future(_wait_disconnect(receive))
+    try:
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": SSE_HEADERS}
+        )
+        while True:
+            frame = asyncio.ensure_future(sub.next_sse_async())
+            done, _ = await asyncio.wait(
+                {frame, disconnected}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if frame not in done:
+                frame.cancel()
+                break
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": frame.result().encode("utf-8"),
+                    "more_body": True,
+                }
+            )
+    finally:
+        disconnected.cancel()
+        event_manager.unsubscribe(sub)
+
+
+async def _whisper_receiver(receive, send):
+    from app.web.routes import processor
+
+    async def chunks():
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            yield message.get("body", b"")
+            if not message.get("more_body", False):
+                return
+
+    try:
+        await processor.process_stream_async(chunks())
+        status, body = 200, b"OK"
+    except Exception:
+        status, body = 500, b"Error"
+
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"text/html; charset=utf-8")],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _call_wsgi(flask_app, scope, receive, send):
+    """Runs one request through the WSGI app on a worker thread."""
+    body = bytearray()
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+        body += message.get("body", b"")
+        if not message.get("more_body", False):
+            break
+
+    environ = _build_environ(scope, bytes(body))
+    response = {}
+    written = []
+
+    def start_response(status, headers, exc_info=None):
+        response["status"] = int(status.split(" ", 1)[0])
+        response["headers"] = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers
+        ]
+        return written.append
+
+    result = await asyncio.to_thread(flask_app, environ, start_response)
+    try:
+        # Each chunk is produced on a worker thread and sent as soon as it is
+        # ready, so streamed responses (exports) are never held in memory
+        chunks = iter(result)
+        chunk = await asyncio.to_thread(next, chunks, None)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": response["status"],
+                "headers": response["headers"],
+            }
+        )
+        for data in written:
+            await send({"type": "http.response.body", "body": data, "more_body": True})
+        while chunk is not None:
+            if chunk:
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+            chunk = await asyncio.to_thread(next, chunks, None)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+    finally:
+        if hasattr(result, "close"):
+            await asyncio.to_thread(result.close)
+
+
+def _build_environ(scope, body: bytes) -> dict:
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("127.0.0.1", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", ""),
+        "PATH_INFO": scope["path"],
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": str(server[0]),
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    for name, value in scope.get("headers", []):
+        key = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if key == "CONTENT_TYPE":
+            environ["CONTENT_TYPE"] = value
+            continue
+        if key == "CONTENT_LENGTH":
+            continue
+        key = f"HTTP_{key}"
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def _wait_disconnect(receive):
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope.get("headers", []):
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _query(scope, name: str) -> Optional[str]:
+    values = parse_qs(scope.get("query_string", b"").decode("latin-1")).get(name)
+    return values[0] if values else None
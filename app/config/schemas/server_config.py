@@ -1,3 +1,4 @@
+from typing import Literal
 from pydantic import Field
 from .base import BaseConfigModel
 
@@ -5,3 +6,5 @@ from .base import BaseConfigModel
 class ServerConfig(BaseConfigModel):
     host: str = "127.0.0.1"
     port: int = Field(default=3000, ge=1, le=65535)
+    # "asgi" serves SSE and the whisper receiver as coroutines (needs uvicorn)
+    mode: Literal["threaded", "asgi"] = "threaded"
@@ -13,3 +13,18 @@ class SynthesisConfig(BaseConfigModel):
     post_phoneme_length: Annotated[float, Field(ge=0.0, le=1.5)] = 0.1
     pause_length_scale: Annotated[float, Field(ge=0.0, le=2.0)] = 1.0
     timing: str = "on_demand"  # immediate | on_demand
+    worker_count: Annotated[int, Field(ge=1, le=8)] = 2
+    queue_size: Annotated[int, Field(ge=1, le=500)] = 50
+    # Concurrent VOICEVOX requests of /api/control/synthesize_batch
+    batch_concurrency: Annotated[int, Field(ge=1, le=8)] = 2
+    # on_demand: newest pending records pre-synthesized while VOICEVOX is idle
+    prefetch_count: Annotated[int, Field(ge=0, le=20)] = 3
+    prefetch_duty_cycle: Annotated[float, Field(ge=0.05, le=1.0)] = 0.5
+    # Long texts are synthesized sentence by sentence (0 = whole text at once)
+    chunk_max_chars: Annotated[int, Field(ge=0, le=500)] = 40
+    # Format of the written WAV files (what Resolve imports)
+    output_sample_rate: Annotated[int, Field(ge=8000, le=192000)] = 48000
+    output_channels: Annotated[int, Field(ge=1, le=2)] = 2
+    # Request native-rate mono from VOICEVOX and convert to the output format
+    # in-process (less engine work and HTTP transfer)
+    local_resampling: bool = False
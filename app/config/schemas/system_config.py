@@ -1,10 +1,20 @@
 import os
-from pydantic import field_validator
+from pydantic import Field, field_validator
+from typing import Annotated, Literal
 from .base import BaseConfigModel
 
 
 class SystemConfig(BaseConfigModel):
     output_dir: str = ""
+    cache_max_mb: Annotated[int, Field(ge=0)] = 1024  # 0 disables the audio cache
+    # playback_progress SSE events per second, 0 disables them
+    playback_progress_hz: Annotated[float, Field(ge=0, le=60)] = 10.0
+    # Format the player converts audio to (0 = play as stored/synthesized)
+    playback_sample_rate: Annotated[int, Field(ge=0, le=192000)] = 0
+    playback_channels: Annotated[int, Field(ge=0, le=2)] = 0
+    # Transcode output WAVs older than this to archive_format (0 = never)
+    archive_after_days: Annotated[float, Field(ge=0)] = 0
+    archive_format: Literal["flac", "opus"] = "flac"
 
     @field_validator("output_dir")
     @classmethod
@@ -1,6 +1,10 @@
+from pydantic import Field
+from typing import Annotated
 from .base import BaseConfigModel
 
 
 class VoiceVoxConfig(BaseConfigModel):
     host: str = "127.0.0.1"
     port: int = 50021
+    # Requests in flight against the engine (see RequestScheduler)
+    max_concurrency: Annotated[int, Field(ge=1, le=8)] = 2
@@ -1,17 +1,27 @@
+import io
 import os
 import re
 import wave
 import queue
 import threading
 import time
-import sounddevice as sd
 import soundfile as sf
 from datetime import datetime
 
 from app.config.schemas import SystemConfig
+from app.core.playback import StreamPlayer
+from app.core.export import format_timestamp
+from app.core.resample import convert_wav
+from app.core.transcode import is_archived, read_as_wav
+from app.core.wav import parse_wav_header, read_wav_header
 
 
 class AudioManager:
+    # Close the output device after this long without queued audio
+    IDLE_CLOSE_SEC = 2.0
+    # How often the worker looks for the next item while one is playing
+    PRELOAD_POLL_SEC = 0.05
+
     def __init__(self, config: SystemConfig):
         self.config = config
         # We no longer set a fixed output_dir here.
@@ -24,9 +34,13 @@ class AudioManager:
             "duration": 0,
             "playback_id": None,
             "request_id": None,
+            "handle": None,
         }
         self.playback_lock = threading.Lock()
 
+        # Block-streaming output; the stream stays open across queued items
+        self.player = StreamPlayer()
+
         # Shutdown Flag
         self.shutdown_flag = threading.Event()
 
@@ -63,6 +77,11 @@ class AudioManager:
         return True
 
     def get_wav_duration(self, filepath: str) -> float:
+        # RIFF header only; libsndfile is the fallback for other formats
+        try:
+            return read_wav_header(filepath).duration
+        except (OSError, ValueError):
+            pass
         try:
             return sf.info(filepath).duration
         except Exception as e:
@@ -70,12 +89,7 @@ class AudioManager:
             return 0.0
 
     def format_srt_time(self, seconds: float) -> str:
-        millis = int((seconds - int(seconds)) * 1000)
-        seconds = int(seconds)
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        seconds = seconds % 60
-        return f"{hours:02}:{minutes:02}:{seconds:02},{millis:03}"
+        return format_timestamp(seconds)
 
     def save_audio(self, audio_data: bytes, filename: str) -> float:
         """Saves audio data to a WAV file with the specified filename."""
@@ -85,13 +99,19 @@ class AudioManager:
 
         wav_path = os.path.join(output_dir, filename)
 
-        # Write WAV
+        # Write WAV atomically. Replacing (instead of overwriting in place)
+        # also keeps hardlinked audio cache blobs intact.
         try:
-            with open(wav_path, "wb") as f:
+            tmp_path = f"{wav_path}.tmp"
+            with open(tmp_path, "wb") as f:
                 f.write(audio_data)
+            os.replace(tmp_path, wav_path)
 
-            # Calculate duration
-            actual_duration = self.get_wav_duration(wav_path)
+            # Duration from the in-memory RIFF header, no re-read
+            try:
+                actual_duration = parse_wav_header(audio_data).duration
+            except ValueError:
+                actual_duration = self.get_wav_duration(wav_path)
             duration = max(0.0, actual_duration)
 
             return duration
@@ -116,12 +136,37 @@ class AudioManager:
             raise FileNotFoundError(f"File not found: {filename}")
 
         duration = self.get_wav_duration(wav_path)
+        source = wav_path
+        if self._playback_format():
+            # Archived (FLAC/Opus) files are decoded to WAV for the conversion
+            source = io.BytesIO(self._to_playback_format(read_as_wav(wav_path)))
 
         # Enqueue the request
         self.play_queue.put(
             {
                 "filename": filename,
-                "path": wav_path,
+                "path": source,
+                "duration": duration,
+                "request_id": request_id,
+            }
+        )
+
+        return duration, time.time()
+
+    def play_data(self, audio_data: bytes, filename: str, request_id: str = None):
+        """
+        Enqueues in-memory WAV data, e.g. one chunk of a synthesis that is
+        still running. Consecutive items of one request play back to back
+        and are reported as a single playback.
+        """
+        if self.shutdown_flag.is_set():
+            raise RuntimeError("System is shutting down")
+
+        duration = parse_wav_header(audio_data).duration
+        self.play_queue.put(
+            {
+                "filename": filename,
+                "path": io.BytesIO(self._to_playback_format(audio_data)),
                 "duration": duration,
                 "request_id": request_id,
             }
@@ -129,16 +174,43 @@ class AudioManager:
 
         return duration, time.time()
 
+    def _playback_format(self) -> tuple:
+        """(sample_rate, channels) requested for playback; () plays as stored."""
+        rate = self.config.playback_sample_rate
+        channels = self.config.playback_channels
+        return (rate, channels) if rate or channels else ()
+
+    def _to_playback_format(self, audio_data: bytes) -> bytes:
+        playback_format = self._playback_format()
+        if not playback_format:
+            return audio_data
+        rate, channels = playback_format
+        info = parse_wav_header(audio_data)
+        try:
+            return convert_wav(
+                audio_data, rate or info.sample_rate, channels or info.channels
+            )
+        except ValueError as e:
+            print(f"[AudioManager] Playing unconverted audio: {e}")
+            return audio_data
+
     def _play_worker_loop(self):
         """
         Worker loop that processes the playback queue sequentially.
+        While an item plays, the next queued item is taken off the queue and
+        preloaded into the player so the two play back to back.
         """
         from app.core.events import event_manager
         import uuid
 
+        # Next item, dequeued early for preloading
+        pending = []
+        # Request whose next item follows without a gap (no end/start events)
+        continuing = None
+
         while True:
             # Block until an item is available
-            item = self.play_queue.get()
+            item = pending.pop() if pending else self._next_queue_item()
 
             # Check for Sentinel (Shutdown)
             if item is None:
@@ -178,22 +250,42 @@ class AudioManager:
                 self.playback_status["request_id"] = req_id
 
             # Notify Start
-            event_manager.publish(
-                "playback_change",
-                {"is_playing": True, "filename": filename, "request_id": req_id},
-            )
+            if not (req_id and req_id == continuing):
+                event_manager.publish(
+                    "playback_change",
+                    {"is_playing": True, "filename": filename, "request_id": req_id},
+                )
 
             try:
-                # Play
-                data, fs = sf.read(wav_path)
-                sd.play(data, fs)
-
-                # Wait for duration (blocking this thread is what we want for sequential playback)
-                # But use sd.wait() so we can interrupt it if needed via sd.stop()
-                sd.wait()
-
-                # Check directly if we need to stop (although sd.wait returns on stop())
-                sd.stop()
+                # A preloaded item is already playing (the player switched to it
+                # when the previous one ended). Start it here unless it was never
+                # reached, e.g. because stop_playback() dropped it.
+                handle = item.get("handle")
+                if handle is None or (handle.done and not handle.started):
+                    handle = self.player.play(wav_path)
+                with self.playback_lock:
+                    if self.playback_status.get("playback_id") == playback_id:
+                        self.playback_status["handle"] = handle
+                        self.playback_status["duration"] = handle.duration
+
+                # Blocking this thread is what we want for sequential playback.
+                # stop_playback()/shutdown() finish the item and end the wait.
+                interval = self._progress_interval()
+                next_progress = time.monotonic()
+                while True:
+                    timeout = self.PRELOAD_POLL_SEC
+                    if interval:
+                        now = time.monotonic()
+                        if now >= next_progress:
+                            self._publish_progress(
+                                event_manager, handle, filename, req_id
+                            )
+                            next_progress = max(next_progress + interval, now)
+                        timeout = min(timeout, next_progress - now)
+                    if handle.wait(timeout):
+                        break
+                    if not pending:
+                        pending.extend(self._preload_next())
             except Exception as e:
                 print(f"Play Worker Error: {e}")
             finally:
@@ -206,37 +298,103 @@ class AudioManager:
                         self.playback_status["filename"] = (
                             None  # Optional: keep last filename? No, clear it.
                         )
-
-                # Notify End
-                event_manager.publish(
-                    "playback_change",
-                    {"is_playing": False, "filename": None, "request_id": req_id},
-                )
+                        self.playback_status["handle"] = None
+
+                # Notify End, unless the next chunk of this request is lined up
+                following = pending[0] if pending else None
+                if (
+                    req_id
+                    and following is not None
+                    and following.get("request_id") == req_id
+                    and not self.shutdown_flag.is_set()
+                ):
+                    continuing = req_id
+                else:
+                    continuing = None
+                    event_manager.publish(
+                        "playback_change",
+                        {"is_playing": False, "filename": None, "request_id": req_id},
+                    )
 
                 self.play_queue.task_done()
 
+    def _progress_interval(self) -> float:
+        hz = self.config.playback_progress_hz
+        return 1.0 / hz if hz else 0.0
+
+    def _publish_progress(self, event_manager, handle, filename, request_id):
+        position = self.player.elapsed(handle)
+        event_manager.publish(
+            "playback_progress",
+            {
+                "filename": filename,
+                "request_id": request_id,
+                "position": round(position, 3),
+                "duration": round(handle.duration, 3),
+                "remaining": round(max(0.0, handle.duration - position), 3),
+            },
+        )
+
+    def _next_queue_item(self):
+        try:
+            return self.play_queue.get(timeout=self.IDLE_CLOSE_SEC)
+        except queue.Empty:
+            pass
+        # Nothing queued for a while: release the output device
+        if not self.player.is_active:
+            self.player.stop()
+        return self.play_queue.get()
+
+    def _preload_next(self) -> list:
+        """Takes the next queued item (if any) and preloads it behind the current one."""
+        try:
+            item = self.play_queue.get_nowait()
+        except queue.Empty:
+            return []
+
+        if item is not None and not self.shutdown_flag.is_set():
+            try:
+                item["handle"] = self.player.enqueue(item["path"])
+            except Exception as e:
+                # Played (or reported) normally when its turn comes
+                print(f"[AudioManager] Preload failed for {item['filename']}: {e}")
+        return [item]
+
+    def stop_playback(self):
+        """Stops the current item; the worker moves on to the next one."""
+        self.player.stop()
+
+    def pause_playback(self):
+        self.player.pause()
+
+    def resume_playback(self):
+        self.player.resume()
+
+    def seek_playback(self, seconds: float):
+        self.player.seek(seconds)
+
     def get_playback_status(self):
-        current_status = {}
+        """
+        Current playback. The position comes from the frames the output
+        stream has consumed, so it is exact regardless of polling jitter.
+        """
         with self.playback_lock:
             current_status = self.playback_status.copy()
 
-        remaining = 0
-        if current_status["is_playing"]:
-            elapsed = time.time() - current_status["start_time"]
-            remaining = max(0, current_status["duration"] - elapsed)
-            if remaining == 0:
-                with self.playback_lock:
-                    self.playback_status["is_playing"] = False
-                    self.playback_status["filename"] = None
+        handle = current_status["handle"]
+        is_playing = current_status["is_playing"]
+        position = self.player.elapsed(handle) if handle is not None else 0.0
+        duration = current_status["duration"]
 
         return {
-            "is_playing": current_status["is_playing"] and remaining > 0,
+            "is_playing": is_playing,
             "filename": current_status["filename"],
-            "remaining": remaining,
+            "position": position if is_playing else 0.0,
+            "remaining": max(0.0, duration - position) if is_playing else 0.0,
         }
 
     def delete_file(self, filename: str) -> bool:
-        """Deletes a WAV file from the output directory."""
+        """Deletes an audio file from the output directory."""
         output_dir = self.get_output_dir()
         wav_path = os.path.join(output_dir, filename)
 
@@ -254,7 +412,8 @@ class AudioManager:
 
     def scan_output_dir(self, limit: int = 50) -> list:
         """
-        Scans output directory for existing .wav files matching the naming convention.
+        Scans output directory for existing audio files (.wav, or archived
+        .flac/.opus) matching the naming convention.
         Returns a list of dictionaries with metadata.
         """
         output_dir = self.get_output_dir()
@@ -263,7 +422,11 @@ class AudioManager:
 
         # Get list of WAV files
         try:
-            files = [f for f in os.listdir(output_dir) if f.endswith(".wav")]
+            files = [
+                f
+                for f in os.listdir(output_dir)
+                if f.endswith(".wav") or is_archived(f)
+            ]
         except Exception as e:
             print(f"Error listing directory {output_dir}: {e}")
             return []
@@ -298,7 +461,7 @@ class AudioManager:
 
         # 1. Stop current playback immediately
         try:
-            sd.stop()
+            self.player.stop()
         except:
             pass
 
@@ -0,0 +1,236 @@
+import glob
+import os
+import re
+import shutil
+import threading
+import time
+from typing import Optional
+
+from app.config.schemas import SystemConfig
+from app.core.database import db_manager, CacheEntry
+
+
+class AudioCache:
+    """
+    Content-addressed store of synthesized WAVs.
+
+    Blobs live in `{output_dir}/.cache/{hash}.wav` and are keyed by the SHA-1
+    of the text and all synthesis parameters. Record files in the output
+    directory are hardlinks to the blobs (copies where hardlinks are not
+    supported), so deleting or re-creating a record never loses the audio
+    and identical requests skip VOICEVOX entirely.
+
+    Metadata (size, duration, kana, phonemes, last use) is kept in the
+    `audio_cache` table. A blob that is still linked from a record file
+    costs no extra disk space, and removing it would free none, so only
+    blobs held by the cache alone (link count 1, or copies) count towards
+    `SystemConfig.cache_max_mb`; those are evicted in LRU order.
+    """
+
+    CACHE_DIR_NAME = ".cache"
+
+    def __init__(self, config: SystemConfig, database=None):
+        self.config = config
+        self.database = database or db_manager
+        self._lock = threading.Lock()
+
+        # Session counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.config.output_dir) and self.config.cache_max_mb > 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self.config.cache_max_mb * 1024 * 1024
+
+    def get_cache_dir(self) -> str:
+        return os.path.join(self.config.output_dir, self.CACHE_DIR_NAME)
+
+    def _blob_path(self, content_hash: str) -> str:
+        return os.path.join(self.get_cache_dir(), f"{content_hash}.wav")
+
+    def lookup(self, content_hash: str) -> Optional[CacheEntry]:
+        """
+        Returns the cache entry if its blob is present. A miss is counted
+        here; the hit only once materialize() has reused the blob.
+        """
+        if not self.enabled:
+            return None
+
+        entry = self.database.get_cache_entry(content_hash)
+        if entry and not os.path.exists(self._blob_path(content_hash)):
+            # Blob removed behind our back, forget the stale metadata
+            self.database.delete_cache_entry(content_hash)
+            entry = None
+
+        if not entry:
+            with self._lock:
+                self.misses += 1
+        return entry
+
+    def materialize(self, content_hash: str, filename: str) -> bool:
+        """
+        Links (or copies) a cached blob to `filename` in the output directory.
+        Counts the hit and marks the entry as used; a failure counts as a
+        miss, since the record is synthesized after all.
+        """
+        target = os.path.join(self.config.output_dir, filename)
+        try:
+            self._link_or_copy(self._blob_path(content_hash), target)
+        except OSError as e:
+            print(f"[AudioCache] Failed to reuse {content_hash[:8]}: {e}")
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        self.database.touch_cache_entry(content_hash, time.time())
+        return True
+
+    def store(
+        self,
+        content_hash: str,
+        filename: str,
+        duration: float,
+        kana: Optional[str] = None,
+        phonemes: Optional[bytes] = None,
+    ):
+        """Adds a freshly synthesized output file to the cache and evicts if needed."""
+        if not self.enabled:
+            return
+
+        source = os.path.join(self.config.output_dir, filename)
+        blob = self._blob_path(content_hash)
+        try:
+            os.makedirs(self.get_cache_dir(), exist_ok=True)
+            self._link_or_copy(source, blob)
+            size = os.path.getsize(blob)
+        except OSError as e:
+            print(f"[AudioCache] Failed to store {filename}: {e}")
+            return
+
+        self.database.put_cache_entry(
+            CacheEntry(
+                hash=content_hash,
+                size=size,
+                duration=duration,
+                kana=kana,
+                phonemes=phonemes,
+                last_used=time.time(),
+            )
+        )
+        self.evict()
+
+    def _blob_usage(self) -> dict:
+        """hash -> (size, link count) of the blobs on disk."""
+        usage = {}
+        try:
+            with os.scandir(self.get_cache_dir()) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".wav"):
+                        stat = entry.stat()
+                        usage[entry.name[:-4]] = (stat.st_size, stat.st_nlink)
+        except FileNotFoundError:
+            pass
+        return usage
+
+    @staticmethod
+    def _split_usage(usage: dict) -> tuple:
+        """(bytes held only by the cache, bytes shared with record files)"""
+        own = sum(size for size, links in usage.values() if links == 1)
+        shared = sum(size for size, links in usage.values() if links > 1)
+        return own, shared
+
+    def evict(self):
+        """
+        Removes least recently used blobs until the bytes held only by the
+        cache fit in max_bytes. Blobs still linked from a record file are
+        skipped, as removing them would free nothing.
+        """
+        usage = self._blob_usage()
+        total, _ = self._split_usage(usage)
+        limit = self.max_bytes
+        skipped = 0
+        while total > limit:
+            candidates = self.database.get_lru_cache_entries(limit=50, offset=skipped)
+            if not candidates:
+                break
+            for entry in candidates:
+                if total <= limit:
+                    break
+                size, links = usage.get(entry.hash, (0, 0))
+                if links > 1:
+                    skipped += 1
+                    continue
+                try:
+                    os.remove(self._blob_path(entry.hash))
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    print(f"[AudioCache] Failed to evict {entry.hash[:8]}: {e}")
+                self.database.delete_cache_entry(entry.hash)
+                total -= size
+                with self._lock:
+                    self.evictions += 1
+
+    def release(self, filename: str) -> bool:
+        """
+        Drops the blob a record file is hardlinked to, so that removing the
+        record file (e.g. after archiving it) actually frees its data.
+        Returns True if a blob was dropped.
+        """
+        match = re.match(r"^\d+_([0-9a-f]{8})_", os.path.basename(filename))
+        if not match:
+            return False
+        target = os.path.join(self.config.output_dir, filename)
+        pattern = os.path.join(self.get_cache_dir(), f"{match.group(1)}*.wav")
+        for blob in glob.glob(pattern):
+            try:
+                if not os.path.samefile(blob, target):
+                    continue
+                os.remove(blob)
+            except OSError:
+                continue
+            self.database.delete_cache_entry(os.path.basename(blob)[:-4])
+            return True
+        return False
+
+    def get_stats(self) -> dict:
+        entries, _ = (
+            self.database.get_cache_usage() if self.config.output_dir else (0, 0)
+        )
+        total, shared = (
+            self._split_usage(self._blob_usage()) if self.config.output_dir else (0, 0)
+        )
+        with self._lock:
+            hits, misses, evictions = self.hits, self.misses, self.evictions
+        lookups = hits + misses
+        return {
+            "enabled": self.enabled,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": (hits / lookups) if lookups else 0.0,
+            "evictions": evictions,
+            "entries": entries,
+            "total_bytes": total,
+            "shared_bytes": shared,
+            "max_bytes": self.max_bytes,
+        }
+
+    @staticmethod
+    def _link_or_copy(source: str, target: str):
+        """Hardlinks source to target atomically, falling back to a copy."""
+        tmp = f"{target}.tmp"
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        try:
+            os.link(source, tmp)
+        except OSError:
+            # e.g. FAT/exFAT volumes without hardlink support
+            shutil.copyfile(source, tmp)
+        os.replace(tmp, target)
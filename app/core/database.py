@@ -1,10 +1,14 @@
 import sqlite3
 import os
 import json
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Callable, Optional, List, Dict, Any, Union
 from pydantic import BaseModel, Field
 from app.config.schemas import SystemConfig
+from app.core.phonemes import PhonemeTimeline
 
 
 class Transcription(BaseModel):
@@ -24,7 +28,8 @@ class Transcription(BaseModel):
     output_path: Optional[str] = None
     audio_duration: float = -1.0
     kana: Optional[str] = None
-    phonemes: Optional[str] = None
+    # PhonemeTimeline BLOB (JSON text in rows written by older versions)
+    phonemes: Optional[Union[bytes, str]] = None
 
     @classmethod
     def from_row(cls, row: Any):
@@ -38,12 +43,55 @@ class Transcription(BaseModel):
         return cls(**data)
 
 
+class CacheEntry(BaseModel):
+    """Metadata of a content-addressed audio blob (see AudioCache)."""
+
+    hash: str
+    size: int
+    duration: float
+    kana: Optional[str] = None
+    phonemes: Optional[Union[bytes, str]] = None
+    last_used: float = 0.0
+
+    @classmethod
+    def from_row(cls, row: Any):
+        return cls(**dict(row))
+
+
 class DatabaseManager:
+    # Maximum number of idle connections kept open per database path
+    POOL_SIZE = 4
+    # Per-connection prepared statement cache (sqlite3 reuses compiled SQL)
+    STATEMENT_CACHE_SIZE = 128
+    # Deferred writes arriving within this window share one transaction
+    WRITE_BATCH_WINDOW = 0.05  # seconds
+    WRITE_BATCH_MAX = 100
+
     def __init__(self, config: Optional[SystemConfig] = None):
         self.config = config
 
+        # Connection pool state
+        self._pool_lock = threading.Lock()
+        self._idle: List[sqlite3.Connection] = []
+        self._idle_path: Optional[str] = None
+        self._generation = 0
+        self._schema_ready = set()
+
+        # Write-behind batch: an open transaction on a checked-out connection
+        self._write_lock = threading.RLock()
+        self._batch = None  # (conn, generation, db_path)
+        self._batch_size = 0
+        self._batch_ids: List[int] = []  # transcriptions inserted by the batch
+        self._flush_timer: Optional[threading.Timer] = None
+        # db_path -> highest ID handed out by a rolled-back batch. The rollback
+        # also reverts sqlite_sequence, so the next batch raises it again.
+        self._id_floor: Dict[str, int] = {}
+        # Called with the IDs of a rolled-back batch (they never reach the DB)
+        self.on_rows_lost: Optional[Callable[[List[int]], None]] = None
+
     def set_config(self, config: SystemConfig):
         self.config = config
+        self.close_all_connections()
 
     def _get_db_path(self):
         """Get the database path based on the current output directory."""
@@ -55,6 +103,7 @@ class DatabaseManager:
         return os.path.join(output_dir, "transcriptions.db")
 
     def _get_connection(self):
+        """Opens a new configured connection. Schema setup runs once per path."""
         db_path = self._get_db_path()
         if db_path is None:
             return None
@@ -67,7 +116,12 @@ class DatabaseManager:
                 print(f"[Database] Failed to create directory {db_dir}: {e}")
                 return None
 
-        conn = sqlite3.connect(db_path)
+        is_new_file = not os.path.exists(db_path)
+        conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,  # Pooled connections move between threads
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
         conn.row_factory = sqlite3.Row
 
         try:
@@ -79,9 +133,221 @@ class DatabaseManager:
         except Exception as e:
             print(f"[Database] Optimization PRAGMAs failed: {e}")
 
-        self._init_db_conn(conn)
+        with self._pool_lock:
+            if is_new_file or db_path not in self._schema_ready:
+                self._init_db_conn(conn)
+                self._schema_ready.add(db_path)
         return conn
 
+    def _acquire(self):
+        """
+        Checks out a pooled connection for the current database path.
+        Returns (conn, generation); conn is None if no output_dir is set.
+        """
+        db_path = self._get_db_path()
+        if db_path is None:
+            return None, self._generation
+
+        stale = []
+        conn = None
+        with self._pool_lock:
+            if self._idle_path != db_path:
+                # output_dir changed: drop idle connections to the old database
+                stale = self._idle
+                self._idle = []
+                self._idle_path = db_path
+            while self._idle and conn is None:
+                candidate = self._idle.pop()
+                try:
+                    candidate.total_changes  # Raises if closed elsewhere
+                    conn = candidate
+                except sqlite3.ProgrammingError:
+                    pass
+            generation = self._generation
+
+        for c in stale:
+            self._close_quietly(c)
+
+        if conn is None:
+            conn = self._get_connection()
+        return conn, generation
+
+    def _release(self, conn, generation: int):
+        """Returns a connection to the pool, or closes it if it became stale."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._close_quietly(conn)
+            return
+
+        db_path = self._get_db_path()
+        with self._pool_lock:
+            if (
+                generation == self._generation
+                and db_path == self._idle_path
+                and len(self._idle) < self.POOL_SIZE
+            ):
+                self._idle.append(conn)
+                return
+        self._close_quietly(conn)
+
+    @contextmanager
+    def _connection(self):
+        """Context manager yielding a pooled connection (or None)."""
+        conn, generation = self._acquire()
+        if conn is None:
+            yield None
+            return
+        try:
+            yield conn
+        finally:
+            self._release(conn, generation)
+
+    @contextmanager
+    def _reader(self):
+        """
+        Connection for reads that must see deferred writes. While a batch is
+        open, the read goes through its connection, where the uncommitted
+        rows are visible, instead of committing the batch early.
+        """
+        with self._write_lock:
+            if self._batch is not None and self._batch[2] == self._get_db_path():
+                yield self._batch[0]
+                return
+        with self._connection() as conn:
+            yield conn
+
+    def _write(
+        self, sql: str, params: tuple, defer: bool = False, new_row: bool = False
+    ):
+        """
+        Executes a write statement and returns its cursor (None without output_dir).
+
+        Deferred writes stay in an open transaction that is committed after
+        WRITE_BATCH_WINDOW (or WRITE_BATCH_MAX statements), so bursts of
+        inserts/updates pay for a single commit. Non-deferred writes commit
+        immediately, together with anything pending, preserving order;
+        sqlite3.Error is raised if that commit fails (the batch is rolled back).
+        `new_row` marks an insert into transcriptions whose ID is reported to
+        on_rows_lost if the batch is rolled back.
+        """
+        with self._write_lock:
+            db_path = self._get_db_path()
+            if self._batch and self._batch[2] != db_path:
+                # output_dir changed: pending writes belong to the old database
+                try:
+                    self._flush_locked()
+                except sqlite3.Error:
+                    pass  # Rolled back and logged; unrelated to this write
+
+            if self._batch is None:
+                conn, generation = self._acquire()
+                if conn is None:
+                    return None
+                self._batch = (conn, generation, db_path)
+                self._raise_id_floor(conn, db_path)
+
+            cursor = self._batch[0].execute(sql, params)
+            self._batch_size += 1
+            if new_row:
+                self._batch_ids.append(cursor.lastrowid)
+
+            if not defer or self._batch_size >= self.WRITE_BATCH_MAX:
+                self._flush_locked()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(
+                    self.WRITE_BATCH_WINDOW, self._flush_deferred
+                )
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+            return cursor
+
+    def flush(self):
+        """
+        Commits pending deferred writes. If the commit fails, the whole batch
+        is rolled back, its inserted IDs are reported to on_rows_lost and the
+        sqlite3.Error is raised.
+        """
+        with self._write_lock:
+            self._flush_locked()
+
+    def _flush_deferred(self):
+        # Batch window timer: no caller is waiting, the failure is logged
+        try:
+            self.flush()
+        except sqlite3.Error:
+            pass
+
+    def _flush_locked(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._batch is None:
+            return
+
+        conn, generation, db_path = self._batch
+        count = self._batch_size
+        lost_ids = self._batch_ids
+        self._batch = None
+        self._batch_size = 0
+        self._batch_ids = []
+        try:
+            conn.commit()
+            self._id_floor.pop(db_path, None)
+        except sqlite3.Error as e:
+            # IDs handed out for these rows are void: do not leave them half-applied
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            print(
+                f"[Database] Failed to commit {count} batched writes, rolled back: {e}"
+            )
+            if lost_ids:
+                self._id_floor[db_path] = max(self._id_floor.get(db_path, 0), *lost_ids)
+                self._report_lost(lost_ids)
+            raise
+        finally:
+            self._release(conn, generation)
+
+    def _raise_id_floor(self, conn, db_path: str):
+        """
+        Keeps IDs of a rolled-back batch from being handed out again, so stale
+        references to them (hot window, queued synthesis) never hit a new row.
+        Runs inside the new batch and is dropped once that batch commits.
+        """
+        floor = self._id_floor.get(db_path)
+        if floor is None:
+            return
+        conn.execute(
+            "UPDATE sqlite_sequence SET seq = ? WHERE name = 'transcriptions' AND seq < ?",
+            (floor, floor),
+        )
+        conn.execute(
+            """
+                INSERT INTO sqlite_sequence (name, seq)
+                SELECT 'transcriptions', ?
+                WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'transcriptions')
+            """,
+            (floor,),
+        )
+
+    def _report_lost(self, lost_ids: List[int]):
+        if self.on_rows_lost is None:
+            return
+        try:
+            self.on_rows_lost(lost_ids)
+        except Exception as e:
+            print(f"[Database] Failed to report lost IDs {lost_ids}: {e}")
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
     def _init_db_conn(self, conn):
         """Initialize the database schema and handle migrations."""
         conn.execute(
@@ -103,7 +369,7 @@ class DatabaseManager:
                 output_path TEXT,
                 audio_duration REAL DEFAULT -1.0,
                 kana TEXT,
-                phonemes TEXT
+                phonemes BLOB
             )
         """
         )
@@ -115,7 +381,7 @@ class DatabaseManager:
             ("speaker_name", "TEXT"),
             ("speaker_style", "TEXT"),
             ("kana", "TEXT"),
-            ("phonemes", "TEXT"),
+            ("phonemes", "BLOB"),
             ("pause_length_scale", "REAL DEFAULT 1.0"),
         ]
 
@@ -126,8 +392,88 @@ class DatabaseManager:
                     f"ALTER TABLE transcriptions ADD COLUMN {col_name} {col_type}"
                 )
 
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS audio_cache (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                duration REAL NOT NULL,
+                kana TEXT,
+                phonemes BLOB,
+                last_used REAL NOT NULL
+            )
+        """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_audio_cache_last_used ON audio_cache(last_used)"
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS audio_archive (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL,
+                format TEXT NOT NULL,
+                original_size INTEGER NOT NULL,
+                archived_size INTEGER NOT NULL,
+                archived_at REAL NOT NULL,
+                freed_size INTEGER NOT NULL DEFAULT 0
+            )
+        """
+        )
+        cursor = conn.execute("PRAGMA table_info(audio_archive)")
+        if "freed_size" not in [row["name"] for row in cursor.fetchall()]:
+            print("[Database] Migrating: Adding 'freed_size' column to audio_archive")
+            conn.execute(
+                "ALTER TABLE audio_archive ADD COLUMN freed_size INTEGER NOT NULL DEFAULT 0"
+            )
+        self._convert_json_phonemes(conn)
+
         conn.commit()
 
+    def _convert_json_phonemes(self, conn):
+        """
+        Rewrites phoneme timelines stored as JSON text (older versions) as BLOBs.
+        Rows with phonemes the BLOB format has no ID for keep their JSON
+        (still readable, and converted once PHONEMES gains those names);
+        unreadable rows are cleared. Both are logged row by row.
+        """
+        for table, key in (("transcriptions", "id"), ("audio_cache", "hash")):
+            rows = conn.execute(
+                f"SELECT {key} AS key, phonemes FROM {table} WHERE typeof(phonemes) = 'text'"
+            ).fetchall()
+            updates = []
+            for row in rows:
+                try:
+                    items = json.loads(row["phonemes"])
+                except ValueError as e:
+                    print(
+                        f"[Database] Migrating: Clearing unreadable phonemes of {table} {row['key']}: {e}"
+                    )
+                    updates.append((None, row["key"]))
+                    continue
+                try:
+                    timeline = PhonemeTimeline.from_list(items, strict=True)
+                except ValueError as e:
+                    print(
+                        f"[Database] Migrating: Keeping JSON phonemes of {table} {row['key']}: {e}"
+                    )
+                    continue
+                except (KeyError, TypeError) as e:
+                    print(
+                        f"[Database] Migrating: Clearing unreadable phonemes of {table} {row['key']}: {e!r}"
+                    )
+                    updates.append((None, row["key"]))
+                    continue
+                updates.append((timeline.to_bytes(), row["key"]))
+            if not updates:
+                continue
+            print(
+                f"[Database] Migrating: Rewrote {len(updates)} phoneme timelines in '{table}'"
+            )
+            conn.executemany(
+                f"UPDATE {table} SET phonemes = ? WHERE {key} = ?", updates
+            )
+
     def add_transcription(
         self,
         t: Any = None,
@@ -153,12 +499,8 @@ class DatabaseManager:
                 **kwargs,
             )
 
-        conn = self._get_connection()
-        if not conn:
-            return 0
-        try:
-            cursor = conn.execute(
-                """
+        cursor = self._write(
+            """
                 INSERT INTO transcriptions (
                     text, speaker_id, speaker_name, speaker_style,
                     speed_scale, pitch_scale, intonation_scale, volume_scale,
@@ -166,29 +508,30 @@ class DatabaseManager:
                     output_path, audio_duration, kana, phonemes
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-                (
-                    t.text,
-                    t.speaker_id,
-                    t.speaker_name,
-                    t.speaker_style,
-                    t.speed_scale,
-                    t.pitch_scale,
-                    t.intonation_scale,
-                    t.volume_scale,
-                    t.pre_phoneme_length,
-                    t.post_phoneme_length,
-                    t.pause_length_scale,
-                    t.output_path,
-                    t.audio_duration,
-                    t.kana,
-                    t.phonemes,
-                ),
-            )
-            conn.commit()
-            t.id = cursor.lastrowid
-            return t.id
-        finally:
-            conn.close()
+            (
+                t.text,
+                t.speaker_id,
+                t.speaker_name,
+                t.speaker_style,
+                t.speed_scale,
+                t.pitch_scale,
+                t.intonation_scale,
+                t.volume_scale,
+                t.pre_phoneme_length,
+                t.post_phoneme_length,
+                t.pause_length_scale,
+                t.output_path,
+                t.audio_duration,
+                t.kana,
+                t.phonemes,
+            ),
+            defer=True,
+            new_row=True,
+        )
+        if cursor is None:
+            return 0
+        t.id = cursor.lastrowid
+        return t.id
 
     def update_audio_info(
         self,
@@ -199,47 +542,106 @@ class DatabaseManager:
         phonemes: Optional[str] = None,
     ):
         """Updates audio file information."""
-        conn = self._get_connection()
-        if not conn:
-            return
-        try:
-            conn.execute(
-                """
+        self._write(
+            """
                 UPDATE transcriptions
                 SET output_path = ?, audio_duration = ?, kana = COALESCE(?, kana), phonemes = COALESCE(?, phonemes)
                 WHERE id = ?
             """,
-                (output_path, audio_duration, kana, phonemes, db_id),
+            (output_path, audio_duration, kana, phonemes, db_id),
+            defer=True,
+        )
+
+    def get_recent_logs(
+        self, limit: int = 50, before_id: Optional[int] = None
+    ) -> List[Transcription]:
+        """
+        Retrieves recent transcriptions (newest first) as a list of models.
+        With before_id, returns the page of records older than that ID
+        (keyset pagination on the primary key).
+        """
+        with self._reader() as conn:
+            if not conn:
+                return []
+            if before_id is None:
+                cursor = conn.execute(
+                    "SELECT * FROM transcriptions ORDER BY id DESC LIMIT ?", (limit,)
+                )
+            else:
+                cursor = conn.execute(
+                    "SELECT * FROM transcriptions WHERE id < ? ORDER BY id DESC LIMIT ?",
+                    (before_id, limit),
+                )
+            return [Transcription.from_row(row) for row in cursor.fetchall()]
+
+    def get_pending_ids(
+        self, limit: Optional[int] = None, newest_first: bool = False
+    ) -> List[int]:
+        """IDs of records that have no audio yet (oldest first by default)."""
+        order = "DESC" if newest_first else "ASC"
+        with self._reader() as conn:
+            if not conn:
+                return []
+            cursor = conn.execute(
+                f"SELECT id FROM transcriptions WHERE audio_duration <= 0 ORDER BY id {order} LIMIT ?",
+                (-1 if limit is None else limit,),
             )
-            conn.commit()
-        finally:
-            conn.close()
+            return [row["id"] for row in cursor.fetchall()]
 
-    def get_recent_logs(self, limit: int = 50) -> List[Transcription]:
-        """Retrieves recent transcriptions as a list of models."""
-        conn = self._get_connection()
-        if not conn:
-            return []
-        try:
+    def get_phonemes_range(self, start_id: int, end_id: int, limit: int) -> List[tuple]:
+        """(id, phonemes) of records in [start_id, end_id] that have a timeline."""
+        with self._reader() as conn:
+            if not conn:
+                return []
             cursor = conn.execute(
-                "SELECT * FROM transcriptions ORDER BY id DESC LIMIT ?", (limit,)
+                "SELECT id, phonemes FROM transcriptions WHERE id BETWEEN ? AND ? AND phonemes IS NOT NULL ORDER BY id LIMIT ?",
+                (start_id, end_id, limit),
             )
-            return [Transcription.from_row(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+            return [(row["id"], row["phonemes"]) for row in cursor.fetchall()]
+
+    def get_export_rows(
+        self, start_id: int, end_id: int, after_id: int, limit: int
+    ) -> List[tuple]:
+        """
+        (id, text, output_path, audio_duration, phonemes) of generated records
+        in [start_id, end_id] after `after_id` (keyset pagination).
+        """
+        with self._reader() as conn:
+            if not conn:
+                return []
+            cursor = conn.execute(
+                """
+                    SELECT id, text, output_path, audio_duration, phonemes FROM transcriptions
+                    WHERE id BETWEEN ? AND ? AND id > ? AND audio_duration > 0 AND output_path IS NOT NULL
+                    ORDER BY id LIMIT ?
+                """,
+                (start_id, end_id, after_id, limit),
+            )
+            return [tuple(row) for row in cursor.fetchall()]
+
+    def get_export_frames(self, start_id: int, end_id: int, sample_rate: int) -> int:
+        """Total length in frames of the records get_export_rows() returns."""
+        with self._reader() as conn:
+            if not conn:
+                return 0
+            row = conn.execute(
+                """
+                    SELECT COALESCE(SUM(CAST(audio_duration * ? + 0.5 AS INTEGER)), 0) FROM transcriptions
+                    WHERE id BETWEEN ? AND ? AND audio_duration > 0 AND output_path IS NOT NULL
+                """,
+                (sample_rate, start_id, end_id),
+            ).fetchone()
+            return row[0]
 
     def get_transcription(self, db_id: int) -> Optional[Transcription]:
         """Retrieves a single transcription by ID."""
-        conn = self._get_connection()
-        if not conn:
-            return None
-        try:
+        with self._reader() as conn:
+            if not conn:
+                return None
             cursor = conn.execute("SELECT * FROM transcriptions WHERE id = ?", (db_id,))
             row = cursor.fetchone()
             if row:
                 return Transcription.from_row(row)
-        finally:
-            conn.close()
         return None
 
     def update_transcription_text(
@@ -250,34 +652,180 @@ class DatabaseManager:
         phonemes: Optional[str] = None,
     ):
         """Updates text and resets audio/derived attributes."""
-        conn = self._get_connection()
-        if not conn:
-            return
-        try:
-            conn.execute(
-                """
+        self._write(
+            """
                 UPDATE transcriptions
                 SET text = ?, output_path = NULL, audio_duration = -1.0, kana = ?, phonemes = ?
                 WHERE id = ?
             """,
-                (new_text, kana, phonemes, db_id),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+            (new_text, kana, phonemes, db_id),
+        )
 
     def delete_log(self, db_id: int):
-        conn = self._get_connection()
-        if not conn:
-            return
-        try:
-            conn.execute("DELETE FROM transcriptions WHERE id = ?", (db_id,))
-            conn.commit()
-        finally:
-            conn.close()
+        self._write("DELETE FROM transcriptions WHERE id = ?", (db_id,))
+
+    def get_archive_candidates(
+        self, older_than_sec: float, after_id: int, limit: int
+    ) -> List[tuple]:
+        """(id, output_path) of generated WAV records older than `older_than_sec`."""
+        with self._reader() as conn:
+            if not conn:
+                return []
+            cursor = conn.execute(
+                """
+                    SELECT id, output_path FROM transcriptions
+                    WHERE id > ? AND audio_duration > 0 AND output_path LIKE '%.wav'
+                    AND timestamp <= datetime('now', ?)
+                    ORDER BY id LIMIT ?
+                """,
+                (after_id, f"-{int(older_than_sec)} seconds", limit),
+            )
+            return [(row["id"], row["output_path"]) for row in cursor.fetchall()]
+
+    def replace_output_path(self, db_id: int, old_path: str, new_path: str) -> bool:
+        """
+        Points a record at a moved audio file, only if it still refers to
+        `old_path` (not re-synthesized or deleted meanwhile).
+        """
+        cursor = self._write(
+            "UPDATE transcriptions SET output_path = ? WHERE id = ? AND output_path = ?",
+            (new_path, db_id, old_path),
+        )
+        return cursor is not None and cursor.rowcount == 1
+
+    def record_archive(
+        self,
+        db_id: int,
+        path: str,
+        archive_format: str,
+        original_size: int,
+        archived_size: int,
+        freed_size: int = 0,
+    ):
+        """
+        Stores the sizes of an archived file for the savings report.
+        `freed_size` is the disk space the removal of the WAV gave back
+        (0 while other hardlinks keep its data).
+        """
+        self._write(
+            """
+                INSERT OR REPLACE INTO audio_archive (id, path, format, original_size, archived_size, archived_at, freed_size)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                db_id,
+                path,
+                archive_format,
+                original_size,
+                archived_size,
+                time.time(),
+                freed_size,
+            ),
+        )
+
+    def add_archive_freed(self, db_id: int, freed_size: int):
+        """Counts a WAV whose removal was retried later as freed."""
+        self._write(
+            "UPDATE audio_archive SET freed_size = freed_size + ? WHERE id = ?",
+            (freed_size, db_id),
+        )
+
+    def get_archive_totals(self) -> tuple:
+        """
+        Returns (file count, original bytes, archived bytes, freed bytes) of
+        the archived files records currently point at (restored,
+        re-synthesized and deleted records no longer count).
+        """
+        with self._reader() as conn:
+            if not conn:
+                return 0, 0, 0, 0
+            row = conn.execute(
+                """
+                    SELECT COUNT(*), COALESCE(SUM(a.original_size), 0), COALESCE(SUM(a.archived_size), 0),
+                    COALESCE(SUM(a.freed_size), 0)
+                    FROM audio_archive a JOIN transcriptions t ON t.id = a.id AND t.output_path = a.path
+                """
+            ).fetchone()
+            return row[0], row[1], row[2], row[3]
+
+    def get_cache_entry(self, content_hash: str) -> Optional[CacheEntry]:
+        """Retrieves audio cache metadata by content hash."""
+        with self._reader() as conn:
+            if not conn:
+                return None
+            row = conn.execute(
+                "SELECT * FROM audio_cache WHERE hash = ?", (content_hash,)
+            ).fetchone()
+            if row:
+                return CacheEntry.from_row(row)
+        return None
+
+    def put_cache_entry(self, entry: CacheEntry):
+        """Inserts or replaces audio cache metadata."""
+        self._write(
+            """
+                INSERT OR REPLACE INTO audio_cache (hash, size, duration, kana, phonemes, last_used)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                entry.hash,
+                entry.size,
+                entry.duration,
+                entry.kana,
+                entry.phonemes,
+                entry.last_used,
+            ),
+        )
+
+    def touch_cache_entry(self, content_hash: str, last_used: float):
+        """Marks a cache entry as recently used (LRU order)."""
+        self._write(
+            "UPDATE audio_cache SET last_used = ? WHERE hash = ?",
+            (last_used, content_hash),
+        )
+
+    def delete_cache_entry(self, content_hash: str):
+        self._write("DELETE FROM audio_cache WHERE hash = ?", (content_hash,))
+
+    def get_cache_usage(self) -> tuple:
+        """Returns (entry count, total bytes) of the audio cache."""
+        with self._reader() as conn:
+            if not conn:
+                return 0, 0
+            row = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM audio_cache"
+            ).fetchone()
+            return row[0], row[1]
+
+    def get_lru_cache_entries(
+        self, limit: int = 50, offset: int = 0
+    ) -> List[CacheEntry]:
+        """Returns the least recently used cache entries first."""
+        with self._reader() as conn:
+            if not conn:
+                return []
+            cursor = conn.execute(
+                "SELECT * FROM audio_cache ORDER BY last_used ASC LIMIT ? OFFSET ?",
+                (limit, offset),
+            )
+            return [CacheEntry.from_row(row) for row in cursor.fetchall()]
 
     def close_all_connections(self):
-        pass
+        """
+        Commits pending writes and closes pooled connections.
+        In-use ones are closed when released.
+        """
+        try:
+            self.flush()
+        except sqlite3.Error:
+            pass  # Rolled back and logged
+        with self._pool_lock:
+            idle = self._idle
+            self._idle = []
+            self._idle_path = None
+            self._generation += 1
+        for conn in idle:
+            self._close_quietly(conn)
 
 
 db_manager = DatabaseManager()
@@ -1,42 +1,199 @@
+import asyncio
 import queue
 import json
 import threading
 import time
+from typing import Optional
+
+
+class Event:
+    """A published event, encoded once and shared by every subscriber."""
+
+    __slots__ = ("seq", "event_type", "key", "frame", "superseded")
+
+    def __init__(self, seq: int, event_type: str, key: Optional[str], frame: str):
+        self.seq = seq
+        self.event_type = event_type
+        self.key = key
+        self.frame = frame
+        # Set when a newer event with the same key is published
+        self.superseded = False
+
+
+class Subscription:
+    """A subscriber's read cursor into the EventManager ring buffer."""
+
+    def __init__(
+        self, manager: "EventManager", cursor: int, resumed: bool, resync: bool
+    ):
+        self._manager = manager
+        self.cursor = cursor
+        # True if subscribe() could continue from the given Last-Event-ID
+        self.resumed = resumed
+        self.dropped = 0
+        self._resync = resync
+
+    def next_event(self, timeout: Optional[float] = None) -> Event:
+        """Blocks for the next event. Raises queue.Empty on timeout."""
+        return self._manager._read(self, timeout)
+
+    async def next_event_async(self) -> Event:
+        """Awaits the next event without blocking the event loop."""
+        return await self._manager._read_async(self)
+
+    def get(self, timeout: Optional[float] = None) -> str:
+        """Blocks for the next encoded SSE frame. Raises queue.Empty on timeout."""
+        return self.next_event(timeout).frame
+
+    def next_sse(self, timeout: Optional[float] = None) -> str:
+        """
+        Wire text for /api/stream: the next frame with its `id:` field,
+        preceded by a `resync` frame when the client missed events that can
+        no longer be replayed.
+        """
+        if self._resync:
+            self._resync = False
+            return EventManager.RESYNC_FRAME
+        dropped = self.dropped
+        return self._wire(self.next_event(timeout), dropped)
+
+    async def next_sse_async(self) -> str:
+        if self._resync:
+            self._resync = False
+            return EventManager.RESYNC_FRAME
+        dropped = self.dropped
+        return self._wire(await self.next_event_async(), dropped)
+
+    def _wire(self, event: Event, dropped_before: int) -> str:
+        frame = self._manager.sse_frame(event)
+        if self.dropped != dropped_before:
+            return EventManager.RESYNC_FRAME + frame
+        return frame
 
 
 class EventManager:
+    """
+    SSE event bus.
+
+    Published events are JSON-encoded once and stored in a single ring
+    buffer; each subscriber only holds a cursor into it, so fan-out does not
+    copy messages per listener. A subscriber that falls more than
+    `BUFFER_SIZE` events behind skips ahead and the skipped events are
+    counted as dropped.
+
+    State snapshots (`COALESCE_TYPES`) are coalesced: publishing one marks
+    the previous event of the same type as superseded, and subscribers that
+    have not read it yet only receive the latest.
+    """
+
+    BUFFER_SIZE = 1024
+    # Sent instead of a replay when missed events are no longer buffered
+    RESYNC_FRAME = 'data: {"type": "resync", "data": {}}\n\n'
+    # Events that carry the full current state; only the latest matters
+    COALESCE_TYPES = frozenset(
+        {
+            "config_update",
+            "state_update",
+            "resolve_status",
+            "voicevox_status",
+            "playback_progress",
+            "synthesis_batch_progress",
+            "ping",
+        }
+    )
+
     def __init__(self):
-        self.listeners = []
         self.lock = threading.Lock()
+        self._cond = threading.Condition(self.lock)
         self.has_had_listeners = False
 
-    def subscribe(self):
-        """Register a new listener queue."""
-        q = queue.Queue(maxsize=500)  # Increased buffer to prevent dropped events
+        self._ring = [None] * self.BUFFER_SIZE
+        self._next_seq = 1
+        self._latest = {}
+        self._subscribers = set()
+
+        # Event ids are "{epoch}-{seq}" so ids from a previous server run
+        # are never mistaken for ids of this one
+        self._epoch = str(int(time.time() * 1000))
+
+        self._published = 0
+        self._coalesced = 0
+        self._dropped = 0
+
+        # One wake-up future per event loop with async subscribers
+        self._loop_waiters = {}
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Subscription:
+        """
+        Registers a new subscriber. With `last_event_id` (an id previously
+        delivered by this server run), reading resumes right after it as long
+        as it is still in the buffer; otherwise only new events are read.
+        """
         with self.lock:
-            self.listeners.append(q)
+            seq = self._parse_event_id(last_event_id)
+            resumed = seq is not None and seq + 1 >= self._oldest_seq()
+            cursor = seq + 1 if resumed else self._next_seq
+            sub = Subscription(
+                self, cursor, resumed, bool(last_event_id) and not resumed
+            )
+            self._subscribers.add(sub)
             self.has_had_listeners = True
-        return q
+        return sub
 
-    def unsubscribe(self, q):
-        """Remove a listener queue."""
+    def unsubscribe(self, sub: Subscription):
+        """Remove a subscriber."""
         with self.lock:
-            if q in self.listeners:
-                self.listeners.remove(q)
+            self._subscribers.discard(sub)
 
     def publish(self, event_type: str, data: dict = None):
         """Broadcast event to all listeners."""
         msg = {"type": event_type, "data": data or {}}
         encoded = f"data: {json.dumps(msg)}\n\n"
+        key = event_type if event_type in self.COALESCE_TYPES else None
 
-        with self.lock:
-            active_listeners = list(self.listeners)
+        with self._cond:
+            seq = self._next_seq
+            self._next_seq += 1
+
+            event = Event(seq, event_type, key, encoded)
+            self._ring[seq % self.BUFFER_SIZE] = event
+            self._published += 1
+
+            if key is not None:
+                previous = self._latest.get(key)
+                if previous is not None:
+                    previous.superseded = True
+                self._latest[key] = event
+
+            self._cond.notify_all()
+            loops = list(self._loop_waiters)
 
-        for q in active_listeners:
+        # A single cross-thread call per loop, however many subscribers it has
+        for loop in loops:
             try:
-                q.put_nowait(encoded)
-            except queue.Full:
-                pass
+                loop.call_soon_threadsafe(self._wake_loop, loop)
+            except RuntimeError:
+                # Loop closed
+                with self.lock:
+                    self._loop_waiters.pop(loop, None)
+
+    def event_id(self, event: Event) -> str:
+        return f"{self._epoch}-{event.seq}"
+
+    def sse_frame(self, event: Event) -> str:
+        """The event's frame with its `id:` field, as sent on /api/stream."""
+        return f"id: {self.event_id(event)}\n{event.frame}"
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "published": self._published,
+                "coalesced": self._coalesced,
+                "dropped": self._dropped,
+                "buffer_size": self.BUFFER_SIZE,
+                "buffered": self._next_seq - self._oldest_seq(),
+            }
 
     def publish_server_restart(self):
         """Specifically published on server startup to notify existing tabs to reload."""
@@ -55,6 +212,78 @@ class EventManager:
         t = threading.Thread(target=loop, daemon=True)
         t.start()
 
+    # --- Internal (call with the lock held unless noted) ---
+
+    def _oldest_seq(self) -> int:
+        return max(1, self._next_seq - self.BUFFER_SIZE)
+
+    def _parse_event_id(self, event_id: Optional[str]) -> Optional[int]:
+        if not event_id:
+            return None
+        epoch, _, seq = event_id.strip().partition("-")
+        if epoch != self._epoch or not seq.isdigit():
+            return None
+        seq = int(seq)
+        return seq if seq < self._next_seq else None
+
+    def _take(self, sub: Subscription) -> Optional[Event]:
+        oldest = self._oldest_seq()
+        if sub.cursor < oldest:
+            # Fell behind by more than the buffer
+            missed = oldest - sub.cursor
+            sub.dropped += missed
+            self._dropped += missed
+            sub.cursor = oldest
+
+        while sub.cursor < self._next_seq:
+            event = self._ring[sub.cursor % self.BUFFER_SIZE]
+            sub.cursor += 1
+            if event.superseded:
+                self._coalesced += 1
+                continue
+            return event
+        return None
+
+    def _read(self, sub: Subscription, timeout: Optional[float]) -> Event:
+        # Takes the lock itself
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                event = self._take(sub)
+                if event is not None:
+                    return event
+
+                if deadline is None:
+                    self._cond.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise queue.Empty
+                    self._cond.wait(remaining)
+
+    async def _read_async(self, sub: Subscription) -> Event:
+        # Takes the lock itself; runs on the subscriber's event loop
+        loop = asyncio.get_running_loop()
+        while True:
+            with self.lock:
+                # Take the waiter before checking, so a publish in between
+                # still wakes us up
+                waiter = self._loop_waiters.get(loop)
+                if waiter is None or waiter.done():
+                    waiter = loop.create_future()
+                    self._loop_waiters[loop] = waiter
+                event = self._take(sub)
+            if event is not None:
+                return event
+            await asyncio.shield(waiter)
+
+    def _wake_loop(self, loop):
+        # Runs on `loop`
+        with self.lock:
+            waiter = self._loop_waiters.get(loop)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
 
 # Global instance
 event_manager = EventManager()
@@ -0,0 +1,194 @@
+import html
+import os
+from typing import Iterator, NamedTuple
+
+from app.core.phonemes import PhonemeTimeline
+from app.core.resample import convert_wav
+from app.core.transcode import read_as_wav
+from app.core.wav import parse_wav_header, wav_header
+
+# Format -> (mimetype, extension)
+EXPORT_FORMATS = {
+    "srt": ("application/x-subrip", ".srt"),
+    "vtt": ("text/vtt", ".vtt"),
+    "wav": ("audio/wav", ".wav"),
+}
+# Records read per database query while streaming
+PAGE_SIZE = 500
+# RIFF sizes are 32-bit
+MAX_WAV_DATA_BYTES = 0xFFFFFFFF - 36
+
+
+class ExportCue(NamedTuple):
+    """One generated record, placed on the timeline of the concatenated audio."""
+
+    id: int
+    text: str
+    output_path: str
+    start_frame: int
+    frames: int
+    # Offset of the first phoneme (speech onset) within the record, seconds
+    onset: float
+
+
+def format_timestamp(seconds: float, separator: str = ",") -> str:
+    """HH:MM:SS,mmm (SRT) or, with separator ".", HH:MM:SS.mmm (WebVTT)."""
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3600000)
+    minutes, millis = divmod(millis, 60000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02}:{minutes:02}:{secs:02}{separator}{millis:03}"
+
+
+def record_frames(duration: float, sample_rate: int) -> int:
+    # Same rounding as DatabaseManager.get_export_frames
+    return int(duration * sample_rate + 0.5)
+
+
+def iter_cues(
+    database, start_id: int, end_id: int, sample_rate: int
+) -> Iterator[ExportCue]:
+    """
+    Yields the generated records of [start_id, end_id] back to back.
+    Lengths are whole frames at `sample_rate`, so subtitle times match the
+    concatenated WAV exactly. Records without audio are skipped.
+    """
+    after_id = start_id - 1
+    position = 0
+    while True:
+        rows = database.get_export_rows(start_id, end_id, after_id, PAGE_SIZE)
+        for db_id, text, output_path, duration, phonemes in rows:
+            frames = record_frames(duration, sample_rate)
+            yield ExportCue(
+                db_id, text, output_path, position, frames, _onset(phonemes, duration)
+            )
+            position += frames
+        if len(rows) < PAGE_SIZE:
+            return
+        after_id = rows[-1][0]
+
+
+def _onset(phonemes, duration: float) -> float:
+    try:
+        timeline = PhonemeTimeline.load(phonemes)
+    except (ValueError, KeyError, TypeError):
+        return 0.0
+    if not timeline:
+        return 0.0
+    onset = float(timeline.times[0])
+    return onset if 0 < onset < duration else 0.0
+
+
+def _cue_times(cue: ExportCue, sample_rate: int) -> tuple:
+    start = cue.start_frame / sample_rate
+    return start + cue.onset, start + cue.frames / sample_rate
+
+
+def _cue_lines(text: str) -> str:
+    # A blank line would end the cue early
+    return "\n".join(line for line in text.splitlines() if line.strip())
+
+
+def iter_srt(cues, sample_rate: int) -> Iterator[str]:
+    for number, cue in enumerate(cues, start=1):
+        start, end = _cue_times(cue, sample_rate)
+        yield (
+            f"{number}\n{format_timestamp(start)} --> {format_timestamp(end)}\n"
+            f"{_cue_lines(cue.text)}\n\n"
+        )
+
+
+def iter_vtt(cues, sample_rate: int) -> Iterator[str]:
+    yield "WEBVTT\n\n"
+    for cue in cues:
+        start, end = _cue_times(cue, sample_rate)
+        # Cue payloads are HTML-like: escape markup and the "-->" arrow
+        text = html.escape(_cue_lines(cue.text), quote=False)
+        yield (
+            f"{cue.id}\n{format_timestamp(start, '.')} --> "
+            f"{format_timestamp(end, '.')}\n{text}\n\n"
+        )
+
+
+def iter_wav(
+    cues,
+    output_dir: str,
+    sample_rate: int,
+    channels: int,
+    total_frames: int,
+) -> Iterator[bytes]:
+    """
+    Streams a 16-bit WAV of `total_frames` frames: the header, then each
+    record's PCM converted to the export format and cut or padded to its
+    cue length. Missing or unreadable files become silence, so later
+    records keep their place on the subtitle timeline.
+    """
+    frame_bytes = channels * 2
+    yield wav_header(sample_rate, channels, 16, total_frames * frame_bytes)
+
+    remaining = total_frames
+    for cue in cues:
+        frames = min(cue.frames, remaining)
+        if frames <= 0:
+            break  # Records were added to the range after the header was sent
+        pcm = _read_pcm(cue, output_dir, sample_rate, channels)
+        size = frames * frame_bytes
+        yield pcm[:size] + bytes(max(0, size - len(pcm)))
+        remaining -= frames
+    if remaining > 0:
+        yield bytes(remaining * frame_bytes)
+
+
+def _read_pcm(
+    cue: ExportCue, output_dir: str, sample_rate: int, channels: int
+) -> bytes:
+    path = os.path.join(output_dir, cue.output_path)
+    try:
+        data = convert_wav(read_as_wav(path), sample_rate, channels)
+        info = parse_wav_header(data)
+        return data[info.data_offset : info.data_offset + info.data_size]
+    except Exception as e:
+        print(f"[Export] Using silence for ID {cue.id} ({cue.output_path}): {e}")
+        return b""
+
+
+def export_history(
+    database,
+    output_dir: str,
+    export_format: str,
+    start_id: int,
+    end_id: int,
+    sample_rate: int,
+    channels: int,
+) -> tuple:
+    """
+    Returns (chunk generator, mimetype, content length or None) for an
+    export of the ID range. Rows are read page by page while the response
+    is streamed, so memory use does not grow with the size of the range.
+    Raises ValueError for an unknown format or a WAV over 4 GB.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {export_format}")
+    mimetype = EXPORT_FORMATS[export_format][0]
+    cues = iter_cues(database, start_id, end_id, sample_rate)
+
+    if export_format == "srt":
+        return _encode(iter_srt(cues, sample_rate)), mimetype, None
+    if export_format == "vtt":
+        return _encode(iter_vtt(cues, sample_rate)), mimetype, None
+
+    total_frames = database.get_export_frames(start_id, end_id, sample_rate)
+    data_size = total_frames * channels * 2
+    if data_size > MAX_WAV_DATA_BYTES:
+        raise ValueError("Range is too long for a single WAV file (4 GB)")
+    body = iter_wav(cues, output_dir, sample_rate, channels, total_frames)
+    return body, mimetype, 44 + data_size
+
+
+def _encode(chunks: Iterator[str]) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield chunk.encode("utf-8")
+
+
+def export_filename(export_format: str, start_id: int, end_id: int) -> str:
+    return f"export_{start_id}-{end_id}{EXPORT_FORMATS[export_format][1]}"
@@ -0,0 +1,132 @@
+import codecs
+import json
+import re
+from typing import Any, List
+
+# Structural characters outside of strings
+_TOKEN = re.compile(r'[{}\[\]"]')
+# Characters that end or escape inside a string
+_STRING_TOKEN = re.compile(r'["\\]')
+
+
+class JsonStreamParser:
+    """
+    Incremental parser for a stream of concatenated JSON objects
+    (e.g. the whisper filter's `format=json` HTTP output).
+
+    Bytes are decoded with an incremental UTF-8 decoder, so multi-byte
+    characters split across chunks are handled. Complete objects are decoded
+    directly with `JSONDecoder.raw_decode`; the end of an unfinished object
+    is found with a brace-depth scanner that skips string contents, so `}`
+    inside transcription text or nested objects does not split an object.
+    Every character is scanned once and only the unfinished tail is kept in
+    the buffer, which keeps long-lived streams linear in their length.
+
+    Text between top-level objects (newlines, commas, array brackets) is
+    ignored. Malformed objects are logged and skipped.
+    """
+
+    # Drop a single pending object once it grows beyond this many characters
+    MAX_PENDING = 1024 * 1024
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self._json = json.JSONDecoder()
+        self._reset()
+
+    def _reset(self):
+        # Holds only the unfinished object; _scan is where scanning resumes
+        self._buffer = ""
+        self._scan = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consumes a chunk of bytes and returns the objects it completed."""
+        text = self._decoder.decode(chunk)
+        if not text:
+            return []
+
+        self._buffer += text
+        results = self._drain()
+
+        if len(self._buffer) > self.MAX_PENDING:
+            print(
+                f"[JsonStreamParser] Dropping oversized pending object "
+                f"({len(self._buffer)} chars)"
+            )
+            self._reset()
+        return results
+
+    def _drain(self) -> List[Any]:
+        buf = self._buffer
+        end = len(buf)
+        start = 0
+        pos = self._scan
+        results = []
+
+        while pos < end:
+            if self._in_string:
+                m = _STRING_TOKEN.search(buf, pos)
+                if not m:
+                    pos = end
+                elif m.group() == "\\":
+                    if m.end() >= end:
+                        # Escape sequence split across chunks, rescan later
+                        pos = m.start()
+                        break
+                    pos = m.end() + 1
+                else:
+                    self._in_string = False
+                    pos = m.end()
+                continue
+
+            if self._depth == 0:
+                # Between objects: skip to the next top-level object
+                start = buf.find("{", pos)
+                if start == -1:
+                    pos = end
+                    break
+                # Fast path: complete objects are decoded at C speed
+                try:
+                    obj, pos = self._json.raw_decode(buf, start)
+                    results.append(obj)
+                    continue
+                except json.JSONDecodeError:
+                    pass
+                # Unfinished (or malformed): find its end with the scanner
+                self._depth = 1
+                pos = start + 1
+                continue
+
+            m = _TOKEN.search(buf, pos)
+            if not m:
+                pos = end
+                break
+
+            char = m.group()
+            pos = m.end()
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        obj, obj_end = self._json.raw_decode(buf, start)
+                        if obj_end != pos:
+                            raise json.JSONDecodeError("Unbalanced object", buf, pos)
+                        results.append(obj)
+                    except json.JSONDecodeError as e:
+                        print(f"[JsonStreamParser] Skipping malformed JSON: {e.msg}")
+
+        if self._depth == 0:
+            # Nothing pending, whatever is left is inter-object noise
+            self._buffer = ""
+            self._scan = 0
+        else:
+            # Keep only the unfinished object
+            self._buffer = buf[start:]
+            self._scan = pos - start
+        return results
@@ -0,0 +1,152 @@
+import json
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+# VOICEVOX (OpenJTalk) phoneme inventory. The index is the stored ID, so
+# entries may only ever be appended.
+PHONEMES = (
+    "pau", "cl", "N",
+    "a", "i", "u", "e", "o",
+    "A", "I", "U", "E", "O",
+    "k", "kw", "ky", "g", "gw", "gy",
+    "s", "sh", "z", "j",
+    "t", "ts", "ty", "ch", "d", "dy",
+    "n", "ny", "h", "hy", "f",
+    "b", "by", "p", "py", "m", "my",
+    "y", "r", "ry", "w", "v",
+)  # fmt: skip
+UNKNOWN_ID = 255
+
+_IDS = {p: i for i, p in enumerate(PHONEMES)}
+# ID -> name lookup table for vectorized decoding
+_NAMES = np.array(list(PHONEMES) + ["?"] * (256 - len(PHONEMES)), dtype=object)
+# Marks a pause between accent phrases: advances time, emits no phoneme
+_PAUSE = -1
+
+
+class PhonemeTimeline(NamedTuple):
+    """
+    Phoneme start times (seconds, float32) and phoneme IDs (uint8).
+
+    Stored in the `phonemes` column as one BLOB: all times (little-endian
+    float32) followed by all IDs, 5 bytes per phoneme.
+    """
+
+    times: np.ndarray
+    ids: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def empty(cls) -> "PhonemeTimeline":
+        return cls(np.zeros(0, dtype="<f4"), np.zeros(0, dtype=np.uint8))
+
+    @classmethod
+    def concat(cls, timelines: Iterable["PhonemeTimeline"]) -> "PhonemeTimeline":
+        timelines = list(timelines)
+        if not timelines:
+            return cls.empty()
+        return cls(
+            np.concatenate([t.times for t in timelines]).astype("<f4", copy=False),
+            np.concatenate([t.ids for t in timelines]).astype(np.uint8, copy=False),
+        )
+
+    def shifted(self, offset: float) -> "PhonemeTimeline":
+        return PhonemeTimeline((self.times + offset).astype("<f4"), self.ids)
+
+    def to_bytes(self) -> bytes:
+        return self.times.astype("<f4").tobytes() + self.ids.astype(np.uint8).tobytes()
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "PhonemeTimeline":
+        """Zero-copy view over a stored BLOB."""
+        count, rest = divmod(len(blob), 5)
+        if rest:
+            raise ValueError("Invalid phoneme timeline size")
+        return cls(
+            np.frombuffer(blob, dtype="<f4", count=count),
+            np.frombuffer(blob, dtype=np.uint8, count=count, offset=count * 4),
+        )
+
+    @classmethod
+    def from_list(cls, items: List[dict], strict: bool = False) -> "PhonemeTimeline":
+        """
+        From the legacy JSON form: [{"t": seconds, "p": phoneme}, ...].
+        Phonemes outside PHONEMES become UNKNOWN_ID ("?"), or raise
+        ValueError with `strict`, where that loss is not acceptable.
+        """
+        if strict:
+            unknown = {item["p"] for item in items} - _IDS.keys()
+            if unknown:
+                raise ValueError(f"Unknown phonemes: {sorted(map(str, unknown))}")
+        return cls(
+            np.array([item["t"] for item in items], dtype="<f4"),
+            np.array([_IDS.get(item["p"], UNKNOWN_ID) for item in items], np.uint8),
+        )
+
+    @classmethod
+    def load(cls, value: Union[bytes, str, None]) -> Optional["PhonemeTimeline"]:
+        """Decodes a `phonemes` column value (BLOB, or JSON text of old rows)."""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return cls.from_list(json.loads(value))
+        return cls.from_bytes(value)
+
+    def names(self) -> List[str]:
+        return _NAMES[self.ids].tolist()
+
+    def to_json(self) -> dict:
+        """Columnar form for the API: {"t": [seconds], "p": [phonemes]}."""
+        return {
+            "t": np.round(self.times.astype(np.float64), 3).tolist(),
+            "p": self.names(),
+        }
+
+    def to_list(self) -> List[dict]:
+        """Legacy form: [{"t": seconds, "p": phoneme}, ...]."""
+        data = self.to_json()
+        return [{"t": t, "p": p} for t, p in zip(data["t"], data["p"])]
+
+
+def extract_timeline(
+    accent_phrases: list,
+    pre_phoneme_length: float,
+    speed_scale: float = 1.0,
+    pause_length_scale: float = 1.0,
+) -> PhonemeTimeline:
+    """
+    Builds the timeline of an audio query. The moras are flattened into
+    (length, ID) pairs in one pass; start times are a cumulative sum.
+    Returns an empty timeline for malformed accent phrases.
+    """
+    lengths = []
+    codes = []
+    try:
+        for phrase in accent_phrases:
+            for mora in phrase.get("moras", []):
+                if mora.get("consonant"):
+                    lengths.append(mora.get("consonant_length") or 0.0)
+                    codes.append(_IDS.get(str(mora["consonant"]), UNKNOWN_ID))
+                if mora.get("vowel"):
+                    lengths.append(mora.get("vowel_length") or 0.0)
+                    codes.append(_IDS.get(str(mora["vowel"]), UNKNOWN_ID))
+            pause_mora = phrase.get("pause_mora")
+            if pause_mora:
+                lengths.append(
+                    (pause_mora.get("vowel_length") or 0.0) * pause_length_scale
+                )
+                codes.append(_PAUSE)
+
+        durations = np.asarray(lengths, dtype=np.float64) / speed_scale
+        starts = pre_phoneme_length + np.cumsum(durations) - durations
+    except (AttributeError, TypeError, ValueError):
+        return PhonemeTimeline.empty()
+
+    codes = np.asarray(codes, dtype=np.int16)
+    emitted = codes != _PAUSE
+    return PhonemeTimeline(
+        starts[emitted].astype("<f4"), codes[emitted].astype(np.uint8)
+    )
@@ -0,0 +1,352 @@
+import threading
+from typing import Callable, Optional
+
+import numpy as np
+import sounddevice as sd
+import soundfile as sf
+
+
+class PlaybackItem:
+    """Handle for one file handed to a StreamPlayer."""
+
+    def __init__(self, path: str, sound_file):
+        self.path = path
+        self.file = sound_file
+        self.samplerate = sound_file.samplerate
+        self.channels = sound_file.channels
+        self.frames = sound_file.frames
+        # Frames handed to the output device (updated by the audio callback)
+        self.position = 0
+        # Decoded head of the file (set when preloaded)
+        self.preroll = None
+        self.preroll_pos = 0
+        self.started = False
+        self._done = threading.Event()
+
+    @property
+    def format(self) -> tuple:
+        return (self.samplerate, self.channels)
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.samplerate if self.samplerate else 0.0
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the item has played to the end or was stopped."""
+        return self._done.wait(timeout)
+
+    def _finish(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.preroll = None
+        self._done.set()
+
+
+class StreamPlayer:
+    """
+    Block-streaming WAV player built on `sounddevice.OutputStream`.
+
+    The stream callback reads `blocksize` frames at a time from a
+    `soundfile.SoundFile` into a preallocated int16/float32 buffer, so audio
+    starts within one block and memory use does not grow with the length of
+    the file. Stop, pause and seek are applied at block boundaries inside the
+    callback, and `position` counts the frames actually handed to the device.
+
+    The output stream stays open between items of the same format. `enqueue`
+    opens the following file and decodes its first blocks while the current
+    item plays; the callback switches to it inside the same block, so queued
+    items play back to back without a gap or a device reopen.
+
+    `stream_factory` defaults to `sd.OutputStream`; tests pass a fake device
+    with the same constructor signature.
+    """
+
+    DTYPES = ("float32", "int16")
+    # Frames decoded ahead of time by enqueue()
+    PRELOAD_FRAMES = 8192
+
+    def __init__(
+        self,
+        blocksize: int = 1024,
+        dtype: str = "float32",
+        stream_factory: Optional[Callable] = None,
+    ):
+        if dtype not in self.DTYPES:
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        self.blocksize = blocksize
+        self.dtype = dtype
+        self._stream_factory = stream_factory or sd.OutputStream
+
+        self._lock = threading.Lock()
+        self._stream = None
+        self._stream_format = None
+        self._buffer = None
+        self._current = None
+        self._next = None
+        # Most recently started item, kept after it ends for `position`
+        self._last = None
+        self._paused = False
+        self._seek_to = None
+
+        self._idle = threading.Event()
+        self._idle.set()
+
+    # --- Control (caller thread) ---
+
+    def play(self, path: str) -> PlaybackItem:
+        """
+        Starts `path` immediately, replacing whatever is playing. The open
+        stream is reused when the format matches. Returns as soon as the
+        stream is running.
+        """
+        item = PlaybackItem(path, sf.SoundFile(path))
+
+        with self._lock:
+            replaced = [self._current, self._next]
+            reuse = self._stream is not None and self._stream_format == item.format
+            if reuse:
+                self._start_item(item)
+                self._next = None
+
+        if not reuse:
+            # The old stream's callback reads these files until it is stopped
+            self._close_stream()
+        for old in replaced:
+            if old is not None:
+                old._finish()
+        if reuse:
+            return item
+
+        try:
+            self._open_stream(item)
+        except Exception:
+            item._finish()
+            self.stop()
+            raise
+        return item
+
+    def enqueue(self, path: str) -> Optional[PlaybackItem]:
+        """
+        Preloads `path` to follow the current item without a gap. Returns
+        None if nothing is playing, another item is already queued or the
+        format differs from the open stream; the caller then uses play().
+        """
+        with self._lock:
+            if self._current is None or self._next is not None:
+                return None
+            stream_format = self._stream_format
+
+        sound_file = sf.SoundFile(path)
+        item = PlaybackItem(path, sound_file)
+        if item.format != stream_format:
+            item._finish()
+            return None
+
+        # Decode the head now so the switch in the callback never waits on disk
+        item.preroll = sound_file.read(
+            self.PRELOAD_FRAMES, dtype=self.dtype, always_2d=True
+        )
+
+        with self._lock:
+            if self._stream is None or self._stream_format != item.format:
+                accepted = False
+            elif self._current is None:
+                # Current item ended in the meantime: start right away
+                self._start_item(item)
+                accepted = True
+            elif self._next is None:
+                self._next = item
+                accepted = True
+            else:
+                accepted = False
+
+        if not accepted:
+            item._finish()
+            return None
+        return item
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the current and queued items have finished."""
+        return self._idle.wait(timeout)
+
+    def stop(self):
+        """
+        Stops immediately, drops the queued item and closes the stream.
+        The position keeps the last frame played.
+        """
+        self._close_stream()
+        with self._lock:
+            items = [self._current, self._next]
+            self._current = None
+            self._next = None
+        for item in items:
+            if item is not None:
+                item._finish()
+        self._idle.set()
+
+    def pause(self):
+        with self._lock:
+            self._paused = True
+
+    def resume(self):
+        with self._lock:
+            self._paused = False
+
+    def seek(self, seconds: float):
+        """Moves playback of the current item to `seconds`; applied at the next block."""
+        with self._lock:
+            if self._current is None:
+                return
+            frame = int(round(seconds * self._current.samplerate))
+            frame = max(0, min(frame, self._current.frames))
+            self._seek_to = frame
+            self._current.position = frame
+
+    # --- State ---
+
+    @property
+    def is_active(self) -> bool:
+        return not self._idle.is_set()
+
+    @property
+    def is_paused(self) -> bool:
+        return self._paused
+
+    @property
+    def is_open(self) -> bool:
+        return self._stream is not None
+
+    @property
+    def position(self) -> int:
+        """Frames of the current (or last) item handed to the output device."""
+        last = self._last
+        return last.position if last is not None else 0
+
+    def elapsed(self, item: PlaybackItem) -> float:
+        """
+        Seconds of `item` that have reached the speaker: frames consumed by
+        the callback minus the stream's output latency.
+        """
+        if not item.started or not item.samplerate:
+            return 0.0
+        seconds = item.position / item.samplerate
+        if not item.done:
+            seconds -= getattr(self._stream, "latency", 0) or 0
+        return min(item.duration, max(0.0, seconds))
+
+    @property
+    def samplerate(self) -> int:
+        return self._stream_format[0] if self._stream_format else 0
+
+    @property
+    def duration(self) -> float:
+        current = self._current
+        return current.duration if current is not None else 0.0
+
+    # --- Audio thread ---
+
+    def _callback(self, outdata, frames, time_info, status):
+        with self._lock:
+            item = self._current
+            if item is None or self._paused:
+                # Idle or paused: keep the device fed with silence
+                outdata.fill(0)
+                return
+
+            if self._seek_to is not None:
+                item.file.seek(self._seek_to)
+                item.preroll = None
+                self._seek_to = None
+
+            filled = 0
+            while filled < frames and item is not None:
+                read = self._read_item(item, outdata[filled:frames])
+                filled += read
+                item.position += read
+                if filled < frames:
+                    # End of item: continue with the preloaded one in this block
+                    item._finish()
+                    item = self._next
+                    self._next = None
+                    self._current = None
+                    if item is not None:
+                        self._start_item(item)
+
+            if filled < frames:
+                outdata[filled:].fill(0)
+            if self._current is None:
+                self._idle.set()
+
+    def _read_item(self, item: PlaybackItem, out) -> int:
+        wanted = len(out)
+        read = 0
+        if item.preroll is not None:
+            chunk = item.preroll[item.preroll_pos : item.preroll_pos + wanted]
+            read = len(chunk)
+            out[:read] = chunk
+            item.preroll_pos += read
+            if item.preroll_pos >= len(item.preroll):
+                item.preroll = None
+        if read < wanted:
+            rest = wanted - read
+            if rest > len(self._buffer):
+                self._buffer = np.zeros((rest, item.channels), dtype=self.dtype)
+            data = item.file.read(rest, out=self._buffer[:rest])
+            out[read : read + len(data)] = data
+            read += len(data)
+        return read
+
+    def _on_stream_finished(self, stream):
+        # The device stopped on its own (error or unplug): release the items
+        with self._lock:
+            if self._stream is not stream:
+                return
+        self.stop()
+
+    # --- Helpers ---
+
+    def _start_item(self, item: PlaybackItem):
+        # Caller holds the lock
+        item.started = True
+        self._current = item
+        self._last = item
+        self._paused = False
+        self._seek_to = None
+        self._idle.clear()
+
+    def _open_stream(self, item: PlaybackItem):
+        with self._lock:
+            self._buffer = np.zeros((self.blocksize, item.channels), dtype=self.dtype)
+            self._stream_format = item.format
+            self._start_item(item)
+            self._next = None
+
+        stream = self._stream_factory(
+            samplerate=item.samplerate,
+            channels=item.channels,
+            dtype=self.dtype,
+            blocksize=self.blocksize,
+            callback=self._callback,
+            finished_callback=lambda: self._on_stream_finished(stream),
+        )
+        with self._lock:
+            self._stream = stream
+        stream.start()
+
+    def _close_stream(self):
+        with self._lock:
+            stream = self._stream
+            self._stream = None
+            self._stream_format = None
+        if stream is None:
+            return
+        try:
+            stream.abort()
+            stream.close()
+        except Exception as e:
+            print(f"[StreamPlayer] Error closing stream: {e}")
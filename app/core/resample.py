@@ -0,0 +1,110 @@
+from math import gcd
+
+import numpy as np
+
+from app.core.wav import parse_wav_header, wav_header
+
+try:
+    from scipy.signal import resample_poly as _scipy_resample_poly
+except ImportError:  # Optional: the NumPy implementation below is equivalent
+    _scipy_resample_poly = None
+
+# Output frames computed per vectorized step of the NumPy resampler
+_BLOCK_FRAMES = 16384
+
+
+def convert_wav(data: bytes, sample_rate: int, channels: int) -> bytes:
+    """
+    Converts an in-memory 16-bit PCM WAV to `sample_rate` / `channels`
+    (1 or 2). Mono is duplicated to stereo after resampling, stereo is
+    averaged to mono before it. Returns `data` itself if the format
+    already matches. Raises ValueError for other sample formats.
+    """
+    info = parse_wav_header(data)
+    if (info.sample_rate, info.channels) == (sample_rate, channels):
+        return data
+    if info.bits_per_sample != 16:
+        raise ValueError(f"Unsupported sample format: {info.bits_per_sample} bit")
+    if channels not in (1, 2) or info.channels not in (1, 2):
+        raise ValueError("Only mono and stereo are supported")
+
+    samples = np.frombuffer(
+        data, dtype="<i2", count=info.frames * info.channels, offset=info.data_offset
+    ).reshape(-1, info.channels)
+    if info.channels == 1:
+        # Expanded to stereo (if needed) after resampling: half the work
+        signal = samples[:, 0].astype(np.float64)
+    elif channels == 1:
+        signal = samples.mean(axis=1, dtype=np.float64)
+    else:
+        signal = samples.astype(np.float64)
+
+    signal = resample_poly(signal, sample_rate, info.sample_rate)
+    pcm = np.clip(np.rint(signal), -32768, 32767).astype("<i2")
+    if pcm.ndim == 1 and channels == 2:
+        pcm = np.repeat(pcm[:, None], 2, axis=1)
+
+    payload = pcm.tobytes()
+    return wav_header(sample_rate, channels, 16, len(payload)) + payload
+
+
+def resample_poly(x: np.ndarray, up: int, down: int) -> np.ndarray:
+    """
+    Resamples along axis 0 by the rational factor up/down: zero-stuffing,
+    a Kaiser-windowed sinc lowpass (beta 5, 10 zero crossings per side of
+    the lower rate) and decimation, with the filter delay compensated. The
+    same design as scipy.signal.resample_poly, which is used if installed.
+    """
+    divisor = gcd(up, down)
+    up, down = up // divisor, down // divisor
+    if up == down == 1:
+        return np.array(x, dtype=np.float64)
+    if _scipy_resample_poly is not None:
+        return _scipy_resample_poly(x, up, down, axis=0)
+    return _resample_poly_numpy(np.asarray(x, dtype=np.float64), up, down)
+
+
+def _design_filter(up: int, down: int) -> np.ndarray:
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    n = np.arange(-half_len, half_len + 1)
+    h = np.sinc(n / max_rate) * np.kaiser(2 * half_len + 1, 5.0)
+    # Unity DC gain, times `up` for the energy lost to zero-stuffing
+    return h * (up / h.sum())
+
+
+def _resample_poly_numpy(x: np.ndarray, up: int, down: int) -> np.ndarray:
+    h = _design_filter(up, down)
+    half_len = (len(h) - 1) // 2
+
+    # Polyphase form: only every up-th filter tap meets an input sample.
+    # phases[p, t] = h[p + t * up]
+    taps = -(-len(h) // up)
+    phases = np.zeros(taps * up)
+    phases[: len(h)] = h
+    phases = phases.reshape(taps, up).T
+
+    n_in = x.shape[0]
+    n_out = -(-n_in * up // down)
+    # Output m sits at position m * down (+ filter delay) of the upsampled signal
+    pos = np.arange(n_out) * down + half_len
+    phase = pos % up
+    base = pos // up
+
+    pad_front = taps - 1
+    pad_back = max(0, int(base[-1]) - (n_in - 1)) if n_out else 0
+    padded = np.concatenate(
+        [
+            np.zeros((pad_front,) + x.shape[1:]),
+            x,
+            np.zeros((pad_back,) + x.shape[1:]),
+        ]
+    )
+
+    out = np.empty((n_out,) + x.shape[1:])
+    offsets = pad_front - np.arange(taps)
+    for start in range(0, n_out, _BLOCK_FRAMES):
+        block = slice(start, start + _BLOCK_FRAMES)
+        index = base[block, None] + offsets
+        out[block] = np.einsum("bt,bt...->b...", phases[phase[block]], padded[index])
+    return out
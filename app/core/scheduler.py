@@ -0,0 +1,157 @@
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Callable
+
+
+class Priority(IntEnum):
+    """VOICEVOX request classes, most urgent first."""
+
+    # Play / Resolve insert clicks and other UI-triggered requests (default)
+    INTERACTIVE = 0
+    # Immediate synthesis of incoming transcriptions, health polling
+    LIVE = 1
+    # Prefetch and bulk synthesis
+    BACKGROUND = 2
+
+
+class PriorityContext:
+    """Priority of the work running on a thread; can be raised while queued."""
+
+    __slots__ = ("level",)
+
+    def __init__(self, level: Priority):
+        self.level = level
+
+
+class _Ticket:
+    __slots__ = ("ctx", "seq")
+
+    def __init__(self, ctx: PriorityContext, seq: int):
+        self.ctx = ctx
+        self.seq = seq
+
+
+class RequestScheduler:
+    """
+    Admission control in front of the VOICEVOX engine.
+
+    At most `max_concurrency()` requests are in flight. When a slot frees up
+    it goes to the most urgent waiting request (FIFO within a class), so a
+    click never waits behind queued bulk work, only for one request that is
+    already running.
+
+    The class of a request comes from the calling thread (`priority()`);
+    threads that never set one count as INTERACTIVE.
+    """
+
+    def __init__(self, max_concurrency: Callable[[], int]):
+        self.max_concurrency = max_concurrency
+        self._cond = threading.Condition()
+        self._waiting = []
+        self._active = 0
+        self._seq = itertools.count()
+        self._local = threading.local()
+
+        self._started = {p: 0 for p in Priority}
+        self._wait_total = {p: 0.0 for p in Priority}
+        self._wait_max = {p: 0.0 for p in Priority}
+        self._max_queued = 0
+
+    def current(self) -> PriorityContext:
+        ctx = getattr(self._local, "ctx", None)
+        if ctx is None:
+            ctx = self._local.ctx = PriorityContext(Priority.INTERACTIVE)
+        return ctx
+
+    @contextmanager
+    def priority(self, level: Priority):
+        """Runs the block's requests at `level`; yields the context for boost()."""
+        previous = getattr(self._local, "ctx", None)
+        ctx = self._local.ctx = PriorityContext(level)
+        try:
+            yield ctx
+        finally:
+            self._local.ctx = previous
+
+    @contextmanager
+    def inherit(self, ctx: PriorityContext):
+        """Runs the block's requests under another thread's context (helpers)."""
+        previous = getattr(self._local, "ctx", None)
+        self._local.ctx = ctx
+        try:
+            yield ctx
+        finally:
+            self._local.ctx = previous
+
+    def boost(self, ctx: PriorityContext, level: Priority):
+        """Raises (never lowers) the priority of work already queued or running."""
+        with self._cond:
+            if level < ctx.level:
+                ctx.level = level
+                self._cond.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """Holds one engine slot for the duration of a request."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self):
+        start = time.monotonic()
+        with self._cond:
+            ticket = _Ticket(self.current(), next(self._seq))
+            self._waiting.append(ticket)
+            self._max_queued = max(self._max_queued, len(self._waiting))
+            while self._active >= max(1, self.max_concurrency()) or (
+                self._next() is not ticket
+            ):
+                self._cond.wait()
+            self._waiting.remove(ticket)
+            self._active += 1
+
+            level = Priority(ticket.ctx.level)
+            waited = time.monotonic() - start
+            self._started[level] += 1
+            self._wait_total[level] += waited
+            self._wait_max[level] = max(self._wait_max[level], waited)
+            # The next waiter may fit into another free slot
+            self._cond.notify_all()
+
+    def release(self):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def get_stats(self) -> dict:
+        with self._cond:
+            queued = {p: 0 for p in Priority}
+            for ticket in self._waiting:
+                queued[Priority(ticket.ctx.level)] += 1
+            return {
+                "max_concurrency": self.max_concurrency(),
+                "active": self._active,
+                "max_queued": self._max_queued,
+                "classes": {
+                    p.name.lower(): {
+                        "queued": queued[p],
+                        "started": self._started[p],
+                        "avg_wait_ms": (
+                            round(self._wait_total[p] / self._started[p] * 1000, 1)
+                            if self._started[p]
+                            else 0.0
+                        ),
+                        "max_wait_ms": round(self._wait_max[p] * 1000, 1),
+                    }
+                    for p in Priority
+                },
+            }
+
+    def _next(self) -> _Ticket:
+        # Call with the lock held
+        return min(self._waiting, key=lambda t: (t.ctx.level, t.seq))
@@ -0,0 +1,41 @@
+import re
+from typing import List
+
+# Sentence end, with any closing brackets/quotes that follow it
+_SENTENCE_END = re.compile(r"[^。．！？!?\n]*(?:[。．！？!?\n]+[」』）)\]”’]*|$)")
+# Clause boundaries inside a sentence (VOICEVOX puts a pause between accent
+# phrases here)
+_CLAUSE_END = re.compile(r"[^、，,]*(?:[、，,]+|$)")
+
+
+def split_text(text: str, max_chars: int) -> List[str]:
+    """
+    Splits text into synthesis chunks at Japanese sentence punctuation.
+    Sentences longer than `max_chars` are split further at 、 clause
+    boundaries (consecutive clauses are packed up to `max_chars`). Text
+    without any boundary is never cut. Returns [text] when chunking is
+    disabled (`max_chars <= 0`) or the text already fits.
+    """
+    if max_chars <= 0 or len(text) <= max_chars:
+        return [text]
+
+    chunks = []
+    for sentence in _matches(_SENTENCE_END, text):
+        if len(sentence) <= max_chars:
+            chunks.append(sentence)
+            continue
+        current = ""
+        for clause in _matches(_CLAUSE_END, sentence):
+            if current and len(current) + len(clause) > max_chars:
+                chunks.append(current)
+                current = ""
+            current += clause
+        if current:
+            chunks.append(current)
+
+    # Whitespace-only pieces (e.g. blank lines) carry no speech
+    return [c for c in chunks if c.strip()] or [text]
+
+
+def _matches(pattern: re.Pattern, text: str) -> List[str]:
+    return [m.group(0) for m in pattern.finditer(text) if m.group(0)]
@@ -0,0 +1,101 @@
+import io
+import os
+
+import numpy as np
+import soundfile as sf
+
+# Archive format -> (extension, libsndfile format, subtype)
+ARCHIVE_FORMATS = {
+    "flac": (".flac", "FLAC", "PCM_16"),
+    "opus": (".opus", "OGG", "OPUS"),
+}
+# Sample rates the Opus codec accepts; other files are archived as FLAC
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+# Frames converted per step, so long files are never loaded at once
+BLOCK_FRAMES = 65536
+
+
+def is_archived(filename: str) -> bool:
+    """True if `filename` is in one of the archive formats."""
+    return os.path.splitext(filename)[1].lower() in (
+        ext for ext, _, _ in ARCHIVE_FORMATS.values()
+    )
+
+
+def encode_file(wav_path: str, archive_format: str) -> str:
+    """
+    Transcodes a WAV to `archive_format` next to it (same name, archive
+    extension) and returns the new path. The WAV itself is kept. Opus is
+    lossy and only supports some sample rates; other rates fall back to FLAC.
+    """
+    with sf.SoundFile(wav_path) as src:
+        if archive_format == "opus" and src.samplerate not in OPUS_SAMPLE_RATES:
+            archive_format = "flac"
+        ext, fmt, subtype = ARCHIVE_FORMATS[archive_format]
+        dst_path = os.path.splitext(wav_path)[0] + ext
+        _convert(src, dst_path, fmt, subtype)
+    return dst_path
+
+
+def decode_file(path: str) -> str:
+    """Decodes an archived file to a 16-bit WAV next to it and returns its path."""
+    dst_path = os.path.splitext(path)[0] + ".wav"
+    with sf.SoundFile(path) as src:
+        _convert(src, dst_path, "WAV", "PCM_16")
+    return dst_path
+
+
+def read_as_wav(path: str) -> bytes:
+    """Returns any supported audio file as in-memory 16-bit WAV data."""
+    if not is_archived(path):
+        with open(path, "rb") as f:
+            return f.read()
+    buffer = io.BytesIO()
+    with sf.SoundFile(path) as src:
+        with sf.SoundFile(
+            buffer,
+            "w",
+            samplerate=src.samplerate,
+            channels=src.channels,
+            format="WAV",
+            subtype="PCM_16",
+        ) as dst:
+            for block in _pcm16_blocks(src):
+                dst.write(block)
+    return buffer.getvalue()
+
+
+def _convert(src: sf.SoundFile, dst_path: str, fmt: str, subtype: str):
+    # Written under a temporary name so dst_path is either complete or absent
+    tmp_path = dst_path + ".tmp"
+    try:
+        with sf.SoundFile(
+            tmp_path,
+            "w",
+            samplerate=src.samplerate,
+            channels=src.channels,
+            format=fmt,
+            subtype=subtype,
+        ) as dst:
+            blocks = _pcm16_blocks(src) if subtype == "PCM_16" else _float_blocks(src)
+            for block in blocks:
+                dst.write(block)
+        os.replace(tmp_path, dst_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _float_blocks(src: sf.SoundFile):
+    return src.blocks(BLOCK_FRAMES, dtype="float32", always_2d=True)
+
+
+def _pcm16_blocks(src: sf.SoundFile):
+    if src.subtype.startswith("PCM"):
+        # Lossless sources (WAV, FLAC) convert bit-exactly
+        yield from src.blocks(BLOCK_FRAMES, dtype="int16", always_2d=True)
+        return
+    # Decoded Opus can overshoot full scale slightly
+    for block in _float_blocks(src):
+        yield np.clip(np.rint(block * 32768), -32768, 32767).astype(np.int16)
@@ -1,9 +1,13 @@
 import json
-import urllib.request
+import http.client
+import threading
+import time
 import urllib.parse
+from collections import OrderedDict
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 from app.config.schemas import VoiceVoxConfig
+from app.core.scheduler import Priority, RequestScheduler
 
 
 class VoiceVoxStyle(BaseModel):
@@ -42,25 +46,203 @@ class VoiceVoxAudioQuery(BaseModel):
         return self.model_dump_json()
 
 
+class KeepAliveConnectionPool:
+    """
+    Small pool of persistent HTTP/1.1 connections to a single host.
+    Connections are reused across requests instead of opening a new TCP
+    connection per call.
+    """
+
+    def __init__(self, host: str, port: int, max_idle: int = 4):
+        self.host = host
+        self.port = port
+        self.max_idle = max_idle
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _checkout(self, timeout: float) -> http.client.HTTPConnection:
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        else:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+        return conn
+
+    def _checkin(self, conn: http.client.HTTPConnection):
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10.0,
+    ):
+        """Performs a request and returns (status, body bytes)."""
+        conn = self._checkout(timeout)
+        try:
+            conn.request(method, url, body=body, headers=headers or {})
+            res = conn.getresponse()
+            data = res.read()
+        except Exception:
+            conn.close()
+            raise
+
+        if res.will_close:
+            conn.close()
+        else:
+            self._checkin(conn)
+        return res.status, data
+
+    def close(self):
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+        for conn in idle:
+            conn.close()
+
+
 class VoiceVoxClient:
+    # Per-endpoint timeouts (seconds)
+    ENDPOINT_TIMEOUTS = {
+        "/version": 1.0,
+        "/speakers": 3.0,
+        "/audio_query": 10.0,
+        "/synthesis": 60.0,
+    }
+    DEFAULT_TIMEOUT = 10.0
+    MAX_RETRIES = 2
+    RETRY_BACKOFF = 0.2  # seconds, doubled on each retry
+    # Health state older than this is re-probed synchronously
+    HEALTH_TTL = 5.0
+    # Number of (text, speaker_id) audio queries kept in memory
+    QUERY_CACHE_SIZE = 256
+    # Cached queries are re-fetched after this long (user dictionary edits)
+    QUERY_CACHE_TTL = 300.0
+
     def __init__(self, config: VoiceVoxConfig):
         self.config = config
         self._speakers_cache: Optional[List[VoiceVoxSpeaker]] = None
 
+        # LRU of raw audio_query results with the time they were fetched.
+        # The accent phrases only depend on text, speaker and the engine's
+        # user dictionary; scales are overwritten by the caller anyway.
+        self._query_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._query_lock = threading.Lock()
+
+        self._pool: Optional[KeepAliveConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        self._available = False
+        self._health_checked_at = 0.0
+
+        # Every request waits here for an engine slot, most urgent class first
+        self.scheduler = RequestScheduler(lambda: self.config.max_concurrency)
+
     @property
     def base_url(self) -> str:
         host = self.config.host
         port = self.config.port
         return f"http://{host}:{port}"
 
-    def is_available(self) -> bool:
+    def _get_pool(self) -> KeepAliveConnectionPool:
+        host = self.config.host
+        port = self.config.port
+        with self._pool_lock:
+            if self._pool is None or (self._pool.host, self._pool.port) != (
+                host,
+                port,
+            ):
+                if self._pool is not None:
+                    self._pool.close()
+                    # A different engine may produce different accent phrases
+                    self.clear_query_cache()
+                self._pool = KeepAliveConnectionPool(host, port)
+            return self._pool
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retries: Optional[int] = None,
+    ) -> bytes:
+        """
+        Sends a request over a pooled keep-alive connection.
+        Connection errors and 5xx responses are retried with exponential backoff.
+        Each attempt holds a scheduler slot; the backoff sleep does not.
+        """
+        url = path
+        if params:
+            url = f"{path}?{urllib.parse.urlencode(params)}"
+        timeout = self.ENDPOINT_TIMEOUTS.get(path, self.DEFAULT_TIMEOUT)
+        retries = self.MAX_RETRIES if retries is None else retries
+
+        last_error: Optional[Exception] = None
+        for attempt in range(retries + 1):
+            if attempt > 0:
+                time.sleep(self.RETRY_BACKOFF * (2 ** (attempt - 1)))
+            try:
+                with self.scheduler.slot():
+                    status, data = self._get_pool().request(
+                        method, url, body=body, headers=headers, timeout=timeout
+                    )
+            except (OSError, http.client.HTTPException) as e:
+                last_error = e
+                if isinstance(e, TimeoutError):
+                    # The engine is busy, resending would only queue more work
+                    break
+                continue
+
+            self._set_health(True)
+            if status == 200:
+                return data
+            last_error = RuntimeError(f"VOICEVOX {path} returned HTTP {status}")
+            if status < 500:
+                break
+
+        if not isinstance(last_error, (RuntimeError, TimeoutError)):
+            # Engine unreachable
+            self._set_health(False)
+        raise last_error
+
+    def _set_health(self, available: bool):
+        if available and not self._available:
+            # Engine (re)started: its user dictionary may have changed
+            self.clear_query_cache()
+        self._available = available
+        self._health_checked_at = time.monotonic()
+
+    def refresh_health(self) -> bool:
+        """Probes /version and updates the cached health state."""
         try:
-            url = f"{self.base_url}/version"
-            req = urllib.request.Request(url, method="GET")
-            with urllib.request.urlopen(req, timeout=1) as res:
-                return res.getcode() == 200
-        except:
-            return False
+            # Ahead of bulk work, so a busy engine is not reported as offline,
+            # without demoting an interactive caller (lower is more urgent)
+            level = min(self.scheduler.current().level, Priority.LIVE)
+            with self.scheduler.priority(level):
+                self._request("GET", "/version", retries=0)
+            self._set_health(True)
+        except Exception:
+            self._set_health(False)
+        return self._available
+
+    def is_available(self) -> bool:
+        """
+        Returns the cached health state (refreshed by the status poller).
+        Only probes synchronously if the state is older than HEALTH_TTL.
+        """
+        if time.monotonic() - self._health_checked_at > self.HEALTH_TTL:
+            return self.refresh_health()
+        return self._available
 
     def get_speakers(self, force_refresh: bool = False) -> List[VoiceVoxSpeaker]:
         """Fetch speakers and return as strongly typed models."""
@@ -71,13 +253,9 @@ class VoiceVoxClient:
             return []
 
         try:
-            url = f"{self.base_url}/speakers"
-            req = urllib.request.Request(url, method="GET")
-            with urllib.request.urlopen(req, timeout=1) as res:
-                if res.getcode() == 200:
-                    raw_data = json.load(res)
-                    self._speakers_cache = [VoiceVoxSpeaker(**s) for s in raw_data]
-                    return self._speakers_cache
+            raw_data = json.loads(self._request("GET", "/speakers"))
+            self._speakers_cache = [VoiceVoxSpeaker(**s) for s in raw_data]
+            return self._speakers_cache
         except Exception as e:
             print(f"[VoiceVoxClient] Error fetching speakers: {e}")
 
@@ -98,23 +276,68 @@ class VoiceVoxClient:
         return None
 
     def audio_query(self, text: str, speaker_id: int) -> VoiceVoxAudioQuery:
-        """Performs audio_query and returns a typed model."""
-        url = f"{self.base_url}/audio_query?text={urllib.parse.quote(text)}&speaker={speaker_id}"
-        req = urllib.request.Request(url, method="POST")
-        with urllib.request.urlopen(req) as res:
-            raw_data = json.load(res)
-            return VoiceVoxAudioQuery(**raw_data)
-
-    def synthesis(self, query: VoiceVoxAudioQuery, speaker_id: int) -> bytes:
-        """Synthesize audio using the AudioQuery model."""
-        # Quality settings fixed
-        query.outputSamplingRate = 48000
-        query.outputStereo = True
-
-        url = f"{self.base_url}/synthesis?speaker={speaker_id}"
+        """
+        Performs audio_query and returns a typed model.
+        Results are memoized per (text, speaker_id) for QUERY_CACHE_TTL
+        seconds, so changing only the scale parameters does not hit
+        /audio_query again. A fresh copy is returned each time since
+        callers overwrite the scales.
+        """
+        key = (text, speaker_id)
+        with self._query_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                fetched_at, query = cached
+                if time.monotonic() - fetched_at < self.QUERY_CACHE_TTL:
+                    self._query_cache.move_to_end(key)
+                    return query.model_copy(deep=True)
+                del self._query_cache[key]
+
+        raw_data = json.loads(
+            self._request(
+                "POST", "/audio_query", params={"text": text, "speaker": speaker_id}
+            )
+        )
+        query = VoiceVoxAudioQuery(**raw_data)
+
+        with self._query_lock:
+            self._query_cache[key] = (time.monotonic(), query.model_copy(deep=True))
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return query
+
+    def clear_query_cache(self):
+        with self._query_lock:
+            self._query_cache.clear()
+
+    def synthesis(
+        self,
+        query: VoiceVoxAudioQuery,
+        speaker_id: int,
+        sample_rate: Optional[int] = 48000,
+        stereo: bool = True,
+    ) -> bytes:
+        """
+        Synthesize audio using the AudioQuery model. With sample_rate=None
+        the engine's native rate (as returned by audio_query) is kept.
+        """
+        if sample_rate is not None:
+            query.outputSamplingRate = sample_rate
+        query.outputStereo = stereo
+
         json_data = query.model_dump_json().encode("utf-8")
-        req = urllib.request.Request(url, data=json_data, method="POST")
-        req.add_header("Content-Type", "application/json")
+        return self._request(
+            "POST",
+            "/synthesis",
+            params={"speaker": speaker_id},
+            body=json_data,
+            headers={"Content-Type": "application/json"},
+        )
 
-        with urllib.request.urlopen(req) as res:
-            return res.read()
+    def close(self):
+        """Closes pooled connections."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
@@ -0,0 +1,159 @@
+import os
+import struct
+from typing import BinaryIO, List, NamedTuple
+
+
+class WavInfo(NamedTuple):
+    """Format information read from a RIFF/WAVE header."""
+
+    sample_rate: int
+    channels: int
+    bits_per_sample: int
+    block_align: int
+    data_offset: int
+    data_size: int
+
+    @property
+    def frames(self) -> int:
+        return self.data_size // self.block_align
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate
+
+
+def parse_wav_header(data: bytes) -> WavInfo:
+    """
+    Parses the RIFF header of an in-memory WAV without copying the payload.
+    A data chunk whose declared size exceeds the buffer (streamed WAVs) is
+    clamped to the bytes actually present. Raises ValueError if the bytes
+    are not a PCM-style RIFF/WAVE file.
+    """
+    view = memoryview(data)
+    if len(view) < 12 or view[0:4] != b"RIFF" or view[8:12] != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(view):
+        chunk_id = view[pos : pos + 4].tobytes()
+        (chunk_size,) = struct.unpack_from("<I", view, pos + 4)
+        body = pos + 8
+
+        if chunk_id == b"fmt ":
+            if chunk_size < 16 or body + 16 > len(view):
+                raise ValueError("Truncated fmt chunk")
+            fmt = struct.unpack_from("<HHIIHH", view, body)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("data chunk before fmt chunk")
+            size = min(chunk_size, len(view) - body)
+            return _make_info(fmt, body, size)
+
+        # Chunks are word aligned
+        pos = body + chunk_size + (chunk_size & 1)
+
+    raise ValueError("No data chunk found")
+
+
+def read_wav_header(path: str) -> WavInfo:
+    """
+    Reads only the RIFF chunk headers of a WAV file (seeking over chunk
+    bodies), so the audio payload is never read.
+    """
+    with open(path, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        return _read_header(f, file_size)
+
+
+def _read_header(f: BinaryIO, file_size: int) -> WavInfo:
+    head = f.read(12)
+    if len(head) < 12 or head[0:4] != b"RIFF" or head[8:12] != b"WAVE":
+        raise ValueError("Not a RIFF/WAVE file")
+
+    fmt = None
+    pos = 12
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            raise ValueError("No data chunk found")
+        chunk_id = header[0:4]
+        (chunk_size,) = struct.unpack("<I", header[4:8])
+        body = pos + 8
+
+        if chunk_id == b"fmt ":
+            raw = f.read(chunk_size)
+            if chunk_size < 16 or len(raw) < 16:
+                raise ValueError("Truncated fmt chunk")
+            fmt = struct.unpack_from("<HHIIHH", raw, 0)
+            if chunk_size & 1:
+                f.seek(1, os.SEEK_CUR)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("data chunk before fmt chunk")
+            size = min(chunk_size, file_size - body)
+            return _make_info(fmt, body, size)
+        else:
+            f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+        pos = body + chunk_size + (chunk_size & 1)
+
+
+def _make_info(fmt: tuple, data_offset: int, data_size: int) -> WavInfo:
+    _, channels, sample_rate, _, block_align, bits_per_sample = fmt
+    if sample_rate <= 0 or block_align <= 0:
+        raise ValueError("Invalid fmt chunk")
+    return WavInfo(
+        sample_rate=sample_rate,
+        channels=channels,
+        bits_per_sample=bits_per_sample,
+        block_align=block_align,
+        data_offset=data_offset,
+        data_size=max(0, data_size),
+    )
+
+
+def concat_wav(parts: List[bytes]) -> bytes:
+    """
+    Joins in-memory PCM WAVs of identical format into one WAV (the audio
+    payloads back to back, under a single canonical 44-byte header).
+    Raises ValueError if the formats differ.
+    """
+    infos = [parse_wav_header(p) for p in parts]
+    if not infos:
+        raise ValueError("No WAV data")
+    first = infos[0]
+    fmt = (first.sample_rate, first.channels, first.bits_per_sample)
+    if any((i.sample_rate, i.channels, i.bits_per_sample) != fmt for i in infos):
+        raise ValueError("WAV formats differ")
+
+    data_size = sum(i.data_size for i in infos)
+    out = bytearray(
+        wav_header(first.sample_rate, first.channels, first.bits_per_sample, data_size)
+    )
+    for part, info in zip(parts, infos):
+        out += memoryview(part)[info.data_offset : info.data_offset + info.data_size]
+    return bytes(out)
+
+
+def wav_header(
+    sample_rate: int, channels: int, bits_per_sample: int, data_size: int
+) -> bytes:
+    """Canonical 44-byte PCM RIFF header for `data_size` bytes of samples."""
+    block_align = channels * bits_per_sample // 8
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        bits_per_sample,
+        b"data",
+        data_size,
+    )
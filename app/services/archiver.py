@@ -0,0 +1,254 @@
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from app.config.schemas import SystemConfig
+from app.core.transcode import decode_file, encode_file, is_archived
+
+
+class AudioArchiver:
+    """
+    Background transcoding of old output WAVs to FLAC or Opus
+    (`system.archive_after_days`, `system.archive_format`).
+
+    A pass walks the records whose row is older than the threshold and
+    skips files modified more recently (e.g. just restored). Each WAV is
+    transcoded next to itself, then `output_path` is switched to the archive
+    only if the record still points at the WAV, so records re-synthesized
+    or deleted meanwhile are left alone. The WAV is removed last; if it is
+    still open elsewhere (Windows), removal is retried on the next pass.
+
+    Output WAVs are usually hardlinks to audio cache blobs, so the blob is
+    released first. Only space that the removal actually gives back (the
+    WAV was the last link to its data) is reported as freed.
+
+    Playback reads archived files directly (libsndfile). Consumers that
+    need a WAV, such as Resolve inserts, call restore() first.
+    """
+
+    # Interval between passes (triggering wakes the worker immediately)
+    POLL_SEC = 600.0
+    # Delay of the first pass, to stay out of the way during startup
+    STARTUP_DELAY_SEC = 30.0
+    # Records fetched per query
+    BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        config: SystemConfig,
+        database,
+        on_moved: Optional[Callable[[int, str], None]] = None,
+        audio_cache=None,
+    ):
+        self.config = config
+        self.database = database
+        self.on_moved = on_moved
+        self.audio_cache = audio_cache
+
+        # One file operation at a time (passes vs. restores)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._shutdown_flag = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Paths replaced but not removed yet -> archived record ID (or None)
+        self._leftovers = {}
+        self.running = False
+        self.last_run: Optional[dict] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.archive_after_days > 0
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._worker_loop, name="AudioArchiver", daemon=True
+        )
+        self._thread.start()
+
+    def trigger(self):
+        """Starts a pass now instead of at the next interval."""
+        self.start()
+        self._wake.set()
+
+    def shutdown(self, timeout: float = 5.0):
+        self._shutdown_flag.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                print("[Archiver] Worker did not exit cleanly.")
+
+    def _worker_loop(self):
+        timeout = self.STARTUP_DELAY_SEC
+        while not self._shutdown_flag.is_set():
+            self._wake.wait(timeout=timeout)
+            self._wake.clear()
+            timeout = self.POLL_SEC
+            if self._shutdown_flag.is_set():
+                break
+            if self.enabled:
+                try:
+                    self.run_once()
+                except Exception as e:
+                    print(f"[Archiver] Pass failed: {e}")
+
+    def run_once(self) -> dict:
+        """Archives every due WAV and returns the counters of the pass."""
+        stats = {
+            "started_at": time.time(),
+            "duration_sec": 0.0,
+            "archived": 0,
+            "failed": 0,
+            "original_bytes": 0,
+            "archived_bytes": 0,
+            "freed_bytes": 0,
+        }
+        self.running = True
+        try:
+            self._remove_leftovers()
+            older_than = self.config.archive_after_days * 86400
+            after_id = 0
+            while not self._shutdown_flag.is_set() and self.enabled:
+                batch = self.database.get_archive_candidates(
+                    older_than, after_id, self.BATCH_SIZE
+                )
+                if not batch:
+                    break
+                for db_id, filename in batch:
+                    if self._shutdown_flag.is_set():
+                        break
+                    after_id = db_id
+                    try:
+                        sizes = self._archive(db_id, filename, older_than)
+                    except Exception as e:
+                        print(f"[Archiver] Failed to archive {filename}: {e}")
+                        stats["failed"] += 1
+                        continue
+                    if sizes:
+                        stats["archived"] += 1
+                        stats["original_bytes"] += sizes[0]
+                        stats["archived_bytes"] += sizes[1]
+                        stats["freed_bytes"] += sizes[2]
+        finally:
+            self.running = False
+            stats["duration_sec"] = round(time.time() - stats["started_at"], 3)
+            self.last_run = stats
+
+        if stats["archived"]:
+            print(
+                f"[Archiver] Archived {stats['archived']} files: "
+                f"{stats['original_bytes'] / 1e6:.1f} MB -> {stats['archived_bytes'] / 1e6:.1f} MB "
+                f"({stats['freed_bytes'] / 1e6:.1f} MB freed)"
+            )
+        return stats
+
+    def _archive(self, db_id: int, filename: str, older_than: float) -> Optional[tuple]:
+        """Returns (original size, archived size, freed bytes), or None if skipped."""
+        output_dir = self.config.output_dir
+        wav_path = os.path.join(output_dir, filename)
+        try:
+            stat = os.stat(wav_path)
+        except OSError:
+            return None  # Missing files are re-synthesized on demand
+        if time.time() - stat.st_mtime < older_than:
+            return None
+
+        with self._lock:
+            archive_path = encode_file(wav_path, self.config.archive_format)
+            archive_name = (
+                os.path.splitext(filename)[0] + os.path.splitext(archive_path)[1]
+            )
+            if not self.database.replace_output_path(db_id, filename, archive_name):
+                self._remove(archive_path)
+                return None
+            self._leftovers.pop(archive_path, None)
+            archived_size = os.path.getsize(archive_path)
+            if self.audio_cache:
+                # Otherwise the cache keeps the whole WAV alive on disk
+                self.audio_cache.release(filename)
+            freed = self._remove(wav_path, db_id)
+            self.database.record_archive(
+                db_id,
+                archive_name,
+                archive_name.rsplit(".", 1)[-1],
+                stat.st_size,
+                archived_size,
+                freed,
+            )
+
+        if self.on_moved:
+            self.on_moved(db_id, archive_name)
+        return stat.st_size, archived_size, freed
+
+    def restore(self, db_id: int) -> Optional[str]:
+        """
+        Decodes a record's archived file back to a WAV and points the record
+        at it. Returns the record's (WAV) output_path.
+        """
+        with self._lock:
+            record = self.database.get_transcription(db_id)
+            filename = record.output_path if record else None
+            if not filename or not is_archived(filename):
+                return filename
+
+            archive_path = os.path.join(self.config.output_dir, filename)
+            wav_path = decode_file(archive_path)
+            wav_name = os.path.splitext(filename)[0] + ".wav"
+            self._leftovers.pop(wav_path, None)
+            if not self.database.replace_output_path(db_id, filename, wav_name):
+                raise ValueError(f"Audio of ID {db_id} changed while restoring")
+            self._remove(archive_path)
+            print(f"[Archiver] Restored {wav_name}")
+
+        if self.on_moved:
+            self.on_moved(db_id, wav_name)
+        return wav_name
+
+    def _remove(self, path: str, db_id: Optional[int] = None) -> int:
+        """
+        Removes a file and returns the bytes freed: 0 if other hardlinks
+        still hold its data, or if removal failed and was deferred.
+        """
+        try:
+            stat = os.stat(path)
+            os.remove(path)
+        except FileNotFoundError:
+            return 0
+        except OSError:
+            self._leftovers[path] = db_id
+            return 0
+        return stat.st_size if stat.st_nlink == 1 else 0
+
+    def _remove_leftovers(self):
+        with self._lock:
+            for path, db_id in list(self._leftovers.items()):
+                del self._leftovers[path]
+                freed = self._remove(path, db_id)
+                if freed and db_id is not None:
+                    self.database.add_archive_freed(db_id, freed)
+
+    def get_report(self) -> dict:
+        """Settings, totals of the archived files and the last pass."""
+        files, original_bytes, archived_bytes, freed_bytes = (
+            self.database.get_archive_totals()
+        )
+        return {
+            "enabled": self.enabled,
+            "format": self.config.archive_format,
+            "after_days": self.config.archive_after_days,
+            "running": self.running,
+            "archived_files": files,
+            "original_bytes": original_bytes,
+            "archived_bytes": archived_bytes,
+            "freed_bytes": freed_bytes,
+            # Disk actually given back, minus what the archives take up
+            "saved_bytes": freed_bytes - archived_bytes,
+            "ratio": (
+                round(archived_bytes / original_bytes, 4) if original_bytes else 0.0
+            ),
+            "pending_removal": len(self._leftovers),
+            "last_run": self.last_run,
+        }
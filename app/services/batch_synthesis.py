@@ -0,0 +1,168 @@
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, List, Optional
+
+from app.config.schemas import SynthesisConfig
+
+
+class BatchSynthesizer:
+    """
+    Pre-renders many pending records at once (`/api/control/synthesize_batch`).
+
+    Records whose audio is already in the content-addressed cache are completed
+    first, without a VOICEVOX round-trip. The rest are synthesized by a pool of
+    `synthesis.batch_concurrency` threads, so VOICEVOX never sees more than
+    that many concurrent requests from a batch. Progress is published as
+    `synthesis_batch_progress` events. Only one batch runs at a time.
+    """
+
+    def __init__(
+        self,
+        synthesize: Callable[[int], tuple],
+        synthesize_cached: Callable[[int], Optional[tuple]],
+        config: SynthesisConfig,
+        publish: Optional[Callable[[str, dict], None]] = None,
+    ):
+        self.synthesize = synthesize
+        self.synthesize_cached = synthesize_cached
+        self.config = config
+        if publish is None:
+            from app.core.events import event_manager
+
+            publish = event_manager.publish
+        self.publish = publish
+
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+        self._job: Optional[dict] = None
+        self._thread: Optional[threading.Thread] = None
+        self._cancel = threading.Event()
+
+    def start(self, ids: Iterable[int]) -> dict:
+        """
+        Starts a batch in the background and returns its initial status.
+        Raises RuntimeError if a batch is already running.
+        """
+        ids = list(dict.fromkeys(ids))  # Drop duplicates, keep order
+        with self._lock:
+            if self.is_running():
+                raise RuntimeError("Batch synthesis is already running")
+            self._cancel.clear()
+            self._job = {
+                "job_id": next(self._job_ids),
+                "state": "running",
+                "total": len(ids),
+                "completed": 0,
+                "cached": 0,
+                "failed": 0,
+                "failed_ids": [],
+            }
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._job, ids),
+                name=f"BatchSynthesis-{self._job['job_id']}",
+                daemon=True,
+            )
+            status = self._snapshot()
+            # Announce before the worker can publish progress
+            print(f"[BatchSynthesis] Job {status['job_id']}: {len(ids)} item(s)")
+            self.publish("synthesis_batch_progress", status)
+            self._thread.start()
+        return status
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_status(self) -> Optional[dict]:
+        """Status of the current (or last) batch, or None if none ran yet."""
+        with self._lock:
+            return self._snapshot() if self._job else None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the running batch to finish. Returns False on timeout."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def cancel(self):
+        """Stops starting new items; in-flight VOICEVOX requests still finish."""
+        self._cancel.set()
+
+    def shutdown(self, timeout: float = 2.0):
+        self.cancel()
+        if not self.wait(timeout):
+            print("[BatchSynthesis] Worker did not exit cleanly.")
+
+    def _run(self, job: dict, ids: List[int]):
+        misses = []
+        # 1. Cache hits complete immediately and never occupy a VOICEVOX slot
+        for db_id in ids:
+            if self._cancel.is_set():
+                break
+            try:
+                result = self.synthesize_cached(db_id)
+            except Exception as e:
+                print(f"[BatchSynthesis] Skipped ID {db_id}: {e}")
+                self._record(job, db_id, failed=True)
+                continue
+            if result is None:
+                misses.append(db_id)
+            else:
+                self._record(job, db_id, cached=True)
+
+        # 2. Everything else goes to VOICEVOX, `batch_concurrency` at a time
+        if misses and not self._cancel.is_set():
+            with ThreadPoolExecutor(
+                max_workers=self.config.batch_concurrency,
+                thread_name_prefix="BatchSynthesisWorker",
+            ) as pool:
+                futures = {pool.submit(self._synthesize_one, i): i for i in misses}
+                for future in as_completed(futures):
+                    ok = future.result()
+                    if ok is not None:  # None: cancelled before it started
+                        self._record(job, futures[future], failed=not ok)
+
+        with self._lock:
+            job["state"] = "cancelled" if self._cancel.is_set() else "done"
+            status = self._snapshot()
+        print(
+            f"[BatchSynthesis] Job {job['job_id']} {job['state']}: "
+            f"{job['completed']}/{job['total']} "
+            f"({job['cached']} cached, {job['failed']} failed)"
+        )
+        self.publish("synthesis_batch_progress", status)
+
+    def _synthesize_one(self, db_id: int) -> Optional[bool]:
+        # Returns True on success, False on error, None if cancelled
+        if self._cancel.is_set():
+            return None
+        try:
+            self.synthesize(db_id)
+            return True
+        except Exception as e:
+            print(f"[BatchSynthesis] Synthesis Error (ID {db_id}): {e}")
+            return False
+
+    def _record(self, job: dict, db_id: int, cached=False, failed=False):
+        with self._lock:
+            if failed:
+                job["failed"] += 1
+                job["failed_ids"].append(db_id)
+            else:
+                job["completed"] += 1
+                if cached:
+                    job["cached"] += 1
+            status = self._snapshot()
+        self.publish("synthesis_batch_progress", status)
+
+    def _snapshot(self) -> dict:
+        # Call with the lock held
+        job = self._job
+        return {
+            **job,
+            "failed_ids": list(job["failed_ids"]),
+            "remaining": job["total"] - job["completed"] - job["failed"],
+        }
@@ -121,8 +121,11 @@ def handle_control_state_logic(
     return config_manager.is_synthesis_enabled
 
 
-def ensure_audio_file(db_id: int, audio_manager, processor) -> str:
-    """Check if file exists by DB ID, if not, trigger synthesis."""
+def ensure_audio_file(db_id: int, audio_manager, processor, on_chunk=None) -> str:
+    """
+    Check if file exists by DB ID, if not, trigger synthesis.
+    `on_chunk` is passed on to processor.synthesize_item().
+    """
     # 1. Fetch from DB
     from app.core.database import db_manager
 
@@ -140,7 +143,8 @@ def ensure_audio_file(db_id: int, audio_manager, processor) -> str:
         print(
             f"[Service] Audio missing/pending for ID {db_id}. Triggering synthesis..."
         )
-        new_filename, _ = processor.synthesize_item(db_id)
+        with processor.prefetcher.interactive():
+            new_filename, _ = processor.synthesize_item(db_id, on_chunk=on_chunk)
         return new_filename
 
     abs_path = os.path.join(output_dir, filename)
@@ -149,17 +153,32 @@ def ensure_audio_file(db_id: int, audio_manager, processor) -> str:
         print(
             f"[Service] File recorded but missing on disk for ID {db_id}. Retriggering..."
         )
-        new_filename, _ = processor.synthesize_item(db_id)
+        with processor.prefetcher.interactive():
+            new_filename, _ = processor.synthesize_item(db_id, on_chunk=on_chunk)
         return new_filename
 
     return filename
 
 
+def synthesize_batch_handler(ids, vv_client, processor, database) -> dict:
+    """Starts pre-rendering the given (or all pending) records in the background."""
+    if ids is None:
+        ids = database.get_pending_ids()
+    if ids and not vv_client.is_available():
+        raise ConnectionError("VOICEVOX is disconnected. Please start VOICEVOX.")
+    return processor.batch_synthesizer.start(ids)
+
+
 def resolve_insert_handler(
-    db_id: int, audio_manager, processor, get_resolve_client, database
+    db_id: int, audio_manager, processor, get_resolve_client, database, archiver=None
 ):
-    """Inserts a file into Resolve by ID, synthesizing if necessary."""
+    """
+    Inserts a file into Resolve by ID, synthesizing if necessary.
+    Archived (FLAC/Opus) files are restored to WAV first.
+    """
     filename = ensure_audio_file(db_id, audio_manager, processor)
+    if archiver is not None:
+        filename = archiver.restore(db_id) or filename
 
     transcription = database.get_transcription(db_id)
     if not transcription:
@@ -179,21 +198,31 @@ def resolve_insert_handler(
 
 
 def play_audio_handler(db_id: int, audio_manager, processor, request_id: str = None):
-    """Plays an audio file by ID, synthesizing if necessary."""
-    filename = ensure_audio_file(db_id, audio_manager, processor)
+    """
+    Plays an audio file by ID, synthesizing if necessary. A text synthesized
+    in sentence chunks starts playing with its first chunk.
+    """
+    streamed = []
+
+    def play_chunk(index, data, filename):
+        streamed.append(audio_manager.play_data(data, filename, request_id=request_id))
+
+    filename = ensure_audio_file(db_id, audio_manager, processor, on_chunk=play_chunk)
+    if streamed:
+        return sum(duration for duration, _ in streamed), streamed[0][1]
     return audio_manager.play_audio(filename, request_id=request_id)
 
 
 def delete_audio_handler(db_id: int, audio_manager, processor):
     """Deletes an audio file and its log entry by ID."""
+    # processor.delete_log publishes the log_deleted event
     filename = processor.delete_log(db_id)
     success = False
     if filename:
         success = audio_manager.delete_file(filename)
-
-    from app.core.events import event_manager
-
-    event_manager.publish("log_update", {})
+    if success and processor.audio_cache:
+        # Its blob may now be held by the cache alone
+        processor.audio_cache.evict()
     return [filename] if (filename and success) else []
 
 
@@ -204,12 +233,7 @@ def update_text_handler(db_id: int, new_text: str, processor):
 
     if not db_manager.get_transcription(db_id):
         # We also need to check cache for the sake of tests that might skip DB
-        found_in_cache = False
-        for log in processor.received_logs:
-            if log.get("id") == db_id:
-                found_in_cache = True
-                break
-        if not found_in_cache:
+        if not processor.find_log(db_id):
             raise ValueError(f"Transcription ID {db_id} not found")
 
     processor.update_log_text(db_id, new_text)
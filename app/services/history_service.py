@@ -0,0 +1,42 @@
+from app.api.schemas.history import ExportRequest, IdRangeRequest, PhonemesResponse
+from app.core.export import export_filename, export_history
+from app.core.phonemes import PhonemeTimeline
+
+# Upper bound for the records of one /api/phonemes response
+PHONEMES_MAX_RECORDS = 5000
+
+
+def get_phonemes_handler(req: IdRangeRequest, database) -> PhonemesResponse:
+    """Phoneme timelines of the records in the ID range."""
+    rows = database.get_phonemes_range(req.start_id, req.end_id, PHONEMES_MAX_RECORDS)
+    timelines = []
+    for db_id, value in rows:
+        try:
+            timeline = PhonemeTimeline.load(value)
+        except (ValueError, KeyError, TypeError):
+            continue
+        timelines.append({"id": db_id, **timeline.to_json()})
+    return PhonemesResponse(
+        timelines=timelines, truncated=len(rows) == PHONEMES_MAX_RECORDS
+    )
+
+
+def export_handler(
+    req: ExportRequest, database, output_dir: str, synthesis_config
+) -> tuple:
+    """
+    Subtitles or concatenated audio of the ID range, in the output format
+    of `synthesis_config`. Returns (chunk generator, mimetype, content
+    length or None, download filename); raises ValueError for a WAV over 4 GB.
+    """
+    body, mimetype, length = export_history(
+        database,
+        output_dir,
+        req.export_format,
+        req.start_id,
+        req.end_id,
+        synthesis_config.output_sample_rate,
+        synthesis_config.output_channels,
+    )
+    filename = export_filename(req.export_format, req.start_id, req.end_id)
+    return body, mimetype, length, filename
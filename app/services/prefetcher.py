@@ -0,0 +1,142 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+
+from app.config.schemas import SynthesisConfig
+
+
+class SynthesisPrefetcher:
+    """
+    Low-priority background synthesis for `timing == "on_demand"`.
+
+    While VOICEVOX is idle, synthesizes the newest `synthesis.prefetch_count`
+    pending records one at a time, so that a later play/insert click only
+    has to open the file. Interactive synthesis always wins: no prefetch is
+    started while one is in flight or within `IDLE_SEC` after it, so a click
+    waits for at most the single prefetch request already running.
+
+    `synthesis.prefetch_duty_cycle` bounds the share of time the prefetcher
+    keeps the engine busy: after an item that took t seconds it rests for
+    t * (1 - duty) / duty seconds.
+    """
+
+    # Quiet period after interactive synthesis before prefetching resumes
+    IDLE_SEC = 1.0
+    # Re-check interval while idle (new records also wake the worker)
+    POLL_SEC = 5.0
+    # Failed records are not retried for this long
+    RETRY_AFTER_SEC = 60.0
+
+    def __init__(
+        self,
+        synthesize: Callable[[int], tuple],
+        get_candidates: Callable[[int], List[int]],
+        config: SynthesisConfig,
+        is_available: Optional[Callable[[], bool]] = None,
+    ):
+        self.synthesize = synthesize
+        self.get_candidates = get_candidates
+        self.config = config
+        self.is_available = is_available or (lambda: True)
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._shutdown_flag = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._interactive = 0
+        self._last_interactive = 0.0
+        self._failed = {}  # db_id -> monotonic time of failure
+        self.prefetched = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.timing == "on_demand" and self.config.prefetch_count > 0
+
+    def notify(self):
+        """Wakes the worker, e.g. after a new pending record was stored."""
+        if self._shutdown_flag.is_set() or not self.enabled:
+            return
+        self._ensure_started()
+        self._wake.set()
+
+    @contextmanager
+    def interactive(self):
+        """Marks a user-facing synthesis; prefetching pauses until it is over."""
+        with self._lock:
+            self._interactive += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._interactive -= 1
+                self._last_interactive = time.monotonic()
+            self._wake.set()
+
+    def shutdown(self, timeout: float = 2.0):
+        self._shutdown_flag.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                print("[Prefetcher] Worker did not exit cleanly.")
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._worker_loop, name="SynthesisPrefetcher", daemon=True
+            )
+            self._thread.start()
+
+    def _idle_wait(self) -> float:
+        """Seconds to wait before VOICEVOX counts as idle (0 if it is)."""
+        with self._lock:
+            if self._interactive:
+                return self.IDLE_SEC
+            return max(0.0, self._last_interactive + self.IDLE_SEC - time.monotonic())
+
+    def _next_candidate(self) -> Optional[int]:
+        now = time.monotonic()
+        self._failed = {
+            db_id: t
+            for db_id, t in self._failed.items()
+            if now - t < self.RETRY_AFTER_SEC
+        }
+        for db_id in self.get_candidates(self.config.prefetch_count):
+            if db_id not in self._failed:
+                return db_id
+        return None
+
+    def _worker_loop(self):
+        while not self._shutdown_flag.is_set():
+            self._wake.wait(timeout=self.POLL_SEC)
+            self._wake.clear()
+
+            while self.enabled and not self._shutdown_flag.is_set():
+                wait = self._idle_wait()
+                if wait > 0:
+                    # Yield to interactive requests; re-check once they settle
+                    self._shutdown_flag.wait(wait)
+                    continue
+                if not self.is_available():
+                    break
+
+                db_id = self._next_candidate()
+                if db_id is None:
+                    break
+
+                start = time.monotonic()
+                try:
+                    self.synthesize(db_id)
+                    self.prefetched += 1
+                    print(f"[Prefetcher] Pre-synthesized ID {db_id}")
+                except Exception as e:
+                    self._failed[db_id] = time.monotonic()
+                    print(f"[Prefetcher] Skipped ID {db_id}: {e}")
+
+                # Stay within the duty-cycle budget
+                duty = self.config.prefetch_duty_cycle
+                busy = time.monotonic() - start
+                self._shutdown_flag.wait(busy * (1 - duty) / duty)
@@ -1,24 +1,74 @@
+import asyncio
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Callable, Dict, List, Optional
 from app.config.schemas import SynthesisConfig
 from app.core.voicevox import VoiceVoxClient, VoiceVoxAudioQuery
 from app.core.audio import AudioManager
 from app.core.database import db_manager, Transcription
+from app.core.audio_cache import AudioCache
+from app.core.json_stream import JsonStreamParser
+from app.core.single_flight import SingleFlight
+from app.core.phonemes import PhonemeTimeline, extract_timeline
+from app.core.resample import convert_wav
+from app.core.scheduler import Priority
+from app.core.text_chunks import split_text
+from app.core.wav import concat_wav, parse_wav_header
+from app.services.synthesis_queue import SynthesisQueue
+from app.services.batch_synthesis import BatchSynthesizer
+from app.services.prefetcher import SynthesisPrefetcher
 
 
 class StreamProcessor:
+    # Number of most recent entries kept in memory for the WebUI
+    LOG_WINDOW_SIZE = 50
+    # Upper bound for a single /api/logs page
+    MAX_PAGE_SIZE = 200
+    # Sentence chunks of one record rendered at once (the VOICEVOX scheduler
+    # still bounds the requests actually in flight)
+    CHUNK_WORKERS = 4
+    # (sample rate, channels) of the WAV files before the format was configurable
+    DEFAULT_OUTPUT_FORMAT = (48000, 2)
+
     def __init__(
         self,
         voicevox_client: VoiceVoxClient,
         audio_manager: AudioManager,
         synthesis_config: SynthesisConfig,
+        audio_cache: Optional[AudioCache] = None,
     ):
         self.vv_client = voicevox_client
         self.audio_manager = audio_manager
         self.synthesis_config = synthesis_config
-        self.received_logs = []
+        self.audio_cache = audio_cache
+        # Hot window of recent entries (oldest first) with an id -> entry index
+        self._received_logs: List[dict] = []
+        self._log_index: Dict[int, dict] = {}
+        # Sequence number of log delta events (lets clients detect gaps)
+        self._log_seq = 0
+        self._log_seq_lock = threading.Lock()
+        # Concurrent synthesize_item calls for one record share a single run
+        self._synthesis_flight = SingleFlight()
+        # VOICEVOX priority of each in-flight synthesis (raised when a more
+        # urgent caller joins it)
+        self._flight_priority = {}
+        self.synthesis_queue = SynthesisQueue(
+            self._at_priority(Priority.LIVE, self.synthesize_item), synthesis_config
+        )
+        self.batch_synthesizer = BatchSynthesizer(
+            self._at_priority(Priority.BACKGROUND, self.synthesize_item),
+            self._at_priority(Priority.BACKGROUND, self.synthesize_from_cache),
+            synthesis_config,
+        )
+        self.prefetcher = SynthesisPrefetcher(
+            self._at_priority(Priority.BACKGROUND, self.synthesize_item),
+            lambda n: db_manager.get_pending_ids(limit=n, newest_first=True),
+            synthesis_config,
+            is_available=self.vv_client.is_available,
+        )
 
         # Load history from Database
         self._load_history()
@@ -26,7 +76,7 @@ class StreamProcessor:
     def _load_history(self):
         try:
             print("Loading history from database...")
-            db_logs = db_manager.get_recent_logs(limit=50)
+            db_logs = db_manager.get_recent_logs(limit=self.LOG_WINDOW_SIZE)
             output_dir = self.audio_manager.get_output_dir()
             print(f"  -> Loading from: {output_dir}")
 
@@ -50,38 +100,9 @@ class StreamProcessor:
                     else:
                         print(f"  -> File OK: {filename}")
 
-                log_entry = {
-                    "id": transcription.id,
-                    "timestamp": (
-                        f"{transcription.timestamp}Z"
-                        if not transcription.timestamp.endswith("Z")
-                        else transcription.timestamp
-                    ).replace(" ", "T"),
-                    "text": transcription.text,
-                    "duration": f"{duration:.2f}s",
-                    "config": {
-                        "speaker_id": transcription.speaker_id,
-                        "speed_scale": transcription.speed_scale,
-                        "pitch_scale": transcription.pitch_scale,
-                        "intonation_scale": transcription.intonation_scale,
-                        "volume_scale": transcription.volume_scale,
-                        "pre_phoneme_length": transcription.pre_phoneme_length,
-                        "post_phoneme_length": transcription.post_phoneme_length,
-                        "pause_length_scale": transcription.pause_length_scale,
-                    },
-                    "speaker_info": self._format_speaker_info(
-                        transcription.speaker_id,
-                        transcription.speaker_name,
-                        transcription.speaker_style,
-                    ),
-                    "filename": (
-                        filename
-                        if (filename and duration >= 0)
-                        else f"pending_{transcription.id}.wav"
-                    ),
-                    "is_generated": (duration >= 0),
-                }
-                self.received_logs.append(log_entry)
+                self._append_log(
+                    self._build_log_entry(transcription, filename, duration)
+                )
 
         except Exception as e:
             print(f"Error loading history from DB: {e}")
@@ -89,33 +110,44 @@ class StreamProcessor:
     def reload_history(self):
         """Clear current logs and reload."""
         print("Reloading history logs...")
+        # Queued IDs belong to the previous database, drop them
+        self.synthesis_queue.clear()
+        self.batch_synthesizer.cancel()
         self.received_logs = []
         self._load_history()
+        # Clients replace their list entirely
+        self._publish_log_event("log_update", {})
 
     def process_stream(self, stream_iterator):
-        buffer = ""
+        parser = JsonStreamParser()
         for chunk in stream_iterator:
             if chunk:
-                buffer += chunk.decode("utf-8", errors="ignore")
-
-                while "}" in buffer:
-                    brace_index = buffer.find("}")
-                    json_str = buffer[: brace_index + 1]
-                    buffer = buffer[brace_index + 1 :]
+                for data in parser.feed(chunk):
+                    try:
+                        self._process_json_object(data)
+                    except Exception as e:
+                        print(f"Error processing chunk: {e}")
+                        continue
 
+    async def process_stream_async(self, chunks):
+        """
+        process_stream for the ASGI receiver: chunks arrive on the event loop,
+        and each transcription is handled on a worker thread so database and
+        VOICEVOX work never blocks the loop.
+        """
+        parser = JsonStreamParser()
+        async for chunk in chunks:
+            if chunk:
+                for data in parser.feed(chunk):
                     try:
-                        self._process_json_chunk(json_str)
+                        await asyncio.to_thread(self._process_json_object, data)
                     except Exception as e:
                         print(f"Error processing chunk: {e}")
                         continue
 
-    def _process_json_chunk(self, json_str):
-        try:
-            data = json.loads(json_str)
-            if "text" in data:
-                self._handle_transcription(data)
-        except json.JSONDecodeError:
-            pass
+    def _process_json_object(self, data):
+        if isinstance(data, dict) and "text" in data:
+            self._handle_transcription(data)
 
     def _prepare_query_data(
         self, text: str, speaker_id: int, config_dict: dict
@@ -124,6 +156,7 @@ class StreamProcessor:
         Executes audio_query and applies provided config scales.
         Returns VoiceVoxAudioQuery model if successful, or None if failed.
         """
+        # Cached health state (kept fresh by the VOICEVOX poller), no extra probe
         if not self.vv_client.is_available():
             print("[Processor] VOICEVOX is not available for query.")
             return None
@@ -175,69 +208,97 @@ class StreamProcessor:
         db_id = db_manager.add_transcription(t)
         t.id = db_id
 
-        generated_file = None
-        actual_duration = -1.0
-        timing = self.synthesis_config.timing
+        # 3. Add to UI logs (pending until the synthesis worker finishes)
+        self._add_log_from_db(t)
 
+        timing = self.synthesis_config.timing
         if timing == "immediate":
-            try:
-                # 4. Synthesis
-                generated_file, actual_duration = self.synthesize_item(db_id)
-                print(
-                    f"  -> Immediate Generated: {generated_file} ({actual_duration:.2f}s)"
-                )
-
-            except Exception as e:
-                print(f"Synthesis Error: {e}")
-                generated_file = "Error"
-        else:
-            if timing == "on_demand":
-                print(f"  -> Delayed (on_demand): {db_id}")
+            # 4. Hand off to the synthesis workers so ingestion never waits on VOICEVOX
+            if self.synthesis_queue.submit(db_id):
+                print(f"  -> Queued for synthesis: {db_id}")
             else:
-                print("  -> Synthesis Skipped (Disabled)")
-
-        # 7. Add to UI logs
-        t.audio_duration = actual_duration
-        t.output_path = generated_file
-        self._add_log_from_db(t)
+                print(f"  -> Synthesis queue unavailable, left pending: {db_id}")
+        elif timing == "on_demand":
+            print(f"  -> Delayed (on_demand): {db_id}")
+            self.prefetcher.notify()
+        else:
+            print("  -> Synthesis Skipped (Disabled)")
 
-    def _extract_phonemes(self, query: VoiceVoxAudioQuery) -> list:
+    def _extract_phonemes(self, query: VoiceVoxAudioQuery) -> PhonemeTimeline:
         """Extract phonemes with cumulative start times (seconds)."""
-        phonemes = []
-        try:
-            current_time = query.prePhonemeLength
-            speed_scale = query.speedScale
-
-            for phrase in query.accent_phrases:
-                for mora in phrase.get("moras", []):
-                    # Consonant
-                    if mora.get("consonant"):
-                        phonemes.append(
-                            {"t": round(current_time, 3), "p": str(mora["consonant"])}
-                        )
-                        current_time += (
-                            mora.get("consonant_length") or 0.0
-                        ) / speed_scale
-
-                    # Vowel
-                    if mora.get("vowel"):
-                        phonemes.append(
-                            {"t": round(current_time, 3), "p": str(mora["vowel"])}
-                        )
-                        current_time += (mora.get("vowel_length") or 0.0) / speed_scale
+        return extract_timeline(
+            query.accent_phrases,
+            float(query.prePhonemeLength),
+            float(query.speedScale),
+            float(query.pauseLengthScale),
+        )
+
+    def synthesize_item(self, db_id: int, on_chunk: Optional[Callable] = None):
+        """
+        Perform synthesis for an existing DB record and save the file.
+        Callers racing on the same record (double-clicks, play vs. insert,
+        several tabs, prefetch) wait for the one in-flight synthesis.
 
-                # Pause after accent phrase
-                pause_mora = phrase.get("pause_mora")
-                if pause_mora:
-                    pause_len = (pause_mora.get("vowel_length") or 0.0) / speed_scale
-                    current_time += pause_len * query.pauseLengthScale
-        except (AttributeError, TypeError, ValueError):
-            return []
+        When the text is synthesized in sentence chunks, `on_chunk(index,
+        wav_bytes, filename)` receives each chunk in order as soon as it is
+        ready (only if this call runs the synthesis itself).
+        """
+        while True:
+            self._boost_flight(db_id)
+            result = self._synthesis_flight.do(
+                db_id, lambda: self._lead_synthesis(db_id, on_chunk=on_chunk)
+            )
+            if result is not None:
+                return result
+            # Joined a cache-only lookup that missed; synthesize now
+
+    def synthesize_from_cache(self, db_id: int) -> Optional[tuple]:
+        """
+        Completes a pending record from the audio cache only, without calling
+        VOICEVOX. Returns (filename, duration), or None if it is not cached.
+        """
+        if not self.audio_cache:
+            return None
+        return self._synthesis_flight.do(
+            db_id, lambda: self._lead_synthesis(db_id, cache_only=True)
+        )
+
+    def _at_priority(self, level: Priority, fn):
+        """Wraps fn so its VOICEVOX requests run in the given scheduler class."""
 
-        return phonemes
+        def run(db_id: int):
+            with self.vv_client.scheduler.priority(level):
+                return fn(db_id)
 
-    def synthesize_item(self, db_id: int):
-        """Perform synthesis for an existing DB record and save the file."""
+        return run
+
+    def _lead_synthesis(
+        self,
+        db_id: int,
+        cache_only: bool = False,
+        on_chunk: Optional[Callable] = None,
+    ):
+        scheduler = self.vv_client.scheduler
+        with scheduler.priority(scheduler.current().level) as ctx:
+            self._flight_priority[db_id] = ctx
+            try:
+                return self._synthesize(db_id, cache_only, on_chunk)
+            finally:
+                self._flight_priority.pop(db_id, None)
+
+    def _boost_flight(self, db_id: int):
+        """A play joining a background synthesis must not wait behind bulk work."""
+        ctx = self._flight_priority.get(db_id)
+        if ctx is not None:
+            scheduler = self.vv_client.scheduler
+            scheduler.boost(ctx, scheduler.current().level)
+
+    def _synthesize(
+        self,
+        db_id: int,
+        cache_only: bool = False,
+        on_chunk: Optional[Callable] = None,
+    ) -> Optional[tuple]:
         # 1. Fetch exactly what we need from DB using Model
         t = db_manager.get_transcription(db_id)
         if not t:
@@ -246,11 +307,139 @@ class StreamProcessor:
         if t.audio_duration > 0:
             return t.output_path, t.audio_duration
 
-        print(f"On-demand Synthesis: ID={db_id} Text='{t.text}'")
+        if not cache_only:
+            print(f"On-demand Synthesis: ID={db_id} Text='{t.text}'")
 
         # 2. Reconstruct parameters from Model
         text = t.text
         speaker_id = t.speaker_id
+        item_config, content_hash, wav_filename = self._item_params(db_id, t)
+
+        # 3. Identical text + parameters reuse cached audio without touching VOICEVOX
+        cached = self._restore_from_cache(db_id, content_hash, wav_filename)
+        if cached or cache_only:
+            return cached
+
+        # 4. VoiceVox Query & Synthesis using common logic
+        try:
+            chunks = split_text(text, self.synthesis_config.chunk_max_chars)
+            if len(chunks) > 1:
+                audio_data, new_kana, timeline = self._synthesize_chunks(
+                    chunks, speaker_id, item_config, wav_filename, on_chunk
+                )
+            else:
+                query = self._prepare_query_data(text, speaker_id, item_config)
+                if not query:
+                    raise RuntimeError(
+                        "Failed to prepare query data (VOICEVOX offline?)"
+                    )
+
+                new_kana = str(query.kana) if query.kana else None
+                timeline = self._extract_phonemes(query)
+                audio_data = self._engine_synthesis(query, speaker_id)
+            new_phonemes = timeline.to_bytes()
+
+            if self.synthesis_config.local_resampling:
+                audio_data = convert_wav(
+                    audio_data,
+                    self.synthesis_config.output_sample_rate,
+                    self.synthesis_config.output_channels,
+                )
+        except Exception as e:
+            print(f"[Processor] Synthesis CRITICAL Error for ID {db_id}: {e}")
+            raise
+
+        # Save & register in the content-addressed cache
+        actual_duration = self.audio_manager.save_audio(audio_data, wav_filename)
+        if self.audio_cache:
+            self.audio_cache.store(
+                content_hash,
+                wav_filename,
+                actual_duration,
+                kana=new_kana,
+                phonemes=new_phonemes,
+            )
+
+        return self._complete_item(
+            db_id, wav_filename, actual_duration, new_kana, new_phonemes
+        )
+
+    def _synthesize_chunks(
+        self,
+        chunks: List[str],
+        speaker_id: int,
+        item_config: dict,
+        filename: str,
+        on_chunk: Optional[Callable],
+    ) -> tuple:
+        """
+        Synthesizes sentence chunks in parallel and joins them into one WAV.
+        Returns (audio_data, kana, timeline); phoneme times are shifted by
+        the actual duration of the preceding chunks.
+        """
+        scheduler = self.vv_client.scheduler
+        # Chunk requests run in the class of the synthesis (including boosts)
+        ctx = scheduler.current()
+
+        def render(chunk: str):
+            with scheduler.inherit(ctx):
+                query = self._prepare_query_data(chunk, speaker_id, item_config)
+                if not query:
+                    raise RuntimeError(
+                        "Failed to prepare query data (VOICEVOX offline?)"
+                    )
+                return query, self._engine_synthesis(query, speaker_id)
+
+        parts, kana, timelines = [], [], []
+        offset = 0.0
+        workers = min(len(chunks), self.CHUNK_WORKERS)
+        with ThreadPoolExecutor(workers, thread_name_prefix="Chunk") as pool:
+            futures = [pool.submit(render, chunk) for chunk in chunks]
+            try:
+                for index, future in enumerate(futures):
+                    query, data = future.result()
+                    if on_chunk:
+                        try:
+                            on_chunk(index, data, filename)
+                        except Exception as e:
+                            print(f"[Processor] Chunk playback failed: {e}")
+
+                    parts.append(data)
+                    if query.kana:
+                        kana.append(str(query.kana))
+                    timelines.append(self._extract_phonemes(query).shifted(offset))
+                    offset += parse_wav_header(data).duration
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        print(f"  -> Synthesized in {len(chunks)} chunks")
+        return (
+            concat_wav(parts),
+            "、".join(kana) or None,
+            PhonemeTimeline.concat(timelines),
+        )
+
+    def _engine_synthesis(self, query: VoiceVoxAudioQuery, speaker_id: int) -> bytes:
+        """
+        VOICEVOX /synthesis in the output format, or at the engine's native
+        rate in mono when the output format is produced locally.
+        """
+        config = self.synthesis_config
+        if config.local_resampling:
+            return self.vv_client.synthesis(
+                query, speaker_id, sample_rate=None, stereo=False
+            )
+        return self.vv_client.synthesis(
+            query,
+            speaker_id,
+            sample_rate=config.output_sample_rate,
+            stereo=config.output_channels == 2,
+        )
+
+    def _item_params(self, db_id: int, t: Transcription) -> tuple:
+        """(item_config, content_hash, wav_filename) of a record."""
         item_config = t.model_dump(
             include={
                 "speed_scale",
@@ -262,27 +451,37 @@ class StreamProcessor:
                 "pause_length_scale",
             }
         )
+        hash_config = {**item_config, "speaker_id": t.speaker_id}
+        # Only non-default formats take part, so existing hashes stay valid
+        output_format = (
+            self.synthesis_config.output_sample_rate,
+            self.synthesis_config.output_channels,
+        )
+        if output_format != self.DEFAULT_OUTPUT_FORMAT:
+            hash_config["output_format"] = "{}x{}".format(*output_format)
+        content_hash = self._compute_content_hash(t.text, hash_config)
+        wav_filename = self._generate_filename(db_id, t.text, hash_config)
+        return item_config, content_hash, wav_filename
+
+    def _restore_from_cache(
+        self, db_id: int, content_hash: str, wav_filename: str
+    ) -> Optional[tuple]:
+        cached = self.audio_cache.lookup(content_hash) if self.audio_cache else None
+        if not cached or not self.audio_cache.materialize(content_hash, wav_filename):
+            return None
+        print(f"  -> Cache hit: {content_hash[:8]} ({cached.duration:.2f}s)")
+        return self._complete_item(
+            db_id, wav_filename, cached.duration, cached.kana, cached.phonemes
+        )
 
-        # 3. VoiceVox Query & Synthesis using common logic
-        try:
-            query = self._prepare_query_data(text, speaker_id, item_config)
-            if not query:
-                raise RuntimeError("Failed to prepare query data (VOICEVOX offline?)")
-
-            new_kana = str(query.kana) if query.kana else None
-            phonemes = self._extract_phonemes(query)
-            new_phonemes = json.dumps(phonemes)
-
-            audio_data = self.vv_client.synthesis(query, speaker_id)
-        except Exception as e:
-            print(f"[Processor] Synthesis CRITICAL Error for ID {db_id}: {e}")
-            raise
-
-        # 4. Generate Filename & Save
-        wav_filename = self._generate_filename(db_id, text, item_config)
-        actual_duration = self.audio_manager.save_audio(audio_data, wav_filename)
-        generated_file = wav_filename
-
+    def _complete_item(
+        self,
+        db_id: int,
+        generated_file: str,
+        actual_duration: float,
+        new_kana: Optional[str],
+        new_phonemes: Optional[bytes],
+    ) -> tuple:
         # 5. Update DB (including kana/phonemes)
         db_manager.update_audio_info(
             db_id,
@@ -293,35 +492,25 @@ class StreamProcessor:
         )
 
         # 6. Update UI Log Cache
-        for log in self.received_logs:
-            if log.get("id") == db_id:
-                log["filename"] = generated_file
-                log["duration"] = f"{actual_duration:.2f}s"
-                log["is_generated"] = True
-                break
-
-        from app.core.events import event_manager
-
-        event_manager.publish("log_update", {})
+        log = self.find_log(db_id)
+        if log:
+            log["filename"] = generated_file
+            log["duration"] = f"{actual_duration:.2f}s"
+            log["is_generated"] = True
+        self._publish_log_change(db_id, log)
 
         return generated_file, actual_duration
 
-    def _generate_filename(self, db_id: int, text: str, config_dict: dict) -> str:
-        """Generates filename: {id}_{hash}_{prefix}.wav"""
-        import re
+    def _compute_content_hash(self, text: str, config_dict: dict) -> str:
+        """SHA-1 over the text and all synthesis parameters (audio cache key)."""
         import hashlib
-        import json
-
-        # Sanitize text for filename
-        safe_text = re.sub(r'[\\/:*?"<>|]+', "", text)
-        safe_text = safe_text.replace("\n", "").replace("\r", "")
-        prefix_text = safe_text[:8]
 
         # Prepare hash source
         hash_source = {"text": text}
         if config_dict:
             relevant_keys = [
                 "speaker_id",
+                "output_format",
                 "speed_scale",
                 "pitch_scale",
                 "intonation_scale",
@@ -336,16 +525,54 @@ class StreamProcessor:
 
         # Calculate Hash
         hash_str = json.dumps(hash_source, sort_keys=True, ensure_ascii=False)
-        sha1_hash = hashlib.sha1(hash_str.encode("utf-8")).hexdigest()[:8]
+        return hashlib.sha1(hash_str.encode("utf-8")).hexdigest()
+
+    def _generate_filename(self, db_id: int, text: str, config_dict: dict) -> str:
+        """Generates filename: {id}_{hash}_{prefix}.wav"""
+        import re
+
+        # Sanitize text for filename
+        safe_text = re.sub(r'[\\/:*?"<>|]+', "", text)
+        safe_text = safe_text.replace("\n", "").replace("\r", "")
+        prefix_text = safe_text[:8]
+
+        sha1_hash = self._compute_content_hash(text, config_dict)[:8]
 
         return f"{db_id:03d}_{sha1_hash}_{prefix_text}.wav"
 
-    def _add_log_from_db(self, t: Transcription):
-        log_entry = {
+    @property
+    def received_logs(self) -> List[dict]:
+        return self._received_logs
+
+    @received_logs.setter
+    def received_logs(self, logs: List[dict]):
+        self._received_logs = logs
+        self._log_index = {log.get("id"): log for log in logs}
+
+    def _build_log_entry(
+        self,
+        t: Transcription,
+        filename: Optional[str] = None,
+        duration: Optional[float] = None,
+    ) -> dict:
+        """Builds the WebUI representation of a transcription record."""
+        if filename is None:
+            filename = t.output_path
+        if duration is None:
+            duration = t.audio_duration
+
+        if t.timestamp:
+            timestamp = (
+                f"{t.timestamp}Z" if not t.timestamp.endswith("Z") else t.timestamp
+            ).replace(" ", "T")
+        else:
+            timestamp = f"{datetime.now(timezone.utc).isoformat()}Z"
+
+        return {
             "id": t.id,
-            "timestamp": f"{datetime.now(timezone.utc).isoformat()}Z",
+            "timestamp": timestamp,
             "text": t.text,
-            "duration": f"{t.audio_duration:.2f}s",
+            "duration": f"{duration:.2f}s",
             "config": {
                 "speaker_id": t.speaker_id,
                 "speed_scale": t.speed_scale,
@@ -356,27 +583,88 @@ class StreamProcessor:
                 "post_phoneme_length": t.post_phoneme_length,
                 "pause_length_scale": t.pause_length_scale,
             },
-            "filename": (
-                t.output_path
-                if (t.output_path and t.audio_duration >= 0)
-                else f"pending_{t.id}.wav"
-            ),
             "speaker_info": self._format_speaker_info(
                 t.speaker_id, t.speaker_name, t.speaker_style
             ),
-            "is_generated": (t.audio_duration >= 0),
+            "filename": (
+                filename if (filename and duration >= 0) else f"pending_{t.id}.wav"
+            ),
+            "is_generated": (duration >= 0),
         }
 
-        if len(self.received_logs) >= 50:
-            self.received_logs.pop(0)
-        self.received_logs.append(log_entry)
+    def _append_log(self, log_entry: dict):
+        """Adds an entry to the hot window, evicting the oldest one if full."""
+        if len(self._received_logs) >= self.LOG_WINDOW_SIZE:
+            evicted = self._received_logs.pop(0)
+            self._log_index.pop(evicted.get("id"), None)
+        self._received_logs.append(log_entry)
+        self._log_index[log_entry["id"]] = log_entry
+
+    def _add_log_from_db(self, t: Transcription):
+        log_entry = self._build_log_entry(t)
+        self._append_log(log_entry)
+        self._publish_log_event("log_added", {"id": t.id, "entry": log_entry})
 
+    def _publish_log_event(self, event_type: str, data: dict):
+        """
+        Publishes a log event with the next sequence number.
+        Delta events (log_added / log_updated / log_deleted) carry the full
+        entry so clients can apply them without refetching /api/logs.
+        """
         from app.core.events import event_manager
 
-        event_manager.publish("log_update", {})
+        # Publishing under the lock keeps the queue order equal to seq order
+        with self._log_seq_lock:
+            self._log_seq += 1
+            event_manager.publish(event_type, {"seq": self._log_seq, **data})
+
+    def _publish_log_change(self, db_id: int, log: Optional[dict] = None):
+        """Publishes log_updated, reading the entry from DB if it left the window."""
+        if log is None:
+            t = db_manager.get_transcription(db_id)
+            if not t:
+                return
+            log = self._build_log_entry(t)
+        self._publish_log_event("log_updated", {"id": db_id, "entry": log})
+
+    def relocate_audio(self, db_id: int, filename: str):
+        """Points a log entry at its moved audio file (archived or restored)."""
+        log = self.find_log(db_id)
+        if log:
+            log["filename"] = filename
+            self._publish_log_change(db_id, log)
+
+    def find_log(self, db_id: int) -> Optional[dict]:
+        """Returns the in-memory entry for an ID, if it is in the hot window."""
+        return self._log_index.get(db_id)
+
+    def get_logs(
+        self, before: Optional[int] = None, limit: Optional[int] = None
+    ) -> List[dict]:
+        """
+        Returns log entries, oldest first.
+        Without `before`, returns the in-memory window of recent entries
+        (the newest `limit` of them if given). With `before`, returns up to
+        `limit` entries older than that ID straight from the database, so
+        clients can page back through the whole history.
+        """
+        if before is None:
+            if limit is None:
+                return self._received_logs
+            return self._received_logs[-limit:] if limit > 0 else []
+
+        limit = max(1, min(limit or self.LOG_WINDOW_SIZE, self.MAX_PAGE_SIZE))
+        page = db_manager.get_recent_logs(limit=limit, before_id=before)
+        return [
+            self._log_index.get(t.id) or self._build_log_entry(t)
+            for t in reversed(page)
+        ]
 
-    def get_logs(self):
-        return self.received_logs
+    def shutdown(self):
+        """Stops background synthesis workers."""
+        self.synthesis_queue.shutdown()
+        self.batch_synthesizer.shutdown()
+        self.prefetcher.shutdown()
 
     def delete_log(self, db_id: int):
         """Removes from UI list AND Database by ID."""
@@ -385,25 +673,38 @@ class StreamProcessor:
             f"[Processor] Deleting record ID {db_id} from DB (triggered by UI delete)"
         )
         # We need to find the filename before deleting from cache to return it
-        filename = None
-        for log in self.received_logs:
-            if log.get("id") == db_id:
-                filename = log.get("filename")
-                break
+        log = self.find_log(db_id)
+        filename = log.get("filename") if log else None
+        if log is None:
+            # Older entry outside the hot window (paged in by the client)
+            t = db_manager.get_transcription(db_id)
+            if t and t.output_path and t.audio_duration >= 0:
+                filename = t.output_path
 
         db_manager.delete_log(db_id)
 
         # 2. Cache deletion
-        self.received_logs = [
-            log for log in self.received_logs if log.get("id") != db_id
-        ]
-
-        from app.core.events import event_manager
+        if log:
+            self._received_logs.remove(log)
+            del self._log_index[db_id]
 
-        event_manager.publish("log_update", {})
+        self._publish_log_event("log_deleted", {"id": db_id})
 
         return filename
 
+    def discard_lost_records(self, db_ids: List[int]):
+        """
+        Forgets records whose insert was rolled back (their batch failed to
+        commit): drops queued synthesis and their hot window entries.
+        """
+        self.synthesis_queue.discard(db_ids)
+        for db_id in db_ids:
+            log = self._log_index.pop(db_id, None)
+            if log is None:
+                continue
+            self._received_logs.remove(log)
+            self._publish_log_event("log_deleted", {"id": db_id})
+
     def update_log_text(self, db_id: int, new_text: str):
         """Updates text for a log entry by ID, deletes old audio if exists, and resets state."""
         # 1. Fetch Current Settings from DB Model to preserve them
@@ -417,11 +718,10 @@ class StreamProcessor:
             # If not in DB, try to find in cache just to get current state (useful for tests)
             print(f"[Processor] Record {db_id} not found in DB for text update.")
             speaker_id = self.synthesis_config.speaker_id
-            for log in self.received_logs:
-                if log.get("id") == db_id:
-                    old_filename = log.get("filename")
-                    speaker_id = log.get("config", {}).get("speaker_id", 1)
-                    break
+            log = self.find_log(db_id)
+            if log:
+                old_filename = log.get("filename")
+                speaker_id = log.get("config", {}).get("speaker_id", 1)
 
         # 2. Update Database (Reset attributes to None until next synthesis)
         print(f"[Processor] Updating text for ID {db_id}: '{new_text}'")
@@ -436,25 +736,18 @@ class StreamProcessor:
                 self.audio_manager.delete_file(old_filename)
             except Exception as e:
                 print(f"[Processor] Error deleting file {old_filename}: {e}")
+            if self.audio_cache:
+                # Its blob may now be held by the cache alone
+                self.audio_cache.evict()
 
         # 4. Update Cache (Reset to pending state)
-        found = False
-        for log in self.received_logs:
-            if log.get("id") == db_id:
-                log["text"] = new_text
-                log["duration"] = "-1.00s"  # Reset duration
-                log["filename"] = f"pending_{db_id}.wav"  # Reset filename
-                log["is_generated"] = False
-                found = True
-                break
-
-        from app.core.events import event_manager
-
-        event_manager.publish("log_update", {})
-
-        if not found:
-            # Should reload if not found, but it should be there.
-            pass
+        log = self.find_log(db_id)
+        if log:
+            log["text"] = new_text
+            log["duration"] = "-1.00s"  # Reset duration
+            log["filename"] = f"pending_{db_id}.wav"  # Reset filename
+            log["is_generated"] = False
+        self._publish_log_change(db_id, log)
 
     def _format_speaker_info(
         self, speaker_id: int, name: str = None, style: str = None
@@ -0,0 +1,136 @@
+import queue
+import threading
+from typing import Callable, Optional
+
+from app.config.schemas import SynthesisConfig
+
+
+class SynthesisQueue:
+    """
+    Bounded job queue with a small pool of synthesis worker threads.
+
+    The whisper receiver only stores a record and enqueues its DB ID here, so
+    VOICEVOX round-trips never block ingestion of the next transcription.
+    When the queue is full, `submit` waits up to `enqueue_timeout` seconds
+    (backpressure) and then gives up, leaving the record pending so it can
+    still be synthesized on demand.
+    """
+
+    def __init__(
+        self,
+        synthesize: Callable[[int], tuple],
+        config: SynthesisConfig,
+        enqueue_timeout: float = 5.0,
+    ):
+        self.synthesize = synthesize
+        self.config = config
+        self.enqueue_timeout = enqueue_timeout
+
+        self._queue: Optional[queue.Queue] = None
+        self._workers = []
+        self._lock = threading.Lock()
+        self._shutdown_flag = threading.Event()
+
+    def _ensure_started(self):
+        """Start the worker pool lazily using the current config values."""
+        with self._lock:
+            if self._queue is not None:
+                return
+            self._queue = queue.Queue(maxsize=self.config.queue_size)
+            for i in range(self.config.worker_count):
+                t = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"SynthesisWorker-{i}",
+                    daemon=True,
+                )
+                t.start()
+                self._workers.append(t)
+            print(
+                f"[SynthesisQueue] Started {self.config.worker_count} worker(s) "
+                f"(queue size {self.config.queue_size})"
+            )
+
+    def submit(self, db_id: int) -> bool:
+        """
+        Enqueue a record for synthesis.
+        Returns False if the system is shutting down or the queue stayed full.
+        """
+        if self._shutdown_flag.is_set():
+            return False
+
+        self._ensure_started()
+        try:
+            self._queue.put(db_id, timeout=self.enqueue_timeout)
+            return True
+        except queue.Full:
+            print(f"[SynthesisQueue] Queue full. ID {db_id} left pending.")
+            return False
+
+    def pending_count(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def clear(self):
+        """Drop all queued (not yet started) jobs, e.g. after output_dir changes."""
+        if self._queue is None:
+            return
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._queue.task_done()
+            if item is not None:
+                print(f"[SynthesisQueue] Dropped queued job for ID {item}")
+
+    def discard(self, db_ids) -> int:
+        """Drop queued (not yet started) jobs for the given IDs. Returns how many."""
+        if self._queue is None:
+            return 0
+        ids = set(db_ids)
+        q = self._queue
+        with q.mutex:
+            dropped = [item for item in q.queue if item in ids]
+            if dropped:
+                kept = [item for item in q.queue if item not in ids]
+                q.queue.clear()
+                q.queue.extend(kept)
+                q.unfinished_tasks -= len(dropped)
+                if q.unfinished_tasks == 0:
+                    q.all_tasks_done.notify_all()
+                q.not_full.notify(len(dropped))
+        for db_id in dropped:
+            print(f"[SynthesisQueue] Dropped queued job for ID {db_id}")
+        return len(dropped)
+
+    def _worker_loop(self):
+        while True:
+            db_id = self._queue.get()
+            try:
+                if db_id is None:
+                    break
+                if self._shutdown_flag.is_set():
+                    continue
+
+                generated_file, duration = self.synthesize(db_id)
+                print(f"  -> Immediate Generated: {generated_file} ({duration:.2f}s)")
+            except Exception as e:
+                print(f"Synthesis Error (ID {db_id}): {e}")
+            finally:
+                self._queue.task_done()
+
+    def shutdown(self, timeout: float = 2.0):
+        """Drop queued jobs, stop workers and wait for in-flight jobs briefly."""
+        self._shutdown_flag.set()
+        if self._queue is None:
+            return
+
+        self.clear()
+        for _ in self._workers:
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+        for t in self._workers:
+            t.join(timeout=timeout)
+            if t.is_alive():
+                print(f"[SynthesisQueue] {t.name} did not exit cleanly.")
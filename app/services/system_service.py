@@ -1,5 +1,11 @@
 from app.core.ffmpeg import FFmpegClient
-from app.api.schemas.system import DevicesResponse
+from app.api.schemas.system import (
+    DevicesResponse,
+    ArchiveStatsResponse,
+    CacheStatsResponse,
+    EventStatsResponse,
+    VoiceVoxQueueStatsResponse,
+)
 
 
 def get_audio_devices_handler(
@@ -16,3 +22,31 @@ def get_audio_devices_handler(
 def heartbeat_handler():
     """Simple alive check."""
     return {"status": "alive"}
+
+
+def get_cache_stats_handler(audio_cache) -> CacheStatsResponse:
+    """Returns audio cache hit/miss counters and disk usage."""
+    return CacheStatsResponse(**audio_cache.get_stats())
+
+
+def get_archive_stats_handler(audio_archiver) -> ArchiveStatsResponse:
+    """Returns archive settings, bytes saved so far and the last pass."""
+    return ArchiveStatsResponse(**audio_archiver.get_report())
+
+
+def run_archive_handler(audio_archiver) -> ArchiveStatsResponse:
+    """Starts an archive pass in the background."""
+    if not audio_archiver.enabled:
+        raise ValueError("Archiving is disabled (system.archive_after_days is 0)")
+    audio_archiver.trigger()
+    return get_archive_stats_handler(audio_archiver)
+
+
+def get_voicevox_queue_stats_handler(vv_client) -> VoiceVoxQueueStatsResponse:
+    """Returns VOICEVOX scheduler queue depths and wait times per priority class."""
+    return VoiceVoxQueueStatsResponse(**vv_client.scheduler.get_stats())
+
+
+def get_event_stats_handler(event_manager) -> EventStatsResponse:
+    """Returns SSE event bus counters (published, coalesced, dropped)."""
+    return EventStatsResponse(**event_manager.get_stats())
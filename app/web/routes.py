@@ -3,8 +3,11 @@ import os
 from app.config import config
 from app.core.voicevox import VoiceVoxClient
 from app.core.audio import AudioManager
+from app.core.audio_cache import AudioCache
 from app.services.processor import StreamProcessor
+from app.services.archiver import AudioArchiver
 from app.core.events import event_manager
+from app.core.scheduler import Priority
 from app.core.resolve import ResolveClient
 from app.core.ffmpeg import FFmpegClient
 import threading
@@ -18,8 +21,16 @@ audio_manager = AudioManager(config.system)
 from app.core.database import db_manager
 
 db_manager.set_config(config.system)
-processor = StreamProcessor(vv_client, audio_manager, config.synthesis)
+audio_cache = AudioCache(config.system)
+processor = StreamProcessor(vv_client, audio_manager, config.synthesis, audio_cache)
+db_manager.on_rows_lost = processor.discard_lost_records
 ffmpeg_client = FFmpegClient(config.ffmpeg)
+audio_archiver = AudioArchiver(
+    config.system,
+    db_manager,
+    on_moved=processor.relocate_audio,
+    audio_cache=audio_cache,
+)
 
 _resolve_client = None
 
@@ -37,9 +48,14 @@ def cleanup_resources():
         _resolve_client.shutdown()
     if ffmpeg_client:
         ffmpeg_client.stop_process()
+    if processor:
+        processor.shutdown()
+    audio_archiver.shutdown()
     if audio_manager:
         audio_manager.shutdown()
+    db_manager.close_all_connections()  # Also commits batched writes
     voicevox_stop_event.set()
+    vv_client.close()
 
 
 # Status Pollers
@@ -74,7 +90,11 @@ def start_voicevox_poller():
         last_status = False
         while not voicevox_stop_event.is_set():
             try:
-                current_status = vv_client.is_available()
+                # Keeps the cached health state fresh for all other callers.
+                # Without a priority of its own this thread would count as
+                # interactive and outrank immediate synthesis.
+                with vv_client.scheduler.priority(Priority.LIVE):
+                    current_status = vv_client.refresh_health()
                 if current_status != last_status:
                     event_manager.publish(
                         "voicevox_status", {"available": current_status}
@@ -96,17 +116,26 @@ def start_voicevox_poller():
 if not current_process().daemon:
     start_resolve_poller()
     start_voicevox_poller()
+    audio_archiver.start()
 
 
 @web.route("/api/stream")
 def stream():
+    # EventSource sends Last-Event-ID when it reconnects by itself; the
+    # SharedWorker passes it as a query parameter when it opens a new one
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get(
+        "lastEventId"
+    )
+
     def generator():
-        q = event_manager.subscribe()
+        sub = event_manager.subscribe(last_event_id)
         try:
             while True:
-                yield q.get()
+                # Starts with a resync frame if the missed events are no
+                # longer buffered (or the server restarted)
+                yield sub.next_sse()
         except GeneratorExit:
-            event_manager.unsubscribe(q)
+            event_manager.unsubscribe(sub)
 
     response = Response(generator(), mimetype="text/event-stream")
     response.headers["Cache-Control"] = "no-cache"
@@ -135,4 +164,7 @@ def get_speakers():
 
 @web.route("/api/logs", methods=["GET"])
 def get_logs():
-    return jsonify(processor.get_logs())
+    # Optional keyset pagination: ?before=<oldest loaded id>&limit=<n>
+    before = request.args.get("before", type=int)
+    limit = request.args.get("limit", type=int)
+    return jsonify(processor.get_logs(before=before, limit=limit))
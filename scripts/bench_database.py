@@ -0,0 +1,137 @@
+"""
+Microbenchmark for DatabaseManager per-operation cost.
+
+Compares the legacy connect-per-call pattern (open connection, PRAGMAs,
+schema check, close) against the pooled connections used by DatabaseManager,
+per-statement commits against the batched (write-behind) inserts, and
+decoding phoneme timelines stored as JSON text against the BLOB format.
+
+Usage:
+    uv run python scripts/bench_database.py [iterations]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+# Allow running from the project root or the scripts directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import DatabaseManager, Transcription
+from app.core.phonemes import PhonemeTimeline
+
+
+def legacy_get_transcription(mgr: DatabaseManager, db_id: int):
+    """Reproduces the old behavior: a fresh connection and schema check per call."""
+    conn = mgr._get_connection()
+    try:
+        mgr._init_db_conn(conn)
+        row = conn.execute(
+            "SELECT * FROM transcriptions WHERE id = ?", (db_id,)
+        ).fetchone()
+        return Transcription.from_row(row) if row else None
+    finally:
+        conn.close()
+
+
+def commit_per_insert(mgr: DatabaseManager, text: str):
+    """Reproduces the old behavior: one transaction per INSERT."""
+    with mgr._connection() as conn:
+        conn.execute(
+            "INSERT INTO transcriptions (text, speaker_id) VALUES (?, ?)", (text, 1)
+        )
+        conn.commit()
+
+
+def bench(label: str, func, iterations: int):
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(i)
+    elapsed = time.perf_counter() - start
+    per_op_us = elapsed / iterations * 1_000_000
+    print(f"  {label:<32} {per_op_us:10.1f} us/op  ({iterations} ops)")
+    return per_op_us
+
+
+def bench_timelines(records: int = 2000, phonemes: int = 60):
+    """Loads the timelines of `records` rows from a range query."""
+    items = [{"t": round(i * 0.05, 3), "p": "a"} for i in range(phonemes)]
+    blob = PhonemeTimeline.from_list(items).to_bytes()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        mgr = DatabaseManager(SimpleNamespace(output_dir=tmp))
+        for _ in range(records):
+            db_id = mgr.add_transcription("音素", 1, {})
+            mgr.update_audio_info(db_id, "x.wav", 1.0, phonemes=blob)
+        mgr.flush()
+
+        start = time.perf_counter()
+        rows = mgr.get_phonemes_range(1, records, records)
+        timelines = [PhonemeTimeline.load(value).to_json() for _, value in rows]
+        blob_ms = (time.perf_counter() - start) * 1000
+
+        with mgr._connection() as conn:
+            conn.execute("UPDATE transcriptions SET phonemes = ?", (json.dumps(items),))
+            conn.commit()
+        start = time.perf_counter()
+        rows = mgr.get_phonemes_range(1, records, records)
+        timelines = [json.loads(value) for _, value in rows]
+        json_ms = (time.perf_counter() - start) * 1000
+        mgr.close_all_connections()
+
+    print(f"Phoneme timelines ({records} records x {phonemes} phonemes)")
+    print(f"  {'JSON text':<32} {json_ms:10.1f} ms  ({len(timelines)} records)")
+    print(f"  {'BLOB (float32 + uint8)':<32} {blob_ms:10.1f} ms")
+    print(f"  size per record: {len(json.dumps(items))} -> {len(blob)} bytes")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        mgr = DatabaseManager(SimpleNamespace(output_dir=tmp))
+        ids = [
+            mgr.add_transcription("ベンチマーク用のテキスト", 1, {}) for _ in range(100)
+        ]
+
+        print(f"DatabaseManager microbenchmark ({tmp})")
+        legacy = bench(
+            "connect-per-call get",
+            lambda i: legacy_get_transcription(mgr, ids[i % len(ids)]),
+            iterations,
+        )
+        pooled = bench(
+            "pooled get_transcription",
+            lambda i: mgr.get_transcription(ids[i % len(ids)]),
+            iterations,
+        )
+        per_commit = bench(
+            "commit-per-insert add",
+            lambda i: commit_per_insert(mgr, f"text {i}"),
+            iterations,
+        )
+        batched = bench(
+            "batched add_transcription",
+            lambda i: mgr.add_transcription(f"text {i}", 1, {}),
+            iterations,
+        )
+        mgr.flush()
+        bench(
+            "pooled update_audio_info",
+            lambda i: mgr.update_audio_info(ids[i % len(ids)], "x.wav", 1.0),
+            iterations,
+        )
+        mgr.flush()
+        print(f"  speedup (get): {legacy / pooled:.1f}x")
+        print(f"  speedup (add): {per_commit / batched:.1f}x")
+
+        mgr.close_all_connections()
+
+    bench_timelines()
+
+
+if __name__ == "__main__":
+    main()
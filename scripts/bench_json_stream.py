@@ -0,0 +1,91 @@
+"""
+Throughput benchmark for the whisper JSON stream parser.
+
+Feeds megabytes of synthetic whisper `format=json` output through the legacy
+`find("}")` splitter and through JsonStreamParser, using several chunk sizes.
+
+Usage:
+    uv run python scripts/bench_json_stream.py [megabytes]
+"""
+
+import json
+import os
+import sys
+import time
+
+# Allow running from the project root or the scripts directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.json_stream import JsonStreamParser
+
+
+def make_payload(megabytes: float) -> bytes:
+    """Concatenated whisper-like objects with multi-byte text."""
+    lines = []
+    size = 0
+    i = 0
+    target = int(megabytes * 1024 * 1024)
+    while size < target:
+        obj = {
+            "start": i * 1500,
+            "end": i * 1500 + 1400,
+            "text": f"これは {i} 番目の文字起こしです。ずんだもんなのだ。",
+        }
+        line = json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n"
+        lines.append(line)
+        size += len(line)
+        i += 1
+    return b"".join(lines), i
+
+
+def legacy_split(chunks):
+    """Reproduces the old StreamProcessor.process_stream framing."""
+    count = 0
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk.decode("utf-8", errors="ignore")
+        while "}" in buffer:
+            brace_index = buffer.find("}")
+            json_str = buffer[: brace_index + 1]
+            buffer = buffer[brace_index + 1 :]
+            try:
+                json.loads(json_str)
+                count += 1
+            except json.JSONDecodeError:
+                pass
+    return count
+
+
+def parser_split(chunks):
+    parser = JsonStreamParser()
+    count = 0
+    for chunk in chunks:
+        count += len(parser.feed(chunk))
+    return count
+
+
+def bench(label: str, func, chunks, total_bytes: int, expected: int):
+    start = time.perf_counter()
+    count = func(chunks)
+    elapsed = time.perf_counter() - start
+    mb_per_s = total_bytes / elapsed / (1024 * 1024)
+    status = "ok" if count == expected else f"MISMATCH ({count})"
+    print(f"  {label:<10} {mb_per_s:8.1f} MB/s  {elapsed:7.3f} s  {status}")
+
+
+def main():
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 4.0
+    payload, expected = make_payload(megabytes)
+    print(f"JSON stream benchmark: {len(payload)} bytes, {expected} objects")
+
+    for chunk_size in (1024, 64 * 1024, 1024 * 1024):
+        chunks = [
+            payload[i : i + chunk_size] for i in range(0, len(payload), chunk_size)
+        ]
+        print(f"chunk size {chunk_size} bytes")
+        bench("legacy", legacy_split, chunks, len(payload), expected)
+        bench("parser", parser_split, chunks, len(payload), expected)
+
+
+if __name__ == "__main__":
+    main()
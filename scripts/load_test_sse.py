@@ -0,0 +1,133 @@
+"""
+In-process load test for /api/stream fan-out.
+
+Opens N SSE clients against the ASGI app (coroutine per client) and, for
+comparison, N blocking readers as the threaded Flask server runs them
+(thread per client), then publishes events from a worker thread and reports
+delivery latency and the number of live threads.
+
+Usage:
+    uv run python scripts/load_test_sse.py [clients] [events]
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Allow running from the project root or the scripts directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.asgi import create_asgi_app
+from app.core.events import event_manager
+
+
+def report(label: str, latencies: list, threads: int):
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000
+    print(
+        f"  {label:<10} p50 {p50:7.2f} ms  p99 {p99:7.2f} ms  "
+        f"threads {threads:5d}  ({len(latencies)} deliveries)"
+    )
+
+
+def publish_all(events: int, sent_at: dict):
+    for i in range(events):
+        sent_at[i] = time.perf_counter()
+        event_manager.publish("load_test", {"n": i})
+        time.sleep(0.01)
+
+
+def run_threaded(clients: int, events: int):
+    sent_at, latencies = {}, []
+    lock = threading.Lock()
+    subs = [event_manager.subscribe() for _ in range(clients)]
+
+    def reader(sub):
+        received = 0
+        while received < events:
+            frame = sub.next_sse(timeout=5)
+            if '"load_test"' in frame:
+                now = time.perf_counter()
+                n = int(frame.rsplit('"n": ', 1)[1].split("}", 1)[0])
+                with lock:
+                    latencies.append(now - sent_at[n])
+                received += 1
+
+    readers = [threading.Thread(target=reader, args=(s,)) for s in subs]
+    for t in readers:
+        t.start()
+    threads = threading.active_count()
+    publish_all(events, sent_at)
+    for t in readers:
+        t.join()
+    for sub in subs:
+        event_manager.unsubscribe(sub)
+    report("threaded", latencies, threads)
+
+
+async def run_asgi(app, clients: int, events: int):
+    sent_at, latencies = {}, []
+    disconnect = asyncio.Event()
+    done = asyncio.Semaphore(0)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/stream",
+        "query_string": b"",
+        "headers": [],
+    }
+
+    async def receive():
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    def make_send():
+        received = 0
+
+        async def send(message):
+            nonlocal received
+            body = message.get("body", b"")
+            if b'"load_test"' in body:
+                now = time.perf_counter()
+                n = int(body.rsplit(b'"n": ', 1)[1].split(b"}", 1)[0])
+                latencies.append(now - sent_at[n])
+                received += 1
+                if received == events:
+                    done.release()
+
+        return send
+
+    tasks = [
+        asyncio.ensure_future(app(scope, receive, make_send())) for _ in range(clients)
+    ]
+    await asyncio.sleep(0.2)
+    threads = threading.active_count()
+
+    publisher = threading.Thread(target=publish_all, args=(events, sent_at))
+    publisher.start()
+    for _ in range(clients):
+        await asyncio.wait_for(done.acquire(), timeout=10)
+    publisher.join()
+
+    disconnect.set()
+    await asyncio.gather(*tasks)
+    report("asgi", latencies, threads)
+
+
+def main():
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    events = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    app = create_asgi_app(create_app())
+    print(f"SSE fan-out load test ({clients} clients, {events} events)")
+    run_threaded(clients, events)
+    asyncio.run(run_asgi(app, clients, events))
+
+
+if __name__ == "__main__":
+    main()
@@ -85,8 +85,16 @@ export class ApiClient {
     }
 
 
-    async getLogs() {
-        return this._fetchJson(this.endpoints.LOGS);
+    /**
+     * Without params: the recent log window.
+     * With { before, limit }: older entries (keyset pagination by ID).
+     */
+    async getLogs(params = {}) {
+        const query = new URLSearchParams();
+        if (params.before !== undefined) query.set('before', params.before);
+        if (params.limit !== undefined) query.set('limit', params.limit);
+        const qs = query.toString();
+        return this._fetchJson(qs ? `${this.endpoints.LOGS}?${qs}` : this.endpoints.LOGS);
     }
 
     async getControlState() {
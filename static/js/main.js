@@ -62,6 +62,13 @@ const valueDisplays = {
 let lastRenderedLogsJson = "";
 let lastRenderedStateKey = "";
 
+// History paging (older entries are fetched when scrolling to the top)
+const LOG_PAGE_SIZE = 50;
+let isLoadingOlderLogs = false;
+
+// Sequence number of the last applied log event (null until the first one)
+let lastLogSeq = null;
+
 // --- App Entry Point ---
 
 async function init() {
@@ -79,6 +86,14 @@ async function init() {
     renderStartStopUI();
 
     // Initial Load
+    await loadState();
+}
+
+/**
+ * Fetches the full state from the server. Used on startup and when the SSE
+ * stream could not replay the events missed during a reconnect.
+ */
+async function loadState() {
     try {
         const [speakersRes, configRes, controlRes, logsRes] = await Promise.all([
             api.getSpeakers(),
@@ -87,7 +102,6 @@ async function init() {
             api.getLogs()
         ]);
 
-        if (speakersRes.ok) store.setSpeakers(speakersRes.data);
         if (speakersRes.ok) store.setSpeakers(speakersRes.data);
         if (configRes.ok) {
             const data = configRes.data;
@@ -113,9 +127,24 @@ function setupStoreListeners() {
         renderLogs(); // State changes affect button locks
     });
     store.addEventListener('logs_updated', renderLogs);
+    store.addEventListener('playback_progress', renderPlaybackProgress);
+}
+
+function renderPlaybackProgress() {
+    const { position, duration } = store.playbackState;
+    const playBtn = elements.logTableBody.querySelector('.btn-icon-play.playing');
+    if (playBtn) playBtn.title = `Playing ${position.toFixed(1)}s / ${duration.toFixed(1)}s`;
 }
 
 function setupUIListeners() {
+    // Load older history when the log table is scrolled to the top
+    const logContainer = elements.logTableBody.closest('div');
+    if (logContainer) {
+        logContainer.addEventListener('scroll', () => {
+            if (logContainer.scrollTop < 40) loadOlderLogs();
+        });
+    }
+
     // Voicevox Config Inputs
     const vvKeys = ['speaker', 'style', 'speedScale', 'pitchScale', 'intonationScale', 'volumeScale', 'prePhonemeLength', 'postPhonemeLength', 'pauseLengthScale', 'synthesisTiming'];
     vvKeys.forEach(key => {
@@ -369,6 +398,7 @@ function setupUIListeners() {
                 }
 
                 // Refresh logs specifically after dir change
+                store.setConfig({}, path);
                 const logRes = await api.getLogs();
                 if (logRes.ok) store.setLogs(logRes.data);
             } else if (res.data.status === 'error') {
@@ -642,13 +672,21 @@ async function handleServerEvent(msg) {
         case "playback_change":
             store.updatePlaybackState(msg.data.is_playing, msg.data.filename, msg.data.request_id);
             break;
+        case "playback_progress":
+            store.updatePlaybackProgress(msg.data);
+            break;
         case "state_update":
             store.updateSynthesisState(msg.data.is_enabled);
             break;
         case "log_update":
-            // Logs are heavy, so we fetch them when notified rather than sending in event
-            const lRes = await api.getLogs();
-            if (lRes.ok) store.setLogs(lRes.data);
+            // Full reset (e.g. output directory changed)
+            if (msg.data.seq !== undefined) lastLogSeq = msg.data.seq;
+            await refetchLogs();
+            break;
+        case "log_added":
+        case "log_updated":
+        case "log_deleted":
+            await applyLogDelta(msg);
             break;
         case "config_update":
             const cRes = await api.getConfig();
@@ -671,6 +709,11 @@ async function handleServerEvent(msg) {
                 });
             }
             break;
+        case "resync":
+            // Missed events could not be replayed: start over from a full fetch
+            lastLogSeq = null;
+            await loadState();
+            break;
         case "server_restart":
             console.log('[SSE] Server restart detected. Reloading...');
             location.reload();
@@ -1276,6 +1319,7 @@ async function doDelete(id, filename, isGenerated) {
         try {
             const res = await api.deleteFile(id);
             if (res.ok && res.data.status === 'ok') {
+                store.removeLog(id); // May be outside the server's recent window
                 const lRes = await api.getLogs();
                 if (lRes.ok) store.setLogs(lRes.data);
             } else {
@@ -1342,6 +1386,57 @@ async function doResolveInsert(id, btn) {
 
 // --- Utils & Modals ---
 
+async function refetchLogs() {
+    const lRes = await api.getLogs();
+    if (lRes.ok) store.setLogs(lRes.data);
+}
+
+/**
+ * Applies a log delta event. Events carry the complete entry, so replaying
+ * them on top of a newer snapshot converges; only a sequence gap (dropped
+ * events or server restart) requires a full refetch.
+ */
+async function applyLogDelta(msg) {
+    const { seq, id, entry } = msg.data;
+    const inOrder = lastLogSeq === null || seq === lastLogSeq + 1;
+    lastLogSeq = seq;
+
+    if (!inOrder) {
+        console.warn(`[Logs] Event sequence gap detected (got ${seq}), refetching`);
+        await refetchLogs();
+        return;
+    }
+
+    if (msg.type === 'log_deleted') {
+        store.removeLog(id);
+    } else {
+        store.upsertLog(entry);
+    }
+}
+
+async function loadOlderLogs() {
+    if (isLoadingOlderLogs || !store.hasMoreLogs || store.logs.length === 0) return;
+    isLoadingOlderLogs = true;
+
+    const container = elements.logTableBody.closest('div');
+    try {
+        const res = await api.getLogs({ before: store.logs[0].id, limit: LOG_PAGE_SIZE });
+        if (res.ok) {
+            const previousHeight = container ? container.scrollHeight : 0;
+            const previousTop = container ? container.scrollTop : 0;
+            store.prependLogs(res.data, res.data.length >= LOG_PAGE_SIZE);
+            // Keep the rows the user was looking at in place
+            if (container) {
+                container.scrollTop = previousTop + (container.scrollHeight - previousHeight);
+            }
+        }
+    } catch (e) {
+        console.error("Failed to load older logs", e);
+    } finally {
+        isLoadingOlderLogs = false;
+    }
+}
+
 function scrollToBottom() {
     const container = elements.logTableBody.closest('div');
     if (container) container.scrollTop = container.scrollHeight;
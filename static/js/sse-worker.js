@@ -4,6 +4,11 @@
  */
 
 let eventSource = null;
+let streamUrl = null;
+// Id of the last event received. EventSource sends it as Last-Event-ID when it
+// reconnects by itself; after a permanent close we pass it when reopening.
+let lastEventId = '';
+const RECONNECT_DELAY_MS = 2000;
 const ports = new Set();
 
 self.onconnect = (event) => {
@@ -29,6 +34,12 @@ function setupEventSource(url) {
         return;
     }
 
+    streamUrl = url;
+    if (lastEventId) {
+        const sep = url.includes('?') ? '&' : '?';
+        url = `${url}${sep}lastEventId=${encodeURIComponent(lastEventId)}`;
+    }
+
     console.log('[SSE Worker] Connecting to:', url);
     eventSource = new EventSource(url);
 
@@ -37,6 +48,7 @@ function setupEventSource(url) {
     };
 
     eventSource.onmessage = (e) => {
+        if (e.lastEventId) lastEventId = e.lastEventId;
         broadcast({ type: '_worker_message', data: e.data });
     };
 
@@ -44,7 +56,12 @@ function setupEventSource(url) {
         console.error('[SSE Worker] Error:', err);
         broadcast({ type: '_worker_error' });
 
-        // EventSource automatically reconnects, but we notify tabs
+        // EventSource automatically reconnects (resuming from Last-Event-ID),
+        // but gives up if the server answered with an error while restarting
+        if (eventSource.readyState === EventSource.CLOSED) {
+            eventSource = null;
+            setTimeout(() => setupEventSource(streamUrl), RECONNECT_DELAY_MS);
+        }
     };
 }
 
@@ -1,4 +1,7 @@
 
+// Upper bound for log entries held by a tab
+const MAX_LOG_ENTRIES = 1000;
+
 /**
  * Application State Store
  * Emits events when state changes
@@ -14,6 +17,8 @@ export class AppStore extends EventTarget {
             isVoicevoxAvailable: false,
             serverPlaybackState: { is_playing: false, filename: null, remaining: 0 },
             logs: [],
+            hasMoreLogs: true,
+            logsOutputDir: "",
             outputDir: ""
         };
     }
@@ -62,8 +67,49 @@ export class AppStore extends EventTarget {
     }
 
     setLogs(logs) {
-        // Optimization check could act here, but we'll let UI decide or do strict check
-        this.state.logs = logs;
+        if (this.state.logsOutputDir !== this.state.outputDir) {
+            // Different database: drop history paged in from the previous one
+            this.state.logs = [];
+            this.state.hasMoreLogs = true;
+            this.state.logsOutputDir = this.state.outputDir;
+        }
+        // The server sends its recent window; keep older pages loaded by scrolling
+        const oldestRecent = logs.length ? logs[0].id : Infinity;
+        const older = this.state.logs.filter(log => log.id < oldestRecent);
+        this.state.logs = older.concat(logs);
+        this._emit('logs_updated');
+    }
+
+    prependLogs(olderLogs, hasMore) {
+        const known = new Set(this.state.logs.map(log => log.id));
+        const fresh = olderLogs.filter(log => !known.has(log.id));
+        this.state.logs = fresh.concat(this.state.logs);
+        this.state.hasMoreLogs = hasMore;
+        this._emit('logs_updated');
+    }
+
+    upsertLog(entry) {
+        const logs = this.state.logs;
+        const index = logs.findIndex(log => log.id === entry.id);
+        if (index >= 0) {
+            logs[index] = entry;
+        } else if (!logs.length || entry.id > logs[logs.length - 1].id) {
+            logs.push(entry);
+            if (logs.length > MAX_LOG_ENTRIES) {
+                // Long sessions: older rows can be paged back in by scrolling
+                logs.splice(0, logs.length - MAX_LOG_ENTRIES);
+                this.state.hasMoreLogs = true;
+            }
+        } else {
+            const at = logs.findIndex(log => log.id > entry.id);
+            logs.splice(at, 0, entry);
+        }
+        this.state.logs = logs.slice();
+        this._emit('logs_updated');
+    }
+
+    removeLog(id) {
+        this.state.logs = this.state.logs.filter(log => log.id !== id);
         this._emit('logs_updated');
     }
 
@@ -86,6 +132,19 @@ export class AppStore extends EventTarget {
         this._emit('state_updated'); // Re-uses state_updated as it affects UI locks
     }
 
+    /**
+     * Progress of the current playback (pushed by the server while playing).
+     * Does not re-render the log table.
+     */
+    updatePlaybackProgress(progress) {
+        const current = this.state.serverPlaybackState;
+        if (!current.is_playing || current.filename !== progress.filename) return;
+        current.position = progress.position;
+        current.remaining = progress.remaining;
+        current.duration = progress.duration;
+        this._emit('playback_progress', progress);
+    }
+
     updateSynthesisState(isEnabled) {
         if (this.state.isSynthesisEnabled !== isEnabled) {
             this.state.isSynthesisEnabled = isEnabled;
@@ -103,6 +162,7 @@ export class AppStore extends EventTarget {
     get isVoicevoxAvailable() { return this.state.isVoicevoxAvailable; }
     get playbackState() { return this.state.serverPlaybackState; }
     get logs() { return this.state.logs; }
+    get hasMoreLogs() { return this.state.hasMoreLogs; }
     get outputDir() { return this.state.outputDir; }
 
     /**
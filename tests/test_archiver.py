@@ -0,0 +1,202 @@
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.config.schemas import SystemConfig
+from app.core.audio_cache import AudioCache
+from app.core.database import DatabaseManager, Transcription
+from app.core.transcode import decode_file, encode_file, is_archived, read_as_wav
+from app.core.wav import parse_wav_header, wav_header
+from app.services.archiver import AudioArchiver
+
+DAY = 86400
+
+
+def write_wav(path, sample_rate=48000, seconds=1.0):
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    mono = (np.sin(2 * np.pi * 440 * t) * 8000).astype("<i2")
+    pcm = np.repeat(mono[:, None], 2, axis=1).tobytes()
+    with open(path, "wb") as f:
+        f.write(wav_header(sample_rate, 2, 16, len(pcm)) + pcm)
+    return pcm
+
+
+def write_wav_at(tmp_path, name, sample_rate):
+    path = str(tmp_path / name)
+    write_wav(path, sample_rate)
+    return path
+
+
+def test_flac_round_trip_is_lossless(tmp_path):
+    wav_path = str(tmp_path / "1_a.wav")
+    pcm = write_wav(wav_path)
+
+    flac_path = encode_file(wav_path, "flac")
+    assert flac_path.endswith(".flac") and is_archived(flac_path)
+    assert os.path.getsize(flac_path) < os.path.getsize(wav_path)
+
+    os.remove(wav_path)
+    restored = decode_file(flac_path)
+    with open(restored, "rb") as f:
+        data = f.read()
+    info = parse_wav_header(data)
+    assert data[info.data_offset :] == pcm
+    assert read_as_wav(flac_path) == data
+
+
+def test_opus_falls_back_to_flac_for_unsupported_rates(tmp_path):
+    opus_path = encode_file(write_wav_at(tmp_path, "1_a.wav", 48000), "opus")
+    assert opus_path.endswith(".opus")
+    info = parse_wav_header(read_as_wav(opus_path))
+    assert (info.sample_rate, info.channels) == (48000, 2)
+    assert info.duration == pytest.approx(1.0, abs=0.05)
+
+    assert encode_file(write_wav_at(tmp_path, "2_b.wav", 44100), "opus").endswith(
+        ".flac"
+    )
+
+
+@pytest.fixture
+def archive_env(tmp_path):
+    config = SystemConfig(output_dir=str(tmp_path), archive_after_days=7)
+    database = DatabaseManager(SimpleNamespace(output_dir=str(tmp_path)))
+    moved = MagicMock()
+    archiver = AudioArchiver(config, database, on_moved=moved)
+
+    def add(text, age_days):
+        db_id = database.add_transcription(Transcription(text=text, speaker_id=1))
+        filename = f"{db_id}_{text}.wav"
+        path = str(tmp_path / filename)
+        write_wav(path)
+        old = time.time() - age_days * DAY
+        os.utime(path, (old, old))
+        database.update_audio_info(db_id, filename, 1.0)
+        database._write(
+            "UPDATE transcriptions SET timestamp = datetime('now', ?) WHERE id = ?",
+            (f"-{age_days} days", db_id),
+        )
+        return db_id, filename
+
+    yield SimpleNamespace(
+        dir=tmp_path,
+        config=config,
+        database=database,
+        archiver=archiver,
+        moved=moved,
+        add=add,
+    )
+    archiver.shutdown()
+    database.close_all_connections()
+
+
+def test_archives_only_old_files(archive_env):
+    old_id, old_file = archive_env.add("old", 30)
+    new_id, new_file = archive_env.add("new", 1)
+    # Row is old but the file was rewritten recently (e.g. restored)
+    touched_id, touched_file = archive_env.add("touched", 30)
+    os.utime(archive_env.dir / touched_file)
+
+    stats = archive_env.archiver.run_once()
+
+    assert stats["archived"] == 1 and stats["failed"] == 0
+    record = archive_env.database.get_transcription(old_id)
+    assert record.output_path == f"{old_id}_old.flac"
+    assert not (archive_env.dir / old_file).exists()
+    assert (archive_env.dir / record.output_path).exists()
+    for db_id, filename in ((new_id, new_file), (touched_id, touched_file)):
+        assert archive_env.database.get_transcription(db_id).output_path == filename
+    archive_env.moved.assert_called_once_with(old_id, record.output_path)
+
+    report = archive_env.archiver.get_report()
+    assert report["archived_files"] == 1
+    assert report["freed_bytes"] == stats["freed_bytes"] == stats["original_bytes"]
+    assert report["saved_bytes"] == stats["freed_bytes"] - stats["archived_bytes"]
+    assert 0 < report["ratio"] < 1
+
+
+def test_cached_wav_is_released_and_only_freed_space_counts(archive_env):
+    cache = AudioCache(archive_env.config, archive_env.database)
+    archive_env.archiver.audio_cache = cache
+    content_hash = "ab" * 20
+    db_id, filename = archive_env.add(f"{content_hash[:8]}_cached", 30)
+    cache.store(content_hash, filename, 1.0)
+    blob = os.path.join(cache.get_cache_dir(), f"{content_hash}.wav")
+    assert os.stat(blob).st_nlink == 2
+
+    # Another record hardlinked to the same data (e.g. a duplicate line)
+    other_id, other_file = archive_env.add("duplicate", 30)
+    os.remove(archive_env.dir / other_file)
+    os.link(archive_env.dir / filename, archive_env.dir / other_file)
+    size = os.path.getsize(blob)
+
+    stats = archive_env.archiver.run_once()
+
+    assert stats["archived"] == 2
+    assert not os.path.exists(blob)
+    assert archive_env.database.get_cache_entry(content_hash) is None
+    # Both WAVs are gone, but their data was only stored once
+    assert stats["original_bytes"] == 2 * size
+    assert stats["freed_bytes"] == size
+    report = archive_env.archiver.get_report()
+    assert report["freed_bytes"] == size
+    assert report["saved_bytes"] == size - stats["archived_bytes"]
+
+
+def test_deferred_removal_counts_once_it_succeeds(archive_env, monkeypatch):
+    db_id, filename = archive_env.add("locked", 30)
+    wav_path = str(archive_env.dir / filename)
+    remove = os.remove
+
+    def still_open(path):
+        if path == wav_path:
+            raise PermissionError("file is in use")
+        remove(path)
+
+    monkeypatch.setattr(os, "remove", still_open)
+    stats = archive_env.archiver.run_once()
+    assert stats["archived"] == 1 and stats["freed_bytes"] == 0
+    report = archive_env.archiver.get_report()
+    assert report["pending_removal"] == 1 and report["freed_bytes"] == 0
+
+    monkeypatch.undo()
+    archive_env.archiver.run_once()
+    report = archive_env.archiver.get_report()
+    assert not os.path.exists(wav_path)
+    assert report["pending_removal"] == 0
+    assert report["freed_bytes"] == stats["original_bytes"]
+
+
+def test_record_changed_during_archive_is_left_alone(archive_env):
+    db_id, filename = archive_env.add("raced", 30)
+    replace = archive_env.database.replace_output_path
+
+    def resynthesized_meanwhile(*args):
+        archive_env.database.update_audio_info(db_id, f"{db_id}_new.wav", 1.0)
+        return replace(*args)
+
+    archive_env.database.replace_output_path = resynthesized_meanwhile
+    assert archive_env.archiver.run_once()["archived"] == 0
+    assert not (archive_env.dir / f"{db_id}_raced.flac").exists()
+    assert (archive_env.dir / filename).exists()
+
+
+def test_restore_for_wav_consumers(archive_env):
+    db_id, filename = archive_env.add("resolve", 30)
+    with open(archive_env.dir / filename, "rb") as f:
+        original = f.read()
+    archive_env.archiver.run_once()
+
+    assert archive_env.archiver.restore(db_id) == filename
+    with open(archive_env.dir / filename, "rb") as f:
+        assert f.read() == original
+    assert not (archive_env.dir / f"{db_id}_resolve.flac").exists()
+    assert archive_env.database.get_transcription(db_id).output_path == filename
+    assert archive_env.archiver.get_report()["archived_files"] == 0
+
+    # Not archived: nothing to do, and the fresh WAV is not re-archived
+    assert archive_env.archiver.restore(db_id) == filename
+    assert archive_env.archiver.run_once()["archived"] == 0
@@ -0,0 +1,235 @@
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from app import create_app
+from app.asgi import create_asgi_app
+from app.core.events import event_manager
+
+
+@pytest.fixture(scope="module")
+def asgi_app():
+    return create_asgi_app(create_app())
+
+
+def make_scope(method, path, query=b"", headers=None):
+    return {
+        "type": "http",
+        "http_version": "1.1",
+        "method": method,
+        "path": path,
+        "root_path": "",
+        "scheme": "http",
+        "query_string": query,
+        "headers": headers or [(b"host", b"127.0.0.1:3000")],
+        "server": ("127.0.0.1", 3000),
+        "client": ("127.0.0.1", 50000),
+    }
+
+
+async def request(app, method, path, body_chunks=(b"",), **scope_kwargs):
+    messages = [
+        {"type": "http.request", "body": chunk, "more_body": i < len(body_chunks) - 1}
+        for i, chunk in enumerate(body_chunks)
+    ]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        await asyncio.Event().wait()
+
+    async def send(message):
+        sent.append(message)
+
+    await app(make_scope(method, path, **scope_kwargs), receive, send)
+    status = sent[0]["status"]
+    headers = dict(sent[0]["headers"])
+    body = b"".join(m.get("body", b"") for m in sent[1:])
+    return status, headers, body
+
+
+class SSEClient:
+    """Reads /api/stream frames until disconnect() is called."""
+
+    def __init__(self, app, headers=None):
+        self.frames = []
+        self.received = asyncio.Event()
+        self._disconnect = asyncio.Event()
+        self._task = asyncio.ensure_future(
+            app(
+                make_scope("GET", "/api/stream", headers=headers),
+                self._receive,
+                self._send,
+            )
+        )
+        self.start = None
+
+    async def _receive(self):
+        await self._disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def _send(self, message):
+        if message["type"] == "http.response.start":
+            self.start = message
+        elif message.get("body"):
+            self.frames.append(message["body"].decode("utf-8"))
+            self.received.set()
+
+    def payloads(self):
+        return [json.loads(f.split("data: ", 1)[1]) for f in self.frames]
+
+    async def close(self):
+        self._disconnect.set()
+        await asyncio.wait_for(self._task, timeout=2)
+
+
+def test_bridged_route_matches_flask(asgi_app):
+    status, headers, body = asyncio.run(request(asgi_app, "GET", "/api/heartbeat"))
+
+    assert status == 200
+    assert headers[b"content-type"] == b"application/json"
+    assert json.loads(body) == {"status": "alive"}
+
+
+def test_bridged_route_passes_query_and_404(asgi_app):
+    status, _, _ = asyncio.run(request(asgi_app, "GET", "/no/such/route"))
+    assert status == 404
+
+    with patch("app.web.routes.processor.get_logs", return_value=[]) as mock_logs:
+        status, _, body = asyncio.run(
+            request(asgi_app, "GET", "/api/logs", query=b"before=50&limit=20")
+        )
+    assert (status, json.loads(body)) == (200, [])
+    mock_logs.assert_called_once_with(before=50, limit=20)
+
+
+def test_bridged_route_streams_chunks():
+    from flask import Flask, Response
+
+    flask_app = Flask(__name__)
+    first_sent = threading.Event()
+    closed = threading.Event()
+    streamed = []
+
+    @flask_app.route("/chunks")
+    def chunks():
+        def generate():
+            try:
+                yield b"one"
+                # Not buffered: the first chunk reaches the client before the next
+                streamed.append(first_sent.wait(2))
+                yield b"two"
+                yield b"three"
+            finally:
+                closed.set()
+
+        return Response(generate(), mimetype="text/plain")
+
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+        if message.get("body") == b"one":
+            first_sent.set()
+
+    app = create_asgi_app(flask_app)
+    asyncio.run(app(make_scope("GET", "/chunks"), receive, send))
+
+    assert sent[0]["type"] == "http.response.start" and sent[0]["status"] == 200
+    assert [(m["body"], m["more_body"]) for m in sent[1:]] == [
+        (b"one", True),
+        (b"two", True),
+        (b"three", True),
+        (b"", False),
+    ]
+    assert streamed == [True]
+    assert closed.is_set()
+
+
+def test_whisper_receiver_runs_as_coroutine(asgi_app):
+    chunks = (b'{"text": "one"}\n{"te', b'xt": "two"}\n', b"")
+
+    with patch("app.web.routes.processor._process_json_object") as mock_process:
+        status, _, body = asyncio.run(
+            request(asgi_app, "POST", "/", body_chunks=chunks)
+        )
+
+    assert (status, body) == (200, b"OK")
+    assert [c.args[0] for c in mock_process.call_args_list] == [
+        {"text": "one"},
+        {"text": "two"},
+    ]
+
+
+def test_sse_stream_frames_and_resume(asgi_app):
+    async def scenario():
+        client = SSEClient(asgi_app)
+        await asyncio.sleep(0.05)
+        event_manager.publish("log_deleted", {"id": 10})
+        await asyncio.wait_for(client.received.wait(), timeout=2)
+        await client.close()
+
+        assert client.start["status"] == 200
+        assert (b"content-type", b"text/event-stream; charset=utf-8") in client.start[
+            "headers"
+        ]
+        frame = client.frames[0]
+        assert frame.startswith("id: ")
+        last_id = frame.split("\n", 1)[0][len("id: ") :]
+
+        # Missed while reconnecting
+        event_manager.publish("log_deleted", {"id": 11})
+        resumed = SSEClient(asgi_app, headers=[(b"last-event-id", last_id.encode())])
+        await asyncio.wait_for(resumed.received.wait(), timeout=2)
+        await resumed.close()
+        return client, resumed
+
+    client, resumed = asyncio.run(scenario())
+    assert client.payloads()[0] == {"type": "log_deleted", "data": {"id": 10}}
+    assert resumed.payloads()[0] == {"type": "log_deleted", "data": {"id": 11}}
+
+
+def test_sse_fanout_to_hundreds_of_clients(asgi_app):
+    clients_count = 300
+    events = 5
+
+    async def scenario():
+        threads_before = threading.active_count()
+        clients = [SSEClient(asgi_app) for _ in range(clients_count)]
+        await asyncio.sleep(0.1)
+        # Open streams do not take a thread each
+        assert threading.active_count() - threads_before < 10
+        assert event_manager.get_stats()["subscribers"] >= clients_count
+
+        # Published from a worker thread, like the real producers
+        publisher = threading.Thread(
+            target=lambda: [
+                event_manager.publish("log_deleted", {"id": 1000 + i})
+                for i in range(events)
+            ]
+        )
+        publisher.start()
+
+        async def wait_all(client):
+            while (
+                sum(1 for p in client.payloads() if p["type"] == "log_deleted") < events
+            ):
+                client.received.clear()
+                await client.received.wait()
+
+        await asyncio.wait_for(asyncio.gather(*(wait_all(c) for c in clients)), 5)
+        publisher.join()
+        await asyncio.gather(*(c.close() for c in clients))
+        return clients
+
+    clients = asyncio.run(scenario())
+    for client in clients:
+        ids = [p["data"]["id"] for p in client.payloads() if p["type"] == "log_deleted"]
+        assert ids == [1000 + i for i in range(events)]
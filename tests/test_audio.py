@@ -12,11 +12,12 @@ import sys
 @pytest.fixture
 def mock_audio_manager_deps():
     with (
-        patch("app.core.audio.sd") as mock_sd,
+        patch("app.core.audio.StreamPlayer") as mock_player_cls,
         patch("app.core.audio.sf") as mock_sf,
         patch("app.core.events.event_manager") as mock_event_manager,
     ):
-        mock_sf.read.return_value = (b"mock_audio_data", 44100)
+        mock_player = mock_player_cls.return_value
+        mock_player.play.return_value.wait.return_value = True
         mock_sf.info.return_value = MagicMock(duration=0.1)
 
         # Mock os.path
@@ -30,9 +31,12 @@ def mock_audio_manager_deps():
             # Create a mock SystemConfig for AudioManager injection
             mock_sys_config = MagicMock()
             mock_sys_config.output_dir = "dummy_output_dir"
+            mock_sys_config.playback_progress_hz = 0
+            mock_sys_config.playback_sample_rate = 0
+            mock_sys_config.playback_channels = 0
 
             yield {
-                "sd": mock_sd,
+                "player": mock_player,
                 "sf": mock_sf,
                 "event_manager": mock_event_manager,
                 "sys_config": mock_sys_config,
@@ -62,8 +66,10 @@ def test_audio_queueing(mock_audio_manager_deps):
     # Wait enough time for both to process (0.1s duration each + overhead)
     time.sleep(0.5)
 
-    # Verify sd.play was called twice
-    assert mock_audio_manager_deps["sd"].play.call_count == 2
+    # Verify both files were streamed
+    player = mock_audio_manager_deps["player"]
+    assert player.play.call_count == 2
+    assert player.play.call_args_list[0][0][0] == "dummy_output_dir/file1.wav"
 
     # Verify Events
     # Expected sequence:
@@ -111,12 +117,13 @@ def test_audio_shutdown(mock_audio_manager_deps):
         # However, the worker starts immediately.
         # We can play a long item first to block the worker, then enqueue others.
 
-        # Mock sd.play to just return (don't block), BUT mock sd.wait to block?
-        # In our implementation we use sd.wait().
-        # We need to control sd.wait to simulate "playing".
+        # player.play returns immediately, the returned handle's wait() blocks
+        # while "playing". We need to control it to simulate "playing".
 
-        mock_sd = mock_audio_manager_deps["sd"]
-        mock_sd.wait.side_effect = lambda: time.sleep(0.1)  # Simulate short playback
+        mock_player = mock_audio_manager_deps["player"]
+        mock_player.play.return_value.wait.side_effect = lambda timeout: (
+            time.sleep(0.1) or True
+        )  # Simulate short playback
 
         # Enqueue item 1 (will be picked up by worker)
         am.play_audio("playing.wav", request_id="req_playing")
@@ -131,7 +138,7 @@ def test_audio_shutdown(mock_audio_manager_deps):
         # 2. Call Shutdown
         # This should:
         # - Set flag
-        # - Call sd.stop() -> interrupts current sd.wait() (if real sd)
+        # - Call player.stop() -> interrupts the current item's wait()
         # - Drain queue -> emit cancel for pending1, pending2
         # - Join thread
 
@@ -152,8 +159,8 @@ def test_audio_shutdown(mock_audio_manager_deps):
         # - Cancel req_pending1 (from drain)
         # - Cancel req_pending2 (from drain)
         # - Stop req_playing (worker finishes current item after stop) OR maybe cancelled?
-        #   Actually, if sd.stop() is called, the current worker loop finishes the item naturally (or interrupted).
-        #   The worker loop code: sd.wait() returns -> sd.stop() -> print/finally -> notify End.
+        #   Actually, if player.stop() is called, the current worker loop finishes the item naturally (or interrupted).
+        #   The worker loop code: wait() returns -> finally -> notify End.
         #   So req_playing should end with is_playing=False.
 
         req_ids = [e.get("request_id") for e in playback_events]
@@ -198,3 +205,37 @@ def test_play_audio_locks(mock_audio_manager_deps):
     # as the queue test already verifies the serialized nature.
     # Skipping exact status check during playback for this basic test suite
     # as the queue test already verifies the serialized nature.
+
+
+def test_save_audio_duration_from_header(tmp_path):
+    """save_audio derives the duration from the in-memory header, no re-read."""
+    import io
+    import wave
+
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(48000)
+        w.writeframes(b"\0" * 12000 * 4)
+    data = buf.getvalue()
+
+    with (
+        patch("app.core.audio.StreamPlayer"),
+        patch("app.core.audio.sf") as mock_sf,
+        patch("app.core.events.event_manager"),
+    ):
+        from app.core.audio import AudioManager
+
+        sys_config = MagicMock()
+        sys_config.output_dir = str(tmp_path)
+        am = AudioManager(sys_config)
+        try:
+            duration = am.save_audio(data, "001_abcd1234_test.wav")
+        finally:
+            am.shutdown()
+
+    assert duration == pytest.approx(0.25)
+    mock_sf.info.assert_not_called()
+    assert (tmp_path / "001_abcd1234_test.wav").read_bytes() == data
+    assert not (tmp_path / "001_abcd1234_test.wav.tmp").exists()
@@ -0,0 +1,202 @@
+import glob
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.audio_cache import AudioCache
+from app.core.database import DatabaseManager, Transcription
+
+
+@pytest.fixture
+def sys_config(tmp_path):
+    return SimpleNamespace(output_dir=str(tmp_path), cache_max_mb=1)
+
+
+@pytest.fixture
+def database(sys_config):
+    mgr = DatabaseManager(sys_config)
+    yield mgr
+    mgr.close_all_connections()
+
+
+@pytest.fixture
+def cache(sys_config, database):
+    return AudioCache(sys_config, database)
+
+
+def write_output(sys_config, filename, size=1000):
+    path = os.path.join(sys_config.output_dir, filename)
+    with open(path, "wb") as f:
+        f.write(b"\0" * size)
+    return path
+
+
+def test_store_and_reuse(cache, sys_config):
+    write_output(sys_config, "001_aaaaaaaa_hello.wav")
+    cache.store("a" * 40, "001_aaaaaaaa_hello.wav", 1.5, kana="ハロー", phonemes="[]")
+
+    entry = cache.lookup("a" * 40)
+    assert entry is not None
+    assert entry.duration == 1.5
+    assert entry.kana == "ハロー"
+
+    # A re-created record reuses the blob under its own filename
+    assert cache.materialize("a" * 40, "002_aaaaaaaa_hello.wav") is True
+    reused = os.path.join(sys_config.output_dir, "002_aaaaaaaa_hello.wav")
+    assert os.path.getsize(reused) == 1000
+
+
+def test_blob_survives_record_file_deletion(cache, sys_config):
+    """Text revert: the original record file is deleted, the cache still hits."""
+    path = write_output(sys_config, "001_bbbbbbbb_text.wav")
+    cache.store("b" * 40, "001_bbbbbbbb_text.wav", 1.0)
+    os.remove(path)
+
+    assert cache.lookup("b" * 40) is not None
+    assert cache.materialize("b" * 40, "001_bbbbbbbb_text.wav") is True
+    assert os.path.exists(path)
+
+
+def test_miss_and_counters(cache):
+    assert cache.lookup("c" * 40) is None
+    stats = cache.get_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 0
+    assert stats["hit_rate"] == 0.0
+
+
+def test_failed_materialize_is_not_a_hit(cache, sys_config, database):
+    write_output(sys_config, "001_eeeeeeee_x.wav")
+    cache.store("e" * 40, "001_eeeeeeee_x.wav", 1.0)
+    stored = database.get_cache_entry("e" * 40).last_used
+
+    assert cache.lookup("e" * 40) is not None
+    with patch.object(AudioCache, "_link_or_copy", side_effect=OSError("disk full")):
+        assert cache.materialize("e" * 40, "002_eeeeeeee_x.wav") is False
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (0, 1)
+    assert database.get_cache_entry("e" * 40).last_used == stored
+
+    assert cache.materialize("e" * 40, "002_eeeeeeee_x.wav") is True
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    assert database.get_cache_entry("e" * 40).last_used > stored
+
+
+def test_missing_blob_is_forgotten(cache, sys_config, database):
+    write_output(sys_config, "001_dddddddd_x.wav")
+    cache.store("d" * 40, "001_dddddddd_x.wav", 1.0)
+    os.remove(os.path.join(cache.get_cache_dir(), "d" * 40 + ".wav"))
+
+    assert cache.lookup("d" * 40) is None
+    assert database.get_cache_entry("d" * 40) is None
+
+
+def test_lru_eviction_by_size(cache, sys_config, database):
+    """Blobs held only by the cache are evicted oldest first beyond cache_max_mb."""
+    size = 400 * 1024
+    with patch("app.core.audio_cache.time.time", side_effect=range(100)):
+        for i, key in enumerate(["e", "f", "g"]):
+            path = write_output(sys_config, f"00{i}_{key * 8}_x.wav", size=size)
+            cache.store(key * 40, f"00{i}_{key * 8}_x.wav", 1.0)
+            os.remove(path)  # Record edited or deleted: only the blob is left
+            cache.evict()  # As the processor does after deleting it
+
+    # 3 * 400KB > 1MB -> the oldest entry ("e") is evicted
+    assert database.get_cache_entry("e" * 40) is None
+    assert database.get_cache_entry("f" * 40) is not None
+    assert database.get_cache_entry("g" * 40) is not None
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["total_bytes"] <= cache.max_bytes
+
+
+def test_blobs_linked_from_records_are_kept(cache, sys_config, database):
+    """Removing a blob a record file still links to would free no disk space."""
+    size = 400 * 1024
+    with patch("app.core.audio_cache.time.time", side_effect=range(100)):
+        for i, key in enumerate(["i", "j", "k"]):
+            write_output(sys_config, f"00{i}_{key * 8}_x.wav", size=size)
+            cache.store(key * 40, f"00{i}_{key * 8}_x.wav", 1.0)
+
+    stats = cache.get_stats()
+    assert stats["evictions"] == 0
+    assert stats["total_bytes"] == 0
+    assert stats["shared_bytes"] == 3 * size
+    for key in ["i", "j", "k"]:
+        assert database.get_cache_entry(key * 40) is not None
+
+
+def test_disk_usage_stays_under_limit(cache, sys_config):
+    """The bytes the cache alone keeps on disk never exceed cache_max_mb."""
+    size = 300 * 1024
+    previous = None
+    with patch("app.core.audio_cache.time.time", side_effect=range(100)):
+        for i, key in enumerate("0123456789"):
+            if previous and i % 3:
+                os.remove(previous)  # Most records are edited away later
+            filename = f"{i:03d}_{key * 8}_x.wav"
+            previous = write_output(sys_config, filename, size=size)
+            cache.store(key * 40, filename, 1.0)
+
+            cache_only = sum(
+                os.path.getsize(blob)
+                for blob in glob.glob(os.path.join(cache.get_cache_dir(), "*.wav"))
+                if os.stat(blob).st_nlink == 1
+            )
+            assert cache_only <= cache.max_bytes
+    assert cache.get_stats()["evictions"] > 0
+
+
+def test_disabled_when_limit_is_zero(cache, sys_config):
+    sys_config.cache_max_mb = 0
+    write_output(sys_config, "001_hhhhhhhh_x.wav")
+    cache.store("h" * 40, "001_hhhhhhhh_x.wav", 1.0)
+    assert cache.lookup("h" * 40) is None
+
+
+def test_processor_cache_hit_skips_voicevox(sys_config, database, cache):
+    """Duplicate utterances are served from the cache without VOICEVOX calls."""
+    from app.services.processor import StreamProcessor
+
+    audio_manager = MagicMock()
+    audio_manager.get_output_dir.return_value = sys_config.output_dir
+
+    def save_audio(data, filename):
+        write_output(sys_config, filename)
+        return 1.25
+
+    audio_manager.save_audio.side_effect = save_audio
+    vv_client = MagicMock()
+
+    with (
+        patch("app.services.processor.db_manager", database),
+        patch("app.core.events.event_manager"),
+        patch.object(StreamProcessor, "_prepare_query_data") as mock_query,
+    ):
+        mock_query.return_value = MagicMock(kana="テスト", accent_phrases=[])
+        processor = StreamProcessor(
+            vv_client,
+            audio_manager,
+            MagicMock(
+                chunk_max_chars=0,
+                local_resampling=False,
+                output_sample_rate=48000,
+                output_channels=2,
+            ),
+            cache,
+        )
+
+        first = database.add_transcription(Transcription(text="同じ文", speaker_id=1))
+        second = database.add_transcription(Transcription(text="同じ文", speaker_id=1))
+
+        processor.synthesize_item(first)
+        filename, duration = processor.synthesize_item(second)
+
+    assert mock_query.call_count == 1
+    assert vv_client.synthesis.call_count == 1
+    assert duration == 1.25
+    assert filename.startswith(f"{second:03d}_")
+    assert os.path.exists(os.path.join(sys_config.output_dir, filename))
+    assert database.get_transcription(second).kana == "テスト"
@@ -0,0 +1,196 @@
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.config.schemas import SynthesisConfig
+from app.core.audio_cache import AudioCache
+from app.core.database import DatabaseManager, Transcription
+from app.services.batch_synthesis import BatchSynthesizer
+
+
+class Recorder:
+    """Fake synthesize_item that tracks how many calls run at once."""
+
+    def __init__(self, delay=0.05, fail_ids=()):
+        self.delay = delay
+        self.fail_ids = set(fail_ids)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+
+    def __call__(self, db_id):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append(db_id)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if db_id in self.fail_ids:
+            raise RuntimeError("VOICEVOX offline")
+        return f"{db_id:03d}_hash_text.wav", 1.0
+
+
+def make_batch(synthesize, cached_ids=(), concurrency=2):
+    events = []
+    batch = BatchSynthesizer(
+        synthesize,
+        lambda db_id: ("cached.wav", 1.0) if db_id in cached_ids else None,
+        SynthesisConfig(batch_concurrency=concurrency),
+        publish=lambda event_type, data: events.append((event_type, data)),
+    )
+    return batch, events
+
+
+def test_concurrency_is_bounded():
+    synth = Recorder()
+    batch, events = make_batch(synth, concurrency=3)
+
+    batch.start(range(1, 13))
+    assert batch.wait(timeout=5)
+
+    assert sorted(synth.calls) == list(range(1, 13))
+    assert synth.max_active == 3
+    final = events[-1][1]
+    assert final["state"] == "done"
+    assert (final["completed"], final["remaining"]) == (12, 0)
+
+
+def test_cached_items_skip_voicevox():
+    synth = Recorder(delay=0)
+    batch, events = make_batch(synth, cached_ids={2, 4})
+
+    batch.start([1, 2, 3, 4])
+    batch.wait(timeout=5)
+
+    assert sorted(synth.calls) == [1, 3]
+    status = batch.get_status()
+    assert (status["completed"], status["cached"]) == (4, 2)
+    # One event at start, one per item, one at the end
+    assert [e for e, _ in events] == ["synthesis_batch_progress"] * 6
+    assert [d["completed"] for _, d in events] == [0, 1, 2, 3, 4, 4]
+
+
+def test_failures_are_reported_and_do_not_stop_the_batch():
+    synth = Recorder(delay=0, fail_ids={2})
+    batch, _ = make_batch(synth)
+
+    batch.start([1, 2, 3, 3])
+    batch.wait(timeout=5)
+
+    status = batch.get_status()
+    assert status["total"] == 3  # Duplicates dropped
+    assert (status["completed"], status["failed"]) == (2, 1)
+    assert status["failed_ids"] == [2]
+
+
+def test_one_batch_at_a_time_and_cancel():
+    release = threading.Event()
+    calls = []
+
+    def synthesize(db_id):
+        calls.append(db_id)
+        release.wait(timeout=5)
+        return "x.wav", 1.0
+
+    batch, _ = make_batch(synthesize, concurrency=1)
+    batch.start([1, 2, 3])
+    time.sleep(0.05)
+    with pytest.raises(RuntimeError):
+        batch.start([4])
+
+    batch.cancel()
+    release.set()
+    assert batch.wait(timeout=5)
+    assert calls == [1]
+    assert batch.get_status()["state"] == "cancelled"
+
+
+def test_processor_batch_with_cache(tmp_path):
+    """End to end: pending ids from the DB, duplicate text served from the cache."""
+    from app.services.processor import StreamProcessor
+
+    sys_config = SimpleNamespace(output_dir=str(tmp_path), cache_max_mb=1)
+    database = DatabaseManager(sys_config)
+    cache = AudioCache(sys_config, database)
+    audio_manager = MagicMock()
+    audio_manager.get_output_dir.return_value = str(tmp_path)
+
+    def save_audio(data, filename):
+        with open(os.path.join(str(tmp_path), filename), "wb") as f:
+            f.write(b"\0" * 100)
+        return 1.5
+
+    audio_manager.save_audio.side_effect = save_audio
+    vv_client = MagicMock()
+
+    with (
+        patch("app.services.processor.db_manager", database),
+        patch("app.core.events.event_manager"),
+        patch.object(StreamProcessor, "_prepare_query_data") as mock_query,
+    ):
+        mock_query.return_value = MagicMock(kana="テスト", accent_phrases=[])
+        processor = StreamProcessor(
+            vv_client, audio_manager, SynthesisConfig(batch_concurrency=2), cache
+        )
+        first = database.add_transcription(Transcription(text="同じ文", speaker_id=1))
+        processor.synthesize_item(first)
+        ids = [
+            database.add_transcription(Transcription(text=text, speaker_id=1))
+            for text in ("同じ文", "別の文", "三つ目")
+        ]
+        assert database.get_pending_ids() == ids
+
+        processor.batch_synthesizer.start(database.get_pending_ids())
+        assert processor.batch_synthesizer.wait(timeout=5)
+        status = processor.batch_synthesizer.get_status()
+        processor.shutdown()
+
+    assert (status["completed"], status["cached"]) == (3, 1)
+    assert vv_client.synthesis.call_count == 3  # first + two new texts
+    assert database.get_pending_ids() == []
+    database.close_all_connections()
+
+
+def test_route_status_codes():
+    from app import create_app
+
+    client = create_app().test_client()
+    status = {
+        "job_id": 1,
+        "state": "running",
+        "total": 2,
+        "completed": 0,
+        "cached": 0,
+        "failed": 0,
+        "failed_ids": [],
+        "remaining": 2,
+    }
+    with (
+        patch("app.api.routes.control.processor.batch_synthesizer") as batch,
+        patch("app.api.routes.control.vv_client") as vv_client,
+    ):
+        batch.start.return_value = status
+        res = client.post("/api/control/synthesize_batch", json={"ids": [1, 2]})
+        assert res.status_code == 200
+        assert res.get_json()["state"] == "running"
+        batch.start.assert_called_once_with([1, 2])
+
+        batch.start.side_effect = RuntimeError("Batch synthesis is already running")
+        res = client.post("/api/control/synthesize_batch", json={"ids": [1]})
+        assert res.status_code == 409
+
+        vv_client.is_available.return_value = False
+        res = client.post("/api/control/synthesize_batch", json={"ids": [1]})
+        assert res.status_code == 503
+
+        res = client.post("/api/control/synthesize_batch", json={"ids": "x"})
+        assert res.status_code == 400
+
+        batch.get_status.return_value = None
+        assert client.get("/api/control/synthesize_batch").status_code == 404
@@ -0,0 +1,162 @@
+import io
+import os
+import threading
+import time
+import wave
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.config.schemas import SynthesisConfig
+from app.core.database import DatabaseManager, Transcription
+from app.core.phonemes import PhonemeTimeline
+from app.core.scheduler import RequestScheduler
+from app.core.text_chunks import split_text
+from app.core.wav import concat_wav, parse_wav_header
+
+
+def make_wav(seconds, rate=24000):
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(b"\x00\x00" * int(rate * seconds))
+    return buf.getvalue()
+
+
+def test_split_text_at_sentences_and_clauses():
+    text = "今日はいい天気ですね。明日は雨が降るそうです！「本当？」と聞いた。"
+    assert split_text(text, 12) == [
+        "今日はいい天気ですね。",
+        "明日は雨が降るそうです！",
+        "「本当？」",
+        "と聞いた。",
+    ]
+    # Over-long sentence: packed clauses up to the limit
+    assert split_text("長い文章で、読点が、たくさんあって、区切れる。", 10) == [
+        "長い文章で、読点が、",
+        "たくさんあって、",
+        "区切れる。",
+    ]
+    # Disabled, short text, or nothing to split at
+    assert split_text(text, 0) == [text]
+    assert split_text("短い。文。", 40) == ["短い。文。"]
+    assert split_text("区切りのない長い文字列", 4) == ["区切りのない長い文字列"]
+
+
+def test_concat_wav():
+    joined = concat_wav([make_wav(0.5), make_wav(0.25)])
+    info = parse_wav_header(joined)
+    assert info.duration == pytest.approx(0.75)
+    assert len(joined) == 44 + info.data_size
+
+    with pytest.raises(ValueError):
+        concat_wav([make_wav(0.1), make_wav(0.1, rate=48000)])
+
+
+@pytest.fixture
+def chunk_env(tmp_path):
+    from app.services.processor import StreamProcessor
+
+    database = DatabaseManager(SimpleNamespace(output_dir=str(tmp_path)))
+    audio_manager = MagicMock()
+    audio_manager.get_output_dir.return_value = str(tmp_path)
+
+    def save_audio(data, filename):
+        with open(os.path.join(str(tmp_path), filename), "wb") as f:
+            f.write(data)
+        return parse_wav_header(data).duration
+
+    audio_manager.save_audio.side_effect = save_audio
+    vv_client = MagicMock()
+    vv_client.scheduler = RequestScheduler(lambda: 4)
+
+    def query_for(text, speaker_id, config_dict):
+        # One mora per chunk: "a" right after the 0.1 s leading silence
+        return MagicMock(
+            kana=text.rstrip("。"),
+            prePhonemeLength=0.1,
+            speedScale=1.0,
+            pauseLengthScale=1.0,
+            accent_phrases=[{"moras": [{"vowel": "a", "vowel_length": 0.2}]}],
+        )
+
+    with (
+        patch("app.services.processor.db_manager", database),
+        patch("app.core.events.event_manager"),
+        patch.object(StreamProcessor, "_prepare_query_data", side_effect=query_for),
+    ):
+        processor = StreamProcessor(
+            vv_client,
+            audio_manager,
+            SynthesisConfig(chunk_max_chars=6, prefetch_count=0),
+        )
+        yield processor, database, vv_client, tmp_path
+        processor.shutdown()
+    database.close_all_connections()
+
+
+def test_first_chunk_is_delivered_before_the_rest_is_synthesized(chunk_env):
+    processor, database, vv_client, tmp_path = chunk_env
+    last_done = threading.Event()
+
+    def synthesis(query, speaker_id, **output_format):
+        # The last sentence is slow; the first one is quick
+        if query.kana == "三つ目です":
+            time.sleep(0.2)
+            last_done.set()
+            return make_wav(0.75)
+        return make_wav(0.5)
+
+    vv_client.synthesis.side_effect = synthesis
+    db_id = database.add_transcription(
+        Transcription(text="一つ目。二つ目。三つ目です。", speaker_id=1)
+    )
+
+    delivered = []
+
+    def on_chunk(index, data, filename):
+        delivered.append((index, last_done.is_set(), filename))
+
+    filename, duration = processor.synthesize_item(db_id, on_chunk=on_chunk)
+
+    assert [d[0] for d in delivered] == [0, 1, 2]
+    assert delivered[0][1] is False
+    assert all(d[2] == filename for d in delivered)
+    assert duration == pytest.approx(1.75)
+    info = parse_wav_header((tmp_path / filename).read_bytes())
+    assert info.duration == pytest.approx(1.75)
+
+    record = database.get_transcription(db_id)
+    assert record.kana == "一つ目、二つ目、三つ目です"
+    assert PhonemeTimeline.load(record.phonemes).to_json()["t"] == [
+        0.1,
+        0.6,
+        1.1,
+    ]
+
+
+def test_play_starts_with_first_chunk():
+    from app.services.control_service import play_audio_handler
+
+    audio_manager = MagicMock()
+    audio_manager.play_data.side_effect = [(0.5, 100.0), (0.75, 100.1)]
+    processor = MagicMock()
+
+    def synthesize_item(db_id, on_chunk=None):
+        on_chunk(0, make_wav(0.5), "001_x.wav")
+        on_chunk(1, make_wav(0.75), "001_x.wav")
+        return "001_x.wav", 1.25
+
+    processor.synthesize_item.side_effect = synthesize_item
+    with patch("app.core.database.db_manager") as db:
+        db.get_transcription.return_value = MagicMock(
+            output_path=None, audio_duration=0
+        )
+        duration, start = play_audio_handler(1, audio_manager, processor, "req")
+
+    assert (duration, start) == (1.25, 100.0)
+    assert audio_manager.play_data.call_count == 2
+    audio_manager.play_audio.assert_not_called()
@@ -0,0 +1,224 @@
+import sqlite3
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.core.database import DatabaseManager
+
+
+@pytest.fixture
+def sys_config(tmp_path):
+    return SimpleNamespace(output_dir=str(tmp_path / "out_a"))
+
+
+@pytest.fixture
+def db_mgr(sys_config):
+    mgr = DatabaseManager(sys_config)
+    yield mgr
+    mgr.close_all_connections()
+
+
+def test_connection_is_reused(db_mgr):
+    """Sequential operations share one pooled connection."""
+    db_id = db_mgr.add_transcription("hello", 1, {})
+    db_mgr.flush()
+    first = db_mgr._idle[0]
+
+    db_mgr.get_transcription(db_id)
+    db_mgr.update_audio_info(db_id, "001_hash_hello.wav", 1.0)
+    db_mgr.flush()
+
+    assert len(db_mgr._idle) == 1
+    assert db_mgr._idle[0] is first
+
+
+def test_schema_initialized_once_per_path(db_mgr):
+    """CREATE TABLE / migration checks are not repeated for every call."""
+    with patch.object(
+        DatabaseManager, "_init_db_conn", wraps=db_mgr._init_db_conn
+    ) as mock_init:
+        for i in range(20):
+            db_mgr.add_transcription(f"text {i}", 1, {})
+            db_mgr.get_recent_logs(limit=5)
+
+    assert mock_init.call_count == 1
+
+
+def test_pool_invalidated_on_output_dir_change(db_mgr, sys_config, tmp_path):
+    """Changing output_dir closes idle connections to the old database."""
+    db_mgr.add_transcription("in a", 1, {})
+    db_mgr.flush()
+    old_conn = db_mgr._idle[0]
+
+    sys_config.output_dir = str(tmp_path / "out_b")
+    new_id = db_mgr.add_transcription("in b", 1, {})
+
+    assert new_id == 1
+    assert db_mgr._idle_path.endswith("transcriptions.db")
+    assert "out_b" in db_mgr._idle_path
+    with pytest.raises(sqlite3.ProgrammingError):
+        old_conn.execute("SELECT 1")
+
+
+def test_close_all_connections(db_mgr):
+    db_mgr.add_transcription("hello", 1, {})
+    db_mgr.flush()
+    conn = db_mgr._idle[0]
+
+    db_mgr.close_all_connections()
+
+    assert db_mgr._idle == []
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+    # The manager keeps working after invalidation
+    assert db_mgr.get_recent_logs(limit=1)[0].text == "hello"
+
+
+def test_externally_closed_connection_is_discarded(db_mgr):
+    db_mgr.add_transcription("hello", 1, {})
+    db_mgr.flush()
+    db_mgr._idle[0].close()
+
+    assert db_mgr.get_recent_logs(limit=1)[0].text == "hello"
+
+
+def test_concurrent_inserts_from_threads(db_mgr):
+    """Pooled connections can be used safely from many threads."""
+    ids = []
+    lock = threading.Lock()
+
+    def worker(n):
+        for i in range(10):
+            db_id = db_mgr.add_transcription(f"thread {n} item {i}", 1, {})
+            with lock:
+                ids.append(db_id)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(ids) == 80
+    assert len(set(ids)) == 80
+    assert len(db_mgr._idle) <= DatabaseManager.POOL_SIZE
+
+
+def test_burst_writes_share_one_commit(db_mgr, sys_config):
+    """Inserts/updates within the batch window are committed together."""
+    db_mgr.add_transcription("warm up", 1, {})
+    db_mgr.flush()
+    conn = db_mgr._idle[0]
+    before = conn.total_changes
+
+    ids = [db_mgr.add_transcription(f"burst {i}", 1, {}) for i in range(10)]
+    for db_id in ids:
+        db_mgr.update_audio_info(db_id, f"{db_id:03d}_hash.wav", 1.0)
+
+    # IDs are assigned synchronously, but nothing is committed yet
+    assert ids == list(range(2, 12))
+    assert db_mgr._batch_size == 20
+    other = sqlite3.connect(db_mgr._get_db_path())
+    assert other.execute("SELECT COUNT(*) FROM transcriptions").fetchone()[0] == 1
+
+    db_mgr.flush()
+    assert other.execute("SELECT COUNT(*) FROM transcriptions").fetchone()[0] == 11
+    assert conn.total_changes - before == 20
+    other.close()
+
+
+def test_reads_see_deferred_writes(db_mgr):
+    db_id = db_mgr.add_transcription("pending", 1, {})
+    db_mgr.update_audio_info(db_id, "001_hash_pending.wav", 2.0)
+
+    t = db_mgr.get_transcription(db_id)
+    assert t.text == "pending"
+    assert t.audio_duration == 2.0
+
+    # Read through the batch's own connection: nothing was committed early
+    assert db_mgr._batch_size == 2
+    other = sqlite3.connect(db_mgr._get_db_path())
+    assert other.execute("SELECT COUNT(*) FROM transcriptions").fetchone()[0] == 0
+    other.close()
+
+
+def hold_read_lock(db_mgr):
+    """Open read transaction elsewhere: keeps the batch commit from taking its lock."""
+    db_mgr._batch[0].execute("PRAGMA busy_timeout = 0")
+    reader = sqlite3.connect(db_mgr._get_db_path(), isolation_level=None)
+    reader.execute("BEGIN")
+    reader.execute("SELECT COUNT(*) FROM transcriptions").fetchone()
+    return reader
+
+
+def test_failed_commit_rolls_back_and_raises(db_mgr):
+    lost = []
+    db_mgr.on_rows_lost = lost.extend
+    first = db_mgr.add_transcription("lost", 1, {})
+    second = db_mgr.add_transcription("lost too", 1, {})
+
+    reader = hold_read_lock(db_mgr)
+    with pytest.raises(sqlite3.OperationalError):
+        db_mgr.flush()
+    reader.execute("COMMIT")
+    reader.close()
+
+    assert db_mgr._batch is None
+    assert lost == [first, second]
+    assert db_mgr.get_recent_logs() == []
+
+    # The rollback reverted sqlite_sequence too: the lost IDs stay unused
+    next_id = db_mgr.add_transcription("next", 1, {})
+    db_mgr.flush()
+    assert next_id == second + 1
+    assert [t.id for t in db_mgr.get_recent_logs()] == [next_id]
+
+
+def test_failed_timer_commit_reports_lost_ids(db_mgr):
+    db_mgr.WRITE_BATCH_WINDOW = 0.01
+    lost = []
+    db_mgr.on_rows_lost = lost.extend
+    kept = db_mgr.add_transcription("kept", 1, {})
+    db_mgr.flush()
+
+    db_id = db_mgr.add_transcription("lost", 1, {})
+    reader = hold_read_lock(db_mgr)
+    db_mgr._flush_timer.join(1.0)
+    reader.execute("COMMIT")
+    reader.close()
+
+    assert lost == [db_id]
+    assert db_mgr.get_transcription(db_id) is None
+    assert db_mgr.add_transcription("next", 1, {}) == db_id + 1
+    assert kept < db_id
+
+
+def test_batch_window_commits_automatically(db_mgr):
+    db_mgr.WRITE_BATCH_WINDOW = 0.01
+    db_mgr.add_transcription("timer", 1, {})
+
+    timer = db_mgr._flush_timer
+    timer.join(1.0)
+
+    assert db_mgr._batch is None
+    other = sqlite3.connect(db_mgr._get_db_path())
+    assert other.execute("SELECT COUNT(*) FROM transcriptions").fetchone()[0] == 1
+    other.close()
+
+
+def test_pending_writes_follow_their_database(db_mgr, sys_config, tmp_path):
+    """Switching output_dir commits pending writes to the old database first."""
+    db_mgr.add_transcription("in a", 1, {})
+    path_a = db_mgr._get_db_path()
+
+    sys_config.output_dir = str(tmp_path / "out_b")
+    db_mgr.add_transcription("in b", 1, {})
+    db_mgr.flush()
+
+    conn_a = sqlite3.connect(path_a)
+    assert conn_a.execute("SELECT text FROM transcriptions").fetchall() == [("in a",)]
+    conn_a.close()
+    assert [t.text for t in db_mgr.get_recent_logs()] == ["in b"]
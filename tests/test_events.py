@@ -0,0 +1,133 @@
+import json
+import queue
+import threading
+import time
+
+import pytest
+
+from app.core.events import EventManager
+
+
+class SmallEventManager(EventManager):
+    BUFFER_SIZE = 8
+
+
+def payload(frame):
+    return json.loads(frame[len("data: ") :])
+
+
+def test_subscribers_share_encoded_frames():
+    em = EventManager()
+    a = em.subscribe()
+    b = em.subscribe()
+
+    em.publish("log_added", {"id": 1})
+
+    event_a = a.next_event(timeout=1)
+    event_b = b.next_event(timeout=1)
+    # Encoded once, the same object is handed to every subscriber
+    assert event_a is event_b
+    assert payload(event_a.frame) == {"type": "log_added", "data": {"id": 1}}
+    assert em.get_stats()["subscribers"] == 2
+
+
+def test_new_subscriber_only_sees_new_events():
+    em = EventManager()
+    em.publish("log_added", {"id": 1})
+    sub = em.subscribe()
+    em.publish("log_added", {"id": 2})
+
+    assert payload(sub.get(timeout=1))["data"] == {"id": 2}
+    with pytest.raises(queue.Empty):
+        sub.get(timeout=0.05)
+
+
+def test_get_blocks_until_publish():
+    em = EventManager()
+    sub = em.subscribe()
+    threading.Timer(0.05, em.publish, args=("server_restart",)).start()
+
+    start = time.monotonic()
+    assert payload(sub.get(timeout=2))["type"] == "server_restart"
+    assert time.monotonic() - start < 1
+
+
+def test_state_events_are_coalesced():
+    em = EventManager()
+    sub = em.subscribe()
+
+    em.publish("config_update", {"v": 1})
+    em.publish("log_added", {"id": 1})
+    em.publish("config_update", {"v": 2})
+    em.publish("resolve_status", {"available": False})
+    em.publish("resolve_status", {"available": True})
+
+    received = [payload(sub.get(timeout=1)) for _ in range(3)]
+    assert received == [
+        {"type": "log_added", "data": {"id": 1}},
+        {"type": "config_update", "data": {"v": 2}},
+        {"type": "resolve_status", "data": {"available": True}},
+    ]
+    assert em.get_stats()["coalesced"] == 2
+
+
+def test_already_read_events_are_not_redelivered_after_coalescing():
+    em = EventManager()
+    sub = em.subscribe()
+
+    em.publish("config_update", {"v": 1})
+    assert payload(sub.get(timeout=1))["data"] == {"v": 1}
+    em.publish("config_update", {"v": 2})
+    assert payload(sub.get(timeout=1))["data"] == {"v": 2}
+
+
+def test_slow_subscriber_drops_are_counted():
+    em = SmallEventManager()
+    slow = em.subscribe()
+    fast = em.subscribe()
+
+    for i in range(12):
+        em.publish("log_added", {"id": i})
+        assert payload(fast.get(timeout=1))["data"] == {"id": i}
+
+    # Only the last BUFFER_SIZE events are still available
+    assert payload(slow.get(timeout=1))["data"] == {"id": 4}
+    assert slow.dropped == 4
+    assert fast.dropped == 0
+    stats = em.get_stats()
+    assert stats["dropped"] == 4
+    assert stats["buffered"] == 8
+    assert stats["published"] == 12
+
+
+def test_resume_from_last_event_id():
+    em = EventManager()
+    sub = em.subscribe()
+    em.publish("log_added", {"id": 1})
+    last_id = em.event_id(sub.next_event(timeout=1))
+    em.unsubscribe(sub)
+
+    # Published while the client was reconnecting
+    em.publish("log_added", {"id": 2})
+    em.publish("log_added", {"id": 3})
+
+    resumed = em.subscribe(last_event_id=last_id)
+    assert resumed.resumed
+    assert payload(resumed.get(timeout=1))["data"] == {"id": 2}
+    assert payload(resumed.get(timeout=1))["data"] == {"id": 3}
+
+
+def test_resume_rejects_unknown_ids():
+    em = SmallEventManager()
+    sub = em.subscribe()
+    em.publish("log_added", {"id": 0})
+    old_id = em.event_id(sub.next_event(timeout=1))
+    for i in range(10):
+        em.publish("log_added", {"id": i + 1})
+
+    # Evicted from the buffer, another server run, or malformed
+    for event_id in (old_id, "1-1", "garbage", f"{em._epoch}-999"):
+        fresh = em.subscribe(last_event_id=event_id)
+        assert not fresh.resumed
+        with pytest.raises(queue.Empty):
+            fresh.get(timeout=0.01)
@@ -0,0 +1,150 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.core import export
+from app.core.database import DatabaseManager, Transcription
+from app.core.export import format_timestamp, iter_cues, iter_wav
+from app.core.phonemes import PhonemeTimeline
+from app.core.wav import parse_wav_header, wav_header
+
+RATE = 48000
+
+
+def write_line(tmp_path, name, seconds, value, sample_rate=RATE, channels=2):
+    frames = int(sample_rate * seconds)
+    pcm = np.full(frames * channels, value, dtype="<i2").tobytes()
+    with open(tmp_path / name, "wb") as f:
+        f.write(wav_header(sample_rate, channels, 16, len(pcm)) + pcm)
+    return frames / sample_rate
+
+
+@pytest.fixture
+def history(tmp_path):
+    database = DatabaseManager(SimpleNamespace(output_dir=str(tmp_path)))
+    ids = []
+    lines = [
+        ("こんにちは", 0.5, 100, RATE, 2),
+        ("保留中", None, 0, RATE, 2),  # No audio yet: not exported
+        ("<二行目>\n\nです", 0.25, 200, 24000, 1),  # Converted to the export format
+        ("消えた", 0.3, 0, RATE, 2),  # File missing: silence
+    ]
+    onset = PhonemeTimeline.from_list([{"t": 0.1, "p": "k"}, {"t": 0.2, "p": "o"}])
+    for text, seconds, value, rate, channels in lines:
+        db_id = database.add_transcription(Transcription(text=text, speaker_id=1))
+        ids.append(db_id)
+        if seconds is None:
+            continue
+        name = f"{db_id}.wav"
+        duration = write_line(tmp_path, name, seconds, value, rate, channels)
+        if text == "消えた":
+            (tmp_path / name).unlink()
+        database.update_audio_info(db_id, name, duration, phonemes=onset.to_bytes())
+    yield SimpleNamespace(dir=tmp_path, database=database, ids=ids)
+    database.close_all_connections()
+
+
+def test_format_timestamp():
+    assert format_timestamp(3723.4567) == "01:02:03,457"
+    assert format_timestamp(59.9996, ".") == "00:01:00.000"
+
+
+def test_srt_and_vtt(history):
+    start, end = history.ids[0], history.ids[-1]
+    body, mimetype, length = export.export_history(
+        history.database, str(history.dir), "srt", start, end, RATE, 2
+    )
+    srt = b"".join(body).decode("utf-8")
+    assert mimetype == "application/x-subrip" and length is None
+    assert srt == (
+        "1\n00:00:00,100 --> 00:00:00,500\nこんにちは\n\n"
+        "2\n00:00:00,600 --> 00:00:00,750\n<二行目>\nです\n\n"
+        "3\n00:00:00,850 --> 00:00:01,050\n消えた\n\n"
+    )
+
+    body, mimetype, _ = export.export_history(
+        history.database, str(history.dir), "vtt", start, end, RATE, 2
+    )
+    vtt = b"".join(body).decode("utf-8")
+    assert mimetype == "text/vtt"
+    assert vtt.startswith("WEBVTT\n\n")
+    assert "00:00:00.600 --> 00:00:00.750\n&lt;二行目&gt;\nです\n" in vtt
+
+
+def test_concatenated_wav(history):
+    body, _, length = export.export_history(
+        history.database,
+        str(history.dir),
+        "wav",
+        history.ids[0],
+        history.ids[-1],
+        RATE,
+        2,
+    )
+    data = b"".join(body)
+    assert len(data) == length
+
+    info = parse_wav_header(data)
+    assert (info.sample_rate, info.channels) == (RATE, 2)
+    assert info.duration == pytest.approx(1.05)
+    samples = np.frombuffer(data, "<i2", offset=info.data_offset).reshape(-1, 2)
+    assert (samples[: int(0.5 * RATE)] == 100).all()
+    # Upsampled mono line sits exactly where its subtitle says
+    second = samples[int(0.5 * RATE) : int(0.75 * RATE)]
+    assert np.abs(second[RATE // 40 : -RATE // 40] - 200).max() <= 1
+    assert (samples[int(0.75 * RATE) :] == 0).all()
+
+
+def test_export_streams_in_pages(history, monkeypatch):
+    monkeypatch.setattr(export, "PAGE_SIZE", 1)
+    queries = []
+    get_rows = history.database.get_export_rows
+
+    def counting(*args):
+        queries.append(args)
+        return get_rows(*args)
+
+    history.database.get_export_rows = counting
+    cues = iter_cues(history.database, history.ids[0], history.ids[-1], RATE)
+    assert next(cues).text == "こんにちは"
+    assert len(queries) == 1  # Later pages are only read as the stream advances
+    assert [cue.id for cue in cues] == [history.ids[2], history.ids[3]]
+
+    # Rows removed after the WAV header was sent are padded with silence
+    chunks = list(iter_wav(iter([]), str(history.dir), RATE, 2, 10))
+    assert len(b"".join(chunks)) == 44 + 40
+
+
+def test_export_endpoint(history):
+    from app import create_app
+    from app.api.routes import history as routes
+
+    client = create_app().test_client()
+    with (
+        patch.object(routes, "db_manager", history.database),
+        patch.object(
+            routes.audio_manager, "get_output_dir", return_value=str(history.dir)
+        ),
+    ):
+        url = f"/api/export?from={history.ids[0]}&to={history.ids[-1]}"
+        srt = client.get(url)
+        wav = client.get(url + "&format=wav")
+        bad_format = client.get(url + "&format=mp3")
+        bad_range = client.get("/api/export?from=5&to=1")
+        bad_id = client.get("/api/export?from=x&to=1")
+        with patch.object(export, "MAX_WAV_DATA_BYTES", 10):
+            too_long = client.get(url + "&format=wav")
+
+    assert srt.status_code == 200
+    assert "export_" in srt.headers["Content-Disposition"]
+    assert srt.get_data(as_text=True).startswith("1\n00:00:00,100")
+    assert int(wav.headers["Content-Length"]) == len(wav.get_data())
+    assert bad_format.status_code == 400 and bad_range.status_code == 400
+    assert bad_format.get_json()["message"].startswith("format:")
+    assert bad_id.status_code == 400
+    # Same error shape as a rejected parameter
+    assert too_long.status_code == 400
+    assert too_long.get_json()["error_code"] == "INVALID_ARGUMENT"
+    assert bad_format.get_json()["error_code"] == "INVALID_ARGUMENT"
@@ -0,0 +1,71 @@
+import json
+
+from app.core.json_stream import JsonStreamParser
+
+
+def feed_all(parser, chunks):
+    results = []
+    for chunk in chunks:
+        results.extend(parser.feed(chunk))
+    return results
+
+
+def test_concatenated_objects_in_one_chunk():
+    parser = JsonStreamParser()
+    data = b'{"text": "a"}{"text": "b"}\n{"text": "c"}\n'
+
+    assert [o["text"] for o in parser.feed(data)] == ["a", "b", "c"]
+
+
+def test_braces_inside_strings_and_nested_objects():
+    obj = {
+        "text": '閉じ括弧 } と開き括弧 { と \\" 引用符',
+        "segments": [{"start": 0, "end": 1, "tokens": [{"t": "}"}]}],
+    }
+    parser = JsonStreamParser()
+
+    assert parser.feed(json.dumps(obj, ensure_ascii=False).encode("utf-8")) == [obj]
+
+
+def test_split_at_every_byte_including_utf8_boundaries():
+    objs = [
+        {"text": "こんにちは、世界"},
+        {"text": 'escape \\ and "quote" }'},
+        {"text": "絵文字 😀"},
+    ]
+    data = "\n".join(json.dumps(o, ensure_ascii=False) for o in objs).encode("utf-8")
+    parser = JsonStreamParser()
+
+    assert feed_all(parser, [data[i : i + 1] for i in range(len(data))]) == objs
+
+
+def test_malformed_object_is_skipped():
+    parser = JsonStreamParser()
+    data = b'{"text": oops}\n{"text": "ok"}'
+
+    assert parser.feed(data) == [{"text": "ok"}]
+
+
+def test_noise_between_objects_is_ignored():
+    parser = JsonStreamParser()
+    data = b'[{"text": "a"}, {"text": "b"}]\r\n'
+
+    assert [o["text"] for o in parser.feed(data)] == ["a", "b"]
+    assert parser._buffer == ""
+
+
+def test_pending_buffer_holds_only_unfinished_object():
+    parser = JsonStreamParser()
+    parser.feed(b'{"text": "done"}' * 100 + b'{"text": "par')
+
+    assert parser._buffer == '{"text": "par'
+    assert parser.feed(b'tial"}') == [{"text": "partial"}]
+
+
+def test_oversized_pending_object_is_dropped():
+    parser = JsonStreamParser()
+    parser.MAX_PENDING = 64
+
+    parser.feed(b'{"text": "' + b"x" * 100)
+    assert parser._buffer == ""
+    assert parser.feed(b'{"text": "next"}') == [{"text": "next"}]
@@ -0,0 +1,114 @@
+import sqlite3
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.database import DatabaseManager, Transcription
+from app.core.voicevox import VoiceVoxClient
+from app.services.processor import StreamProcessor
+
+
+@pytest.fixture
+def database(tmp_path):
+    mgr = DatabaseManager(SimpleNamespace(output_dir=str(tmp_path)))
+    yield mgr
+    mgr.close_all_connections()
+
+
+@pytest.fixture
+def events():
+    with patch("app.core.events.event_manager") as mock_manager:
+        yield mock_manager.publish
+
+
+@pytest.fixture
+def processor(database, events, tmp_path):
+    audio_manager = MagicMock()
+    audio_manager.get_output_dir.return_value = str(tmp_path)
+    with patch("app.services.processor.db_manager", database):
+        yield StreamProcessor(
+            MagicMock(spec=VoiceVoxClient), audio_manager, MagicMock()
+        )
+
+
+def published(events):
+    return [(c.args[0], c.args[1]) for c in events.call_args_list]
+
+
+def add(processor, database, text):
+    t = Transcription(text=text, speaker_id=1)
+    t.id = database.add_transcription(t)
+    processor._add_log_from_db(t)
+    return t.id
+
+
+def test_added_event_carries_entry(processor, database, events):
+    db_id = add(processor, database, "hello")
+
+    [(event_type, data)] = published(events)
+    assert event_type == "log_added"
+    assert data["seq"] == 1
+    assert data["id"] == db_id
+    assert data["entry"]["text"] == "hello"
+    assert data["entry"]["is_generated"] is False
+
+
+def test_sequence_is_monotonic_across_event_types(processor, database, events):
+    first = add(processor, database, "one")
+    second = add(processor, database, "two")
+    processor.audio_manager.delete_file.return_value = True
+    processor.update_log_text(first, "one (edited)")
+    processor.delete_log(second)
+
+    types = [t for t, _ in published(events)]
+    seqs = [d["seq"] for _, d in published(events)]
+    assert types == ["log_added", "log_added", "log_updated", "log_deleted"]
+    assert seqs == [1, 2, 3, 4]
+
+    _, updated = published(events)[2]
+    assert updated["entry"]["text"] == "one (edited)"
+    assert updated["entry"]["filename"] == f"pending_{first}.wav"
+    assert published(events)[3][1] == {"seq": 4, "id": second}
+
+
+def test_update_outside_window_reads_entry_from_db(processor, database, events):
+    db_id = database.add_transcription("old record", 1, {})
+
+    processor.update_log_text(db_id, "changed")
+
+    event_type, data = published(events)[-1]
+    assert event_type == "log_updated"
+    assert data["entry"]["id"] == db_id
+    assert data["entry"]["text"] == "changed"
+
+
+def test_reload_publishes_full_reset(processor, events):
+    processor.reload_history()
+
+    event_type, data = published(events)[-1]
+    assert event_type == "log_update"
+    assert data == {"seq": 1}
+
+
+def test_rolled_back_records_are_dropped(processor, database, events):
+    database.on_rows_lost = processor.discard_lost_records
+    kept = add(processor, database, "kept")
+    database.flush()
+    processor.synthesis_queue = MagicMock()
+
+    lost = add(processor, database, "lost")
+    # A read transaction elsewhere makes the batch commit fail
+    database._batch[0].execute("PRAGMA busy_timeout = 0")
+    reader = sqlite3.connect(database._get_db_path(), isolation_level=None)
+    reader.execute("BEGIN")
+    reader.execute("SELECT COUNT(*) FROM transcriptions").fetchone()
+    with pytest.raises(sqlite3.OperationalError):
+        database.flush()
+    reader.execute("COMMIT")
+    reader.close()
+
+    processor.synthesis_queue.discard.assert_called_once_with([lost])
+    assert processor.find_log(lost) is None
+    assert [log["id"] for log in processor.get_logs()] == [kept]
+    assert published(events)[-1] == ("log_deleted", {"seq": 3, "id": lost})
@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.core.database import DatabaseManager
+from app.core.voicevox import VoiceVoxClient
+from app.services.processor import StreamProcessor
+
+
+@pytest.fixture
+def database(tmp_path):
+    mgr = DatabaseManager(SimpleNamespace(output_dir=str(tmp_path)))
+    for i in range(1, 121):
+        mgr.add_transcription(f"Record {i}", 1, {}, speaker_name="A", speaker_style="B")
+    yield mgr
+    mgr.close_all_connections()
+
+
+@pytest.fixture
+def processor(database, tmp_path):
+    audio_manager = MagicMock()
+    audio_manager.get_output_dir.return_value = str(tmp_path)
+    with (
+        patch("app.services.processor.db_manager", database),
+        patch("app.core.events.event_manager"),
+    ):
+        yield StreamProcessor(
+            MagicMock(spec=VoiceVoxClient), audio_manager, MagicMock()
+        )
+
+
+def test_keyset_page_from_database(database):
+    page = database.get_recent_logs(limit=10, before_id=50)
+    assert [t.id for t in page] == list(range(49, 39, -1))
+
+    assert database.get_recent_logs(limit=10, before_id=3)[-1].id == 1
+    assert database.get_recent_logs(limit=10, before_id=1) == []
+
+
+def test_hot_window_is_limited_and_indexed(processor):
+    logs = processor.get_logs()
+    assert len(logs) == StreamProcessor.LOG_WINDOW_SIZE
+    assert logs[0]["id"] == 71
+    assert logs[-1]["id"] == 120
+
+    assert processor.find_log(100) is logs[29]
+    assert processor.find_log(70) is None
+
+    assert [log["id"] for log in processor.get_logs(limit=3)] == [118, 119, 120]
+
+
+def test_scroll_back_through_history(processor):
+    """Clients page backwards with the oldest ID they have as the cursor."""
+    seen = [log["id"] for log in processor.get_logs()]
+    while True:
+        page = processor.get_logs(before=seen[0], limit=25)
+        if not page:
+            break
+        seen = [log["id"] for log in page] + seen
+
+    assert seen == list(range(1, 121))
+    assert processor.get_logs(before=10, limit=3)[0]["text"] == "Record 7"
+
+
+def test_page_size_is_clamped(processor):
+    assert len(processor.get_logs(before=121, limit=10_000)) == 120
+    processor.MAX_PAGE_SIZE = 20
+    assert len(processor.get_logs(before=121, limit=10_000)) == 20
+
+
+def test_window_eviction_keeps_index_consistent(processor, database):
+    from app.core.database import Transcription
+
+    t = Transcription(id=121, text="new", speaker_id=1)
+    processor._add_log_from_db(t)
+
+    assert processor.find_log(71) is None
+    assert processor.find_log(121)["text"] == "new"
+    assert len(processor.get_logs()) == StreamProcessor.LOG_WINDOW_SIZE
+
+
+def test_delete_outside_window_returns_filename(processor, database):
+    database.update_audio_info(5, "005_hash_Record.wav", 1.0)
+
+    with patch("app.core.events.event_manager"):
+        assert processor.delete_log(5) == "005_hash_Record.wav"
+
+    assert database.get_transcription(5) is None
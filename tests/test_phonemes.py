@@ -0,0 +1,158 @@
+import json
+import os
+import sqlite3
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.core.database import DatabaseManager, Transcription
+from app.core.phonemes import PhonemeTimeline, extract_timeline
+
+ACCENT_PHRASES = [
+    {
+        "moras": [
+            {
+                "consonant": "k",
+                "consonant_length": 0.05,
+                "vowel": "o",
+                "vowel_length": 0.1,
+            },
+            {"consonant": None, "vowel": "N", "vowel_length": 0.08},
+        ],
+        "pause_mora": {"vowel": "pau", "vowel_length": 0.3},
+    },
+    {
+        "moras": [
+            {
+                "consonant": "ch",
+                "consonant_length": 0.06,
+                "vowel": "i",
+                "vowel_length": 0.12,
+            },
+            {
+                "consonant": "xx",
+                "consonant_length": 0.02,
+                "vowel": "a",
+                "vowel_length": 0.1,
+            },
+        ],
+        "pause_mora": None,
+    },
+]
+
+
+def reference_timeline(phrases, pre, speed, pause_scale):
+    """The original nested-loop extraction (JSON list form)."""
+    phonemes = []
+    current = pre
+    for phrase in phrases:
+        for mora in phrase["moras"]:
+            if mora.get("consonant"):
+                phonemes.append({"t": round(current, 3), "p": mora["consonant"]})
+                current += mora["consonant_length"] / speed
+            if mora.get("vowel"):
+                phonemes.append({"t": round(current, 3), "p": mora["vowel"]})
+                current += mora["vowel_length"] / speed
+        if phrase.get("pause_mora"):
+            current += phrase["pause_mora"]["vowel_length"] / speed * pause_scale
+    return phonemes
+
+
+def test_extract_matches_reference():
+    timeline = extract_timeline(ACCENT_PHRASES, 0.1, 1.25, 0.5)
+    expected = reference_timeline(ACCENT_PHRASES, 0.1, 1.25, 0.5)
+
+    assert timeline.times.dtype == np.float32 and timeline.ids.dtype == np.uint8
+    assert [p["p"] for p in timeline.to_list()] == [
+        "k", "o", "N", "ch", "i", "?", "a",
+    ]  # fmt: skip
+    assert [p["t"] for p in timeline.to_list()] == pytest.approx(
+        [p["t"] for p in expected], abs=1e-3
+    )
+    assert len(extract_timeline([{"moras": None}], 0.1)) == 0
+
+
+def test_blob_round_trip():
+    timeline = extract_timeline(ACCENT_PHRASES, 0.1)
+    blob = timeline.to_bytes()
+    assert len(blob) == 5 * len(timeline)
+
+    decoded = PhonemeTimeline.from_bytes(blob)
+    assert np.array_equal(decoded.times, timeline.times)
+    assert np.array_equal(decoded.ids, timeline.ids)
+    assert PhonemeTimeline.load(blob).to_json() == timeline.to_json()
+    assert PhonemeTimeline.load(None) is None
+    with pytest.raises(ValueError):
+        PhonemeTimeline.from_bytes(blob[:-1])
+
+    # Legacy JSON text and shifting/concatenation of chunk timelines
+    legacy = PhonemeTimeline.load('[{"t": 0.1, "p": "a"}, {"t": 0.25, "p": "k"}]')
+    joined = PhonemeTimeline.concat([legacy, legacy.shifted(1.0)])
+    assert joined.to_json() == {"t": [0.1, 0.25, 1.1, 1.25], "p": ["a", "k"] * 2}
+
+
+def test_json_rows_are_converted_on_open(tmp_path):
+    legacy = [{"t": 0.1, "p": "k"}, {"t": 0.15, "p": "o"}]
+    # Not in PHONEMES: a BLOB would turn it into "?" for good
+    unknown = [{"t": 0.1, "p": "xx"}]
+    with sqlite3.connect(os.path.join(str(tmp_path), "transcriptions.db")) as conn:
+        conn.execute(
+            "CREATE TABLE transcriptions (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "timestamp DATETIME, text TEXT, speaker_id INTEGER, phonemes TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO transcriptions (text, speaker_id, phonemes) VALUES (?, ?, ?)",
+            ("こんにちは", 1, json.dumps(legacy)),
+        )
+        conn.execute(
+            "INSERT INTO transcriptions (text, speaker_id, phonemes) VALUES (?, ?, ?)",
+            ("壊れた", 1, "not json"),
+        )
+        conn.execute(
+            "INSERT INTO transcriptions (text, speaker_id, phonemes) VALUES (?, ?, ?)",
+            ("未知", 1, json.dumps(unknown)),
+        )
+
+    database = DatabaseManager(SimpleNamespace(output_dir=str(tmp_path)))
+    try:
+        first = database.get_transcription(1)
+        assert isinstance(first.phonemes, bytes)
+        assert PhonemeTimeline.load(first.phonemes).to_list() == legacy
+        assert database.get_transcription(2).phonemes is None
+        kept = database.get_transcription(3).phonemes
+        assert json.loads(kept) == unknown
+        assert PhonemeTimeline.load(kept).to_list() == [{"t": 0.1, "p": "?"}]
+    finally:
+        database.close_all_connections()
+
+
+def test_phonemes_endpoint(tmp_path):
+    from app import create_app
+
+    database = DatabaseManager(SimpleNamespace(output_dir=str(tmp_path)))
+    timeline = extract_timeline(ACCENT_PHRASES, 0.1)
+    ids = [
+        database.add_transcription(Transcription(text=f"行{i}", speaker_id=1))
+        for i in range(4)
+    ]
+    for db_id in ids[:3]:
+        database.update_audio_info(
+            db_id, f"{db_id}.wav", 1.0, phonemes=timeline.to_bytes()
+        )
+
+    client = create_app().test_client()
+    with patch("app.api.routes.history.db_manager", database):
+        data = client.get(f"/api/phonemes?from={ids[1]}&to={ids[3]}").get_json()
+        bad = client.get("/api/phonemes?from=5&to=1")
+        missing = client.get("/api/phonemes?from=5")
+        not_a_number = client.get("/api/phonemes?from=a&to=9")
+    database.close_all_connections()
+
+    assert data["status"] == "ok" and data["truncated"] is False
+    assert [t["id"] for t in data["timelines"]] == ids[1:3]
+    assert data["timelines"][0]["p"] == timeline.to_json()["p"]
+    assert bad.status_code == 400
+    assert bad.get_json()["error_code"] == "INVALID_ARGUMENT"
+    assert missing.status_code == 400 and not_a_number.status_code == 400
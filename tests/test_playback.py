@@ -0,0 +1,515 @@
+import threading
+import time
+import wave
+from functools import partial
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+import sounddevice as sd
+
+from app.config.schemas import SystemConfig
+from app.core.playback import StreamPlayer
+
+
+class FakeOutputStream:
+    """
+    Stand-in for sd.OutputStream. Blocks are pulled manually with pump(),
+    and everything the callback wrote is kept in `written`.
+    """
+
+    def __init__(
+        self, samplerate, channels, dtype, blocksize, callback, finished_callback
+    ):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.dtype = dtype
+        self.blocksize = blocksize
+        self.callback = callback
+        self.finished_callback = finished_callback
+        self.active = False
+        self.closed = False
+        self.written = []
+
+    def start(self):
+        self.active = True
+
+    def abort(self):
+        if self.active:
+            self.active = False
+            self.finished_callback()
+
+    def close(self):
+        self.closed = True
+
+    def pump(self, blocks=1):
+        for _ in range(blocks):
+            if not self.active:
+                return
+            out = np.full((self.blocksize, self.channels), 7, dtype=self.dtype)
+            try:
+                self.callback(out, self.blocksize, None, None)
+            except sd.CallbackStop:
+                self.active = False
+            self.written.append(out.copy())
+            if not self.active:
+                self.finished_callback()
+
+    def run(self, interval=0.001):
+        """Pulls blocks on a background thread, like a real device."""
+
+        def loop():
+            while self.active:
+                self.pump()
+                time.sleep(interval)
+
+        threading.Thread(target=loop, daemon=True).start()
+
+    def output(self):
+        return np.concatenate(self.written)
+
+
+@pytest.fixture
+def fake_device():
+    streams = []
+
+    def factory(**kwargs):
+        stream = FakeOutputStream(**kwargs)
+        streams.append(stream)
+        return stream
+
+    return factory, streams
+
+
+def write_ramp(path, frames, samplerate=8000, channels=1):
+    samples = (np.arange(frames * channels) % 30000).astype("<i2")
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(samplerate)
+        w.writeframes(samples.tobytes())
+    return samples.reshape(-1, channels)
+
+
+def test_streams_file_in_blocks(tmp_path, fake_device):
+    factory, streams = fake_device
+    samples = write_ramp(tmp_path / "a.wav", 1000)
+    player = StreamPlayer(blocksize=256, dtype="int16", stream_factory=factory)
+
+    item = player.play(str(tmp_path / "a.wav"))
+    stream = streams[0]
+    assert stream.active
+    assert stream.blocksize == 256
+    assert stream.dtype == "int16"
+    assert player.is_active
+
+    stream.pump(4)
+
+    # 3 full blocks + 1 partial block padded with silence
+    assert item.wait(timeout=1)
+    assert player.wait(timeout=1)
+    assert player.position == 1000
+    out = stream.output()
+    assert np.array_equal(out[:1000], samples)
+    assert not out[1000:].any()
+
+    # The stream stays open (feeding silence) for the next item
+    assert stream.active and not stream.closed
+    stream.pump(1)
+    assert not stream.written[-1].any()
+    player.stop()
+    assert stream.closed
+
+
+def test_first_block_available_immediately(tmp_path, fake_device):
+    factory, streams = fake_device
+    samples = write_ramp(tmp_path / "a.wav", 48000, samplerate=48000, channels=2)
+    player = StreamPlayer(blocksize=128, dtype="int16", stream_factory=factory)
+
+    player.play(str(tmp_path / "a.wav"))
+    streams[0].pump(1)
+
+    assert np.array_equal(streams[0].output(), samples[:128])
+    assert player.position == 128
+    assert player.duration == pytest.approx(1.0)
+    player.stop()
+
+
+def test_float32_output(tmp_path, fake_device):
+    factory, streams = fake_device
+    samples = write_ramp(tmp_path / "a.wav", 300)
+    player = StreamPlayer(blocksize=512, stream_factory=factory)
+
+    item = player.play(str(tmp_path / "a.wav"))
+    streams[0].pump()
+
+    out = streams[0].output()
+    assert out.dtype == np.float32
+    assert np.allclose(out[:300], samples / 32768.0)
+    assert item.wait(timeout=1)
+    player.stop()
+
+
+def test_pause_outputs_silence_without_advancing(tmp_path, fake_device):
+    factory, streams = fake_device
+    samples = write_ramp(tmp_path / "a.wav", 1000)
+    player = StreamPlayer(blocksize=100, dtype="int16", stream_factory=factory)
+
+    player.play(str(tmp_path / "a.wav"))
+    stream = streams[0]
+    stream.pump(2)
+    player.pause()
+    stream.pump(3)
+    assert player.position == 200
+    assert player.is_paused
+
+    player.resume()
+    stream.pump(1)
+
+    out = stream.output()
+    assert not out[200:500].any()
+    assert np.array_equal(out[500:600], samples[200:300])
+    assert player.position == 300
+    player.stop()
+
+
+def test_seek_is_sample_accurate(tmp_path, fake_device):
+    factory, streams = fake_device
+    samples = write_ramp(tmp_path / "a.wav", 8000)
+    player = StreamPlayer(blocksize=100, dtype="int16", stream_factory=factory)
+
+    item = player.play(str(tmp_path / "a.wav"))
+    streams[0].pump(1)
+    player.seek(0.5)
+    assert player.position == 4000
+    streams[0].pump(1)
+
+    assert np.array_equal(streams[0].output()[100:200], samples[4000:4100])
+    assert player.position == 4100
+
+    # Seeking past the end clamps to the last frame and finishes the item
+    player.seek(10)
+    streams[0].pump(1)
+    assert item.wait(timeout=1)
+    assert player.position == 8000
+    player.stop()
+
+
+def test_stop_keeps_position_and_closes(tmp_path, fake_device):
+    factory, streams = fake_device
+    write_ramp(tmp_path / "a.wav", 1000)
+    player = StreamPlayer(blocksize=100, dtype="int16", stream_factory=factory)
+
+    item = player.play(str(tmp_path / "a.wav"))
+    streams[0].pump(3)
+    player.stop()
+
+    assert item.wait(timeout=0)
+    assert player.wait(timeout=0)
+    assert not player.is_active
+    assert streams[0].closed
+    assert player.position == 300
+    # Further callbacks are not delivered after stop
+    streams[0].pump(1)
+    assert len(streams[0].written) == 3
+
+
+def test_play_reuses_stream_for_same_format(tmp_path, fake_device):
+    factory, streams = fake_device
+    write_ramp(tmp_path / "a.wav", 1000)
+    write_ramp(tmp_path / "b.wav", 500)
+    write_ramp(tmp_path / "c.wav", 500, samplerate=16000)
+    player = StreamPlayer(blocksize=100, dtype="int16", stream_factory=factory)
+
+    first = player.play(str(tmp_path / "a.wav"))
+    streams[0].pump(1)
+    second = player.play(str(tmp_path / "b.wav"))
+
+    assert first.done
+    assert len(streams) == 1 and not streams[0].closed
+    assert player.position == 0
+    assert player.duration == pytest.approx(500 / 8000)
+
+    # A different sample rate needs a new device stream
+    player.play(str(tmp_path / "c.wav"))
+    assert second.done
+    assert streams[0].closed
+    assert len(streams) == 2
+    assert streams[1].samplerate == 16000
+    player.stop()
+
+
+def test_play_stops_old_stream_before_closing_its_file(tmp_path, fake_device):
+    factory, streams = fake_device
+    write_ramp(tmp_path / "a.wav", 1000)
+    write_ramp(tmp_path / "c.wav", 500, samplerate=16000)
+    player = StreamPlayer(blocksize=100, dtype="int16", stream_factory=factory)
+
+    first = player.play(str(tmp_path / "a.wav"))
+    streams[0].pump(1)
+    abort = streams[0].abort
+    seen = []
+
+    def abort_after_last_block():
+        # The device may still pull a block until it is stopped
+        streams[0].pump(1)
+        seen.append(first.done)
+        abort()
+
+    streams[0].abort = abort_after_last_block
+    player.play(str(tmp_path / "c.wav"))
+
+    assert seen == [False]
+    assert first.done and first.position == 200
+    player.stop()
+
+
+def test_enqueued_item_follows_without_gap(tmp_path, fake_device):
+    factory, streams = fake_device
+    a = write_ramp(tmp_path / "a.wav", 250)
+    b = write_ramp(tmp_path / "b.wav", 10000)
+    player = StreamPlayer(blocksize=100, dtype="int16", stream_factory=factory)
+
+    first = player.play(str(tmp_path / "a.wav"))
+    second = player.enqueue(str(tmp_path / "b.wav"))
+    assert second is not None and not second.started
+    # Preloading decoded the head of the next file up front
+    assert len(second.preroll) == StreamPlayer.PRELOAD_FRAMES
+
+    streams[0].pump(3)
+
+    # The switch happens inside the third block
+    assert first.done
+    assert second.started and not second.done
+    assert first.position == 250
+    assert second.position == 50
+    assert player.position == 50
+    assert np.array_equal(streams[0].output(), np.concatenate([a, b[:50]]))
+
+    # Past the preloaded head, reading continues from the file
+    streams[0].pump(100)
+    assert second.wait(timeout=1)
+    out = streams[0].output()
+    assert np.array_equal(out[: 250 + 10000], np.concatenate([a, b]))
+    assert len(streams) == 1
+    player.stop()
+
+
+def test_enqueue_rejections(tmp_path, fake_device):
+    factory, streams = fake_device
+    write_ramp(tmp_path / "a.wav", 1000)
+    write_ramp(tmp_path / "b.wav", 1000)
+    write_ramp(tmp_path / "stereo.wav", 1000, channels=2)
+    player = StreamPlayer(blocksize=100, dtype="int16", stream_factory=factory)
+
+    # Nothing playing
+    assert player.enqueue(str(tmp_path / "b.wav")) is None
+
+    player.play(str(tmp_path / "a.wav"))
+    # Format differs from the open stream
+    assert player.enqueue(str(tmp_path / "stereo.wav")) is None
+    # Only one item is preloaded at a time
+    assert player.enqueue(str(tmp_path / "b.wav")) is not None
+    assert player.enqueue(str(tmp_path / "b.wav")) is None
+    player.stop()
+
+
+def test_stop_drops_queued_item(tmp_path, fake_device):
+    factory, streams = fake_device
+    write_ramp(tmp_path / "a.wav", 1000)
+    write_ramp(tmp_path / "b.wav", 1000)
+    player = StreamPlayer(blocksize=100, dtype="int16", stream_factory=factory)
+
+    player.play(str(tmp_path / "a.wav"))
+    queued = player.enqueue(str(tmp_path / "b.wav"))
+    player.stop()
+
+    assert queued.done and not queued.started
+    assert queued.file is None
+
+
+def test_elapsed_counts_consumed_frames(tmp_path, fake_device):
+    factory, streams = fake_device
+    write_ramp(tmp_path / "a.wav", 8000)
+    player = StreamPlayer(blocksize=400, dtype="int16", stream_factory=factory)
+
+    item = player.play(str(tmp_path / "a.wav"))
+    assert player.elapsed(item) == 0.0
+    streams[0].pump(5)
+    assert player.elapsed(item) == pytest.approx(0.25)
+
+    # Frames still in the device buffer have not been heard yet
+    streams[0].latency = 0.05
+    assert player.elapsed(item) == pytest.approx(0.20)
+
+    streams[0].pump(20)
+    assert item.done
+    assert player.elapsed(item) == pytest.approx(1.0)
+    player.stop()
+
+
+def test_rejects_unsupported_dtype():
+    with pytest.raises(ValueError):
+        StreamPlayer(dtype="float64", stream_factory=FakeOutputStream)
+
+
+def test_audio_manager_plays_queue_gaplessly(tmp_path):
+    streams = []
+
+    def factory(**kwargs):
+        stream = FakeOutputStream(**kwargs)
+        streams.append(stream)
+        # Start pulling once the player has wired the stream up
+        threading.Timer(0.05, stream.run, kwargs={"interval": 0.002}).start()
+        return stream
+
+    for name in ("1.wav", "2.wav", "3.wav"):
+        # Longer than the worker's preload poll interval
+        write_ramp(tmp_path / name, 8000)
+
+    with (
+        patch(
+            "app.core.audio.StreamPlayer",
+            partial(StreamPlayer, blocksize=100, dtype="int16", stream_factory=factory),
+        ),
+        patch("app.core.events.event_manager") as mock_event_manager,
+    ):
+        from app.core.audio import AudioManager
+
+        sys_config = SystemConfig(output_dir=str(tmp_path), playback_progress_hz=0)
+        am = AudioManager(sys_config)
+        try:
+            for i, name in enumerate(("1.wav", "2.wav", "3.wav")):
+                am.play_audio(name, request_id=f"req{i}")
+            am.play_queue.join()
+        finally:
+            am.shutdown()
+
+    # One device stream for the whole queue, no silence between items
+    assert len(streams) == 1
+    out = streams[0].output()
+    start = np.flatnonzero(out[:, 0])[0] - 1
+    samples = np.arange(8000) % 30000
+    assert np.array_equal(out[start : start + 24000, 0], np.tile(samples, 3))
+
+    events = [
+        c[0][1]
+        for c in mock_event_manager.publish.call_args_list
+        if c[0][0] == "playback_change"
+    ]
+    assert [(e["is_playing"], e["request_id"]) for e in events] == [
+        (True, "req0"),
+        (False, "req0"),
+        (True, "req1"),
+        (False, "req1"),
+        (True, "req2"),
+        (False, "req2"),
+    ]
+
+
+def test_audio_manager_publishes_progress(tmp_path):
+    streams = []
+
+    def factory(**kwargs):
+        stream = FakeOutputStream(**kwargs)
+        streams.append(stream)
+        threading.Timer(0.02, stream.run, kwargs={"interval": 0.002}).start()
+        return stream
+
+    write_ramp(tmp_path / "1.wav", 16000)
+
+    with (
+        patch(
+            "app.core.audio.StreamPlayer",
+            partial(StreamPlayer, blocksize=100, dtype="int16", stream_factory=factory),
+        ),
+        patch("app.core.events.event_manager") as mock_event_manager,
+    ):
+        from app.core.audio import AudioManager
+
+        sys_config = SystemConfig(output_dir=str(tmp_path), playback_progress_hz=50)
+        am = AudioManager(sys_config)
+        try:
+            am.play_audio("1.wav", request_id="req0")
+            time.sleep(0.15)
+            status = am.get_playback_status()
+            assert status["is_playing"] is True
+            assert status["filename"] == "1.wav"
+            # Position follows the frames consumed by the stream
+            consumed = streams[0].output().shape[0] / 8000
+            assert 0 < status["position"] <= consumed
+            assert status["remaining"] == pytest.approx(2.0 - status["position"])
+            am.play_queue.join()
+        finally:
+            am.shutdown()
+
+    assert am.get_playback_status() == {
+        "is_playing": False,
+        "filename": None,
+        "position": 0.0,
+        "remaining": 0.0,
+    }
+
+    progress = [
+        c[0][1]
+        for c in mock_event_manager.publish.call_args_list
+        if c[0][0] == "playback_progress"
+    ]
+    # ~0.35 s of playback at 50 Hz
+    assert len(progress) >= 5
+    assert all(p["request_id"] == "req0" and p["duration"] == 2.0 for p in progress)
+    positions = [p["position"] for p in progress]
+    assert positions == sorted(positions)
+    assert all(
+        p["remaining"] == pytest.approx(2.0 - p["position"], abs=2e-3) for p in progress
+    )
+
+
+def test_audio_manager_reports_chunks_as_one_playback(tmp_path):
+    streams = []
+
+    def factory(**kwargs):
+        stream = FakeOutputStream(**kwargs)
+        streams.append(stream)
+        threading.Timer(0.05, stream.run, kwargs={"interval": 0.002}).start()
+        return stream
+
+    chunks = []
+    for i in range(3):
+        write_ramp(tmp_path / f"chunk{i}.wav", 8000)
+        chunks.append((tmp_path / f"chunk{i}.wav").read_bytes())
+
+    with (
+        patch(
+            "app.core.audio.StreamPlayer",
+            partial(StreamPlayer, blocksize=100, dtype="int16", stream_factory=factory),
+        ),
+        patch("app.core.events.event_manager") as mock_event_manager,
+    ):
+        from app.core.audio import AudioManager
+
+        sys_config = SystemConfig(output_dir=str(tmp_path), playback_progress_hz=0)
+        am = AudioManager(sys_config)
+        try:
+            for data in chunks:
+                duration, _ = am.play_data(data, "001_x.wav", request_id="req0")
+                assert duration == 1.0
+            am.play_queue.join()
+        finally:
+            am.shutdown()
+
+    assert len(streams) == 1
+    out = streams[0].output()
+    start = np.flatnonzero(out[:, 0])[0] - 1
+    samples = np.arange(8000) % 30000
+    assert np.array_equal(out[start : start + 24000, 0], np.tile(samples, 3))
+
+    events = [
+        c[0][1]
+        for c in mock_event_manager.publish.call_args_list
+        if c[0][0] == "playback_change"
+    ]
+    assert [(e["is_playing"], e["request_id"]) for e in events] == [
+        (True, "req0"),
+        (False, "req0"),
+    ]
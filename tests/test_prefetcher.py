@@ -0,0 +1,131 @@
+import threading
+import time
+
+from app.config.schemas import SynthesisConfig
+from app.services.prefetcher import SynthesisPrefetcher
+
+
+class FastPrefetcher(SynthesisPrefetcher):
+    IDLE_SEC = 0.1
+    POLL_SEC = 0.05
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def make_prefetcher(pending, config=None, **kwargs):
+    done = []
+
+    def synthesize(db_id):
+        pending.remove(db_id)
+        done.append(db_id)
+        return f"{db_id:03d}_hash_text.wav", 1.0
+
+    prefetcher = FastPrefetcher(
+        kwargs.pop("synthesize", synthesize),
+        lambda n: sorted(pending, reverse=True)[:n],
+        config or SynthesisConfig(timing="on_demand", prefetch_count=2),
+        **kwargs,
+    )
+    return prefetcher, done
+
+
+def test_prefetches_newest_pending_records():
+    pending = [1, 2, 3, 4]
+    prefetcher, done = make_prefetcher(
+        pending,
+        SynthesisConfig(timing="on_demand", prefetch_count=2, prefetch_duty_cycle=1),
+    )
+    prefetcher.notify()
+
+    # Keeps going while pending records remain, newest first
+    assert wait_until(lambda: pending == [])
+    assert done == [4, 3, 2, 1]
+    prefetcher.shutdown()
+
+
+def test_disabled_outside_on_demand():
+    for config in (
+        SynthesisConfig(timing="immediate", prefetch_count=3),
+        SynthesisConfig(timing="on_demand", prefetch_count=0),
+    ):
+        pending = [1]
+        prefetcher, done = make_prefetcher(pending, config)
+        prefetcher.notify()
+        time.sleep(0.1)
+        assert done == []
+        assert prefetcher._thread is None
+
+
+def test_yields_to_interactive_synthesis():
+    pending = [1, 2]
+    prefetcher, done = make_prefetcher(pending)
+
+    with prefetcher.interactive():
+        prefetcher.notify()
+        time.sleep(0.2)
+        assert done == []
+
+    # Resumes once VOICEVOX has been idle for IDLE_SEC
+    released = time.monotonic()
+    assert wait_until(lambda: done)
+    assert time.monotonic() - released >= FastPrefetcher.IDLE_SEC * 0.9
+    prefetcher.shutdown()
+
+
+def test_waits_for_voicevox_and_skips_failures():
+    pending = [1, 2]
+    available = threading.Event()
+    calls = []
+
+    def synthesize(db_id):
+        calls.append(db_id)
+        if db_id == 2:
+            raise RuntimeError("bad text")
+        pending.remove(db_id)
+        return "x.wav", 1.0
+
+    prefetcher, _ = make_prefetcher(
+        pending, synthesize=synthesize, is_available=available.is_set
+    )
+    prefetcher.notify()
+    time.sleep(0.1)
+    assert calls == []
+
+    available.set()
+    prefetcher.notify()
+    assert wait_until(lambda: 1 in calls)
+    time.sleep(0.2)
+    # The failed record is not retried right away
+    assert calls == [2, 1]
+    prefetcher.shutdown()
+
+
+def test_duty_cycle_limits_engine_time():
+    pending = [1, 2, 3]
+    starts = []
+
+    def synthesize(db_id):
+        starts.append(time.monotonic())
+        time.sleep(0.05)
+        pending.remove(db_id)
+        return "x.wav", 1.0
+
+    prefetcher, _ = make_prefetcher(
+        pending,
+        SynthesisConfig(timing="on_demand", prefetch_count=3, prefetch_duty_cycle=0.25),
+        synthesize=synthesize,
+    )
+    prefetcher.notify()
+    assert wait_until(lambda: len(starts) == 3)
+    prefetcher.shutdown()
+
+    # 0.05s of work at a 25% duty cycle -> ~0.15s rest between items
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(gap >= 0.18 for gap in gaps)
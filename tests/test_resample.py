@@ -0,0 +1,126 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from app.config.schemas import SynthesisConfig, SystemConfig
+from app.core.database import DatabaseManager, Transcription
+from app.core.resample import _resample_poly_numpy, convert_wav, resample_poly
+from app.core.wav import parse_wav_header, wav_header
+
+
+def sine_wav(sample_rate, channels=1, seconds=0.5, freq=440.0):
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    mono = (np.sin(2 * np.pi * freq * t) * 10000).astype("<i2")
+    pcm = np.repeat(mono[:, None], channels, axis=1).tobytes()
+    return wav_header(sample_rate, channels, 16, len(pcm)) + pcm
+
+
+def pcm_of(data):
+    info = parse_wav_header(data)
+    return np.frombuffer(data, "<i2", offset=info.data_offset).reshape(
+        -1, info.channels
+    )
+
+
+@pytest.mark.parametrize("src,dst", [(24000, 48000), (24000, 44100), (48000, 24000)])
+def test_resample_poly_preserves_sine(src, dst):
+    x = np.sin(2 * np.pi * 440 * np.arange(src) / src)
+    y = _resample_poly_numpy(x, dst, src)
+
+    assert len(y) == dst
+    expected = np.sin(2 * np.pi * 440 * np.arange(dst) / dst)
+    middle = slice(dst // 4, 3 * dst // 4)  # away from the zero-padded edges
+    assert np.abs(y[middle] - expected[middle]).max() < 2e-3
+
+
+def test_numpy_resampler_matches_scipy():
+    signal = pytest.importorskip("scipy.signal")
+    x = np.random.default_rng(0).standard_normal((5000, 2))
+    for up, down in [(2, 1), (147, 80), (1, 2)]:
+        assert np.allclose(
+            _resample_poly_numpy(x, up, down),
+            signal.resample_poly(x, up, down, axis=0),
+            atol=1e-9,
+        )
+
+
+def test_convert_wav():
+    native = sine_wav(24000)
+    assert convert_wav(native, 24000, 1) is native
+
+    stereo = convert_wav(native, 48000, 2)
+    info = parse_wav_header(stereo)
+    assert (info.sample_rate, info.channels) == (48000, 2)
+    assert info.duration == pytest.approx(0.5)
+    samples = pcm_of(stereo)
+    assert np.array_equal(samples[:, 0], samples[:, 1])
+    assert np.abs(samples).max() == pytest.approx(10000, rel=0.01)
+
+    # Downmix averages the channels
+    mono = pcm_of(convert_wav(sine_wav(24000, channels=2), 24000, 1))
+    assert np.array_equal(mono[:, 0], pcm_of(native)[:, 0])
+
+    with pytest.raises(ValueError):
+        convert_wav(wav_header(24000, 1, 8, 4) + b"\x80" * 4, 48000, 1)
+
+
+def test_local_resampling_mode(tmp_path):
+    from app.services.processor import StreamProcessor
+
+    database = DatabaseManager(SimpleNamespace(output_dir=str(tmp_path)))
+    audio_manager = MagicMock()
+    saved = {}
+
+    def save_audio(data, filename):
+        saved[filename] = data
+        return parse_wav_header(data).duration
+
+    audio_manager.save_audio.side_effect = save_audio
+    vv_client = MagicMock()
+    vv_client.synthesis.return_value = sine_wav(24000)
+    config = SynthesisConfig(prefetch_count=0, local_resampling=True)
+
+    with (
+        patch("app.services.processor.db_manager", database),
+        patch("app.core.events.event_manager"),
+        patch.object(StreamProcessor, "_prepare_query_data") as mock_query,
+    ):
+        mock_query.return_value = MagicMock(kana=None, accent_phrases=[])
+        processor = StreamProcessor(vv_client, audio_manager, config)
+        db_id = database.add_transcription(Transcription(text="ローカル", speaker_id=1))
+        filename, duration = processor.synthesize_item(db_id)
+
+        # The output format is part of the content hash unless it is the default
+        record = database.get_transcription(db_id)
+        default_hash = processor._item_params(db_id, record)[1]
+        config.output_sample_rate = 44100
+        assert processor._item_params(db_id, record)[1] != default_hash
+        processor.shutdown()
+    database.close_all_connections()
+
+    _, kwargs = vv_client.synthesis.call_args
+    assert kwargs == {"sample_rate": None, "stereo": False}
+    info = parse_wav_header(saved[filename])
+    assert (info.sample_rate, info.channels) == (48000, 2)
+    assert duration == pytest.approx(0.5)
+
+
+def test_playback_format_conversion():
+    with (
+        patch("app.core.audio.StreamPlayer"),
+        patch("app.core.events.event_manager"),
+    ):
+        from app.core.audio import AudioManager
+
+        am = AudioManager(SystemConfig(playback_progress_hz=0))
+        try:
+            native = sine_wav(24000)
+            assert am._to_playback_format(native) is native
+
+            am.config.playback_sample_rate = 48000
+            info = parse_wav_header(am._to_playback_format(native))
+            assert (info.sample_rate, info.channels) == (48000, 1)
+        finally:
+            am.shutdown()
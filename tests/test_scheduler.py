@@ -0,0 +1,241 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from app.config.schemas import SynthesisConfig
+from app.core.scheduler import Priority, RequestScheduler
+
+
+def request(scheduler, order, name, level, hold=0.0):
+    """Thread body: one engine request of `hold` seconds at `level`."""
+    with scheduler.priority(level):
+        with scheduler.slot():
+            order.append(name)
+            time.sleep(hold)
+
+
+def start(target, *args):
+    t = threading.Thread(target=target, args=args)
+    t.start()
+    return t
+
+
+def wait_queued(scheduler, n, timeout=2.0):
+    deadline = time.time() + timeout
+    while len(scheduler._waiting) < n and time.time() < deadline:
+        time.sleep(0.005)
+    assert len(scheduler._waiting) >= n
+
+
+def test_concurrency_is_bounded():
+    scheduler = RequestScheduler(lambda: 2)
+    lock = threading.Lock()
+    active = []
+    peak = []
+
+    def work():
+        with scheduler.slot():
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+
+    threads = [start(work) for _ in range(10)]
+    for t in threads:
+        t.join()
+    assert max(peak) == 2
+
+
+def test_interactive_overtakes_queued_bulk():
+    scheduler = RequestScheduler(lambda: 1)
+    order = []
+    blocker = threading.Event()
+
+    def hold():
+        with scheduler.slot():
+            blocker.wait(timeout=2)
+
+    holder = start(hold)
+    time.sleep(0.02)
+    threads = [
+        start(request, scheduler, order, f"bulk{i}", Priority.BACKGROUND)
+        for i in range(3)
+    ]
+    wait_queued(scheduler, 3)
+    threads.append(start(request, scheduler, order, "live", Priority.LIVE))
+    wait_queued(scheduler, 4)
+    threads.append(start(request, scheduler, order, "click", Priority.INTERACTIVE))
+    wait_queued(scheduler, 5)
+
+    stats = scheduler.get_stats()["classes"]
+    assert (stats["background"]["queued"], stats["interactive"]["queued"]) == (3, 1)
+
+    blocker.set()
+    for t in [holder] + threads:
+        t.join()
+    assert order == ["click", "live", "bulk0", "bulk1", "bulk2"]
+
+
+def test_bulk_delays_click_by_at_most_one_request():
+    scheduler = RequestScheduler(lambda: 1)
+    stop = threading.Event()
+    request_sec = 0.05
+
+    def bulk_worker():
+        with scheduler.priority(Priority.BACKGROUND):
+            while not stop.is_set():
+                with scheduler.slot():
+                    time.sleep(request_sec)
+
+    workers = [start(bulk_worker) for _ in range(8)]
+    time.sleep(0.1)
+
+    waits = []
+    for _ in range(5):
+        began = time.monotonic()
+        with scheduler.slot():
+            waits.append(time.monotonic() - began)
+        time.sleep(0.02)
+
+    stop.set()
+    for t in workers:
+        t.join()
+    assert max(waits) < request_sec * 1.8
+    assert scheduler.get_stats()["classes"]["interactive"]["started"] == 5
+
+
+def test_boost_reorders_queued_work():
+    scheduler = RequestScheduler(lambda: 1)
+    order = []
+    blocker = threading.Event()
+    contexts = {}
+
+    def hold():
+        with scheduler.slot():
+            blocker.wait(timeout=2)
+
+    def queued(name):
+        with scheduler.priority(Priority.BACKGROUND) as ctx:
+            contexts[name] = ctx
+            with scheduler.slot():
+                order.append(name)
+
+    holder = start(hold)
+    time.sleep(0.02)
+    threads = [start(queued, "a"), start(queued, "b")]
+    wait_queued(scheduler, 2)
+
+    scheduler.boost(contexts["b"], Priority.INTERACTIVE)
+    scheduler.boost(contexts["a"], Priority.BACKGROUND)  # never lowers
+    blocker.set()
+    for t in [holder] + threads:
+        t.join()
+    assert order == ["b", "a"]
+
+
+def test_click_joining_background_synthesis_is_boosted(tmp_path):
+    """Single-flight must not park a play click behind the bulk queue."""
+    from types import SimpleNamespace
+
+    from app.core.database import DatabaseManager, Transcription
+    from app.services.processor import StreamProcessor
+
+    scheduler = RequestScheduler(lambda: 1)
+    order = []
+    vv_client = MagicMock()
+    vv_client.scheduler = scheduler
+
+    def synthesis(query, speaker_id, **output_format):
+        with scheduler.slot():
+            order.append("target")
+        return b"RIFF"
+
+    vv_client.synthesis.side_effect = synthesis
+    database = DatabaseManager(SimpleNamespace(output_dir=str(tmp_path)))
+    audio_manager = MagicMock()
+    audio_manager.save_audio.return_value = 1.0
+
+    with (
+        patch("app.services.processor.db_manager", database),
+        patch("app.core.events.event_manager"),
+        patch.object(StreamProcessor, "_prepare_query_data") as mock_query,
+    ):
+        mock_query.return_value = MagicMock(kana=None, accent_phrases=[])
+        processor = StreamProcessor(
+            vv_client, audio_manager, SynthesisConfig(prefetch_count=0)
+        )
+        db_id = database.add_transcription(Transcription(text="対象", speaker_id=1))
+
+        blocker = threading.Event()
+
+        def hold():
+            with scheduler.slot():
+                blocker.wait(timeout=2)
+
+        holder = start(hold)
+        time.sleep(0.02)
+        bulk = [
+            start(request, scheduler, order, f"bulk{i}", Priority.BACKGROUND)
+            for i in range(3)
+        ]
+        wait_queued(scheduler, 3)
+        background = start(
+            processor._at_priority(Priority.BACKGROUND, processor.synthesize_item),
+            db_id,
+        )
+        wait_queued(scheduler, 4)
+
+        # Play click (INTERACTIVE by default) joins the queued synthesis
+        click = start(processor.synthesize_item, db_id)
+        time.sleep(0.05)
+        blocker.set()
+        for t in [holder, background, click] + bulk:
+            t.join(timeout=2)
+        processor.shutdown()
+    database.close_all_connections()
+
+    assert order[0] == "target"
+    assert vv_client.synthesis.call_count == 1
+
+
+def test_queue_stats_endpoint():
+    from app import create_app
+
+    client = create_app().test_client()
+    data = client.get("/api/system/voicevox_queue").get_json()
+
+    assert data["status"] == "ok"
+    assert set(data["classes"]) == {"interactive", "live", "background"}
+    assert data["max_concurrency"] >= 1
+
+
+def test_health_poller_probes_at_live():
+    """The poller thread sets no priority of its own (unset means INTERACTIVE)."""
+    from app.web import routes
+
+    levels = []
+    probed = threading.Event()
+    bare = []
+    check = threading.Thread(
+        target=lambda: bare.append(routes.vv_client.scheduler.current().level)
+    )
+    check.start()
+    check.join()
+    assert bare == [Priority.INTERACTIVE]
+
+    def probe(*args, **kwargs):
+        levels.append(routes.vv_client.scheduler.current().level)
+        probed.set()
+
+    with (
+        patch.object(routes.vv_client, "_request", side_effect=probe),
+        patch.object(routes, "voicevox_stop_event", threading.Event()) as stop,
+        patch.object(routes.event_manager, "publish"),
+    ):
+        routes.start_voicevox_poller()
+        assert probed.wait(2)
+        stop.set()
+
+    assert levels and set(levels) == {Priority.LIVE}
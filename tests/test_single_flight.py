@@ -0,0 +1,158 @@
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.config.schemas import SynthesisConfig
+from app.core.database import DatabaseManager, Transcription
+from app.core.single_flight import SingleFlight
+
+
+def run_concurrently(n, fn):
+    """Starts n threads at once; returns their results (or exceptions)."""
+    barrier = threading.Barrier(n)
+    results = [None] * n
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = fn()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    return results
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def work():
+        calls.append(1)
+        time.sleep(0.1)
+        return object()
+
+    results = run_concurrently(16, lambda: flight.do("k", work))
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight.shared == 15
+    assert flight.in_flight() == 0
+
+
+def test_errors_are_shared_and_not_remembered():
+    flight = SingleFlight()
+    calls = []
+
+    def fail():
+        calls.append(1)
+        time.sleep(0.1)
+        raise RuntimeError("VOICEVOX offline")
+
+    results = run_concurrently(4, lambda: flight.do("k", fail))
+    assert len(calls) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    # A later call runs again
+    assert flight.do("k", lambda: "ok") == "ok"
+
+
+def test_different_keys_run_in_parallel():
+    flight = SingleFlight()
+    both_running = threading.Barrier(2, timeout=2)
+
+    def work():
+        both_running.wait()
+        return True
+
+    assert run_concurrently(2, lambda: flight.do(threading.get_ident(), work)) == [
+        True,
+        True,
+    ]
+
+
+@pytest.fixture
+def processor_env(tmp_path):
+    from app.services.processor import StreamProcessor
+
+    sys_config = SimpleNamespace(output_dir=str(tmp_path), cache_max_mb=0)
+    database = DatabaseManager(sys_config)
+    audio_manager = MagicMock()
+    audio_manager.get_output_dir.return_value = str(tmp_path)
+
+    def save_audio(data, filename):
+        path = os.path.join(str(tmp_path), filename)
+        # Exclusive create: a second writer of the same file would fail here
+        with open(path, "xb") as f:
+            f.write(data)
+        return 1.0
+
+    audio_manager.save_audio.side_effect = save_audio
+    vv_client = MagicMock()
+
+    def slow_synthesis(query, speaker_id, **output_format):
+        time.sleep(0.2)
+        return b"RIFF"
+
+    vv_client.synthesis.side_effect = slow_synthesis
+
+    with (
+        patch("app.services.processor.db_manager", database),
+        patch("app.core.events.event_manager"),
+        patch.object(StreamProcessor, "_prepare_query_data") as mock_query,
+    ):
+        mock_query.return_value = MagicMock(kana="テスト", accent_phrases=[])
+        processor = StreamProcessor(
+            vv_client, audio_manager, SynthesisConfig(timing="immediate")
+        )
+        yield processor, database, vv_client
+        processor.shutdown()
+    database.close_all_connections()
+
+
+def test_stress_same_record_synthesized_once(processor_env):
+    processor, database, vv_client = processor_env
+    db_id = database.add_transcription(Transcription(text="同時クリック", speaker_id=1))
+
+    results = run_concurrently(32, lambda: processor.synthesize_item(db_id))
+
+    assert vv_client.synthesis.call_count == 1
+    assert not [r for r in results if isinstance(r, Exception)]
+    assert len(set(results)) == 1
+    assert results[0][0].startswith(f"{db_id:03d}_")
+
+    # Later calls see the finished record
+    assert processor.synthesize_item(db_id) == results[0]
+    assert vv_client.synthesis.call_count == 1
+
+
+def test_cache_only_lookup_does_not_swallow_synthesis(processor_env):
+    """A play that joins a batch's cache probe still gets its audio."""
+    processor, database, vv_client = processor_env
+    processor.audio_cache = MagicMock()
+    probe_started = threading.Event()
+
+    def slow_miss(content_hash):
+        probe_started.set()
+        time.sleep(0.1)
+        return None
+
+    processor.audio_cache.lookup.side_effect = slow_miss
+    db_id = database.add_transcription(Transcription(text="一括と再生", speaker_id=1))
+
+    probe = threading.Thread(target=processor.synthesize_from_cache, args=(db_id,))
+    probe.start()
+    probe_started.wait(timeout=2)
+    filename, duration = processor.synthesize_item(db_id)
+    probe.join()
+
+    assert filename.startswith(f"{db_id:03d}_")
+    assert vv_client.synthesis.call_count == 1
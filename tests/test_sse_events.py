@@ -103,6 +103,58 @@ class TestSSEEvents(unittest.TestCase):
 
         self.assertTrue(found, "server_restart event not found in stream")
 
+    def _read_frames(self, response, count, timeout=3):
+        frames = []
+        start_time = time.time()
+        for chunk in response.iter_encoded():
+            frames.append(chunk.decode("utf-8"))
+            if len(frames) >= count or time.time() - start_time > timeout:
+                break
+        response.close()
+        return frames
+
+    def test_sse_frames_carry_event_ids(self):
+        """/api/stream の各イベントに id: フィールドが付与されるか検証"""
+        threading.Timer(0.3, event_manager.publish_server_restart).start()
+
+        response = self.client.get("/api/stream")
+        frame = self._read_frames(response, 1)[0]
+
+        lines = frame.rstrip("\n").split("\n")
+        self.assertTrue(lines[0].startswith("id: "))
+        self.assertTrue(lines[1].startswith("data: "))
+        self.assertTrue(frame.endswith("\n\n"))
+
+    def test_sse_resume_with_last_event_id(self):
+        """Last-Event-ID を指定した再接続で、取りこぼしたイベントのみが再送されるか検証"""
+        sub = event_manager.subscribe()
+        try:
+            event_manager.publish("log_deleted", {"id": 1})
+            last_id = event_manager.event_id(sub.next_event(timeout=2))
+        finally:
+            event_manager.unsubscribe(sub)
+
+        # 再接続までの間に発行されたイベント
+        event_manager.publish("log_deleted", {"id": 2})
+        event_manager.publish("log_deleted", {"id": 3})
+
+        response = self.client.get("/api/stream", headers={"Last-Event-ID": last_id})
+        frames = self._read_frames(response, 2)
+
+        payloads = [json.loads(f.split("data: ", 1)[1]) for f in frames]
+        self.assertEqual(
+            [p["data"] for p in payloads if p["type"] == "log_deleted"],
+            [{"id": 2}, {"id": 3}],
+        )
+
+    def test_sse_resync_when_history_unavailable(self):
+        """再送できない Last-Event-ID の場合、resync イベントが送信されるか検証"""
+        response = self.client.get("/api/stream", query_string={"lastEventId": "1-1"})
+        frame = self._read_frames(response, 1)[0]
+
+        payload = json.loads(frame.split("data: ", 1)[1])
+        self.assertEqual(payload["type"], "resync")
+
     def test_config_update_event_on_synthesis_change(self):
         """音声合成設定の変更時に config_update イベントが発行されるか検証"""
         q = event_manager.subscribe()
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from app.config.schemas import SynthesisConfig
+from app.services.synthesis_queue import SynthesisQueue
+
+
+@pytest.fixture
+def slow_synth():
+    """Fake synthesize_item that blocks like a slow VOICEVOX round-trip."""
+    release = threading.Event()
+    done = []
+
+    def synthesize(db_id):
+        release.wait(timeout=5)
+        done.append(db_id)
+        return f"{db_id:03d}_hash_text.wav", 1.0
+
+    return synthesize, release, done
+
+
+def test_submit_does_not_wait_for_synthesis(slow_synth):
+    """Enqueueing must return immediately even while workers are busy."""
+    synthesize, release, done = slow_synth
+    q = SynthesisQueue(synthesize, SynthesisConfig(worker_count=2, queue_size=10))
+
+    start = time.perf_counter()
+    for db_id in range(1, 6):
+        assert q.submit(db_id) is True
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    assert done == []
+
+    release.set()
+    deadline = time.time() + 3
+    while len(done) < 5 and time.time() < deadline:
+        time.sleep(0.01)
+    assert sorted(done) == [1, 2, 3, 4, 5]
+    q.shutdown()
+
+
+def test_backpressure_leaves_item_pending(slow_synth):
+    """When the queue stays full, submit gives up after the timeout."""
+    synthesize, release, done = slow_synth
+    q = SynthesisQueue(
+        synthesize,
+        SynthesisConfig(worker_count=1, queue_size=1),
+        enqueue_timeout=0.1,
+    )
+
+    assert q.submit(1) is True  # picked up by the single worker
+    time.sleep(0.05)
+    assert q.submit(2) is True  # fills the queue
+    assert q.submit(3) is False  # backpressure
+
+    release.set()
+    q.shutdown()
+    assert 3 not in done
+
+
+def test_worker_survives_synthesis_error():
+    """A failing job must not kill the worker thread."""
+    calls = []
+
+    def synthesize(db_id):
+        calls.append(db_id)
+        if db_id == 1:
+            raise RuntimeError("VOICEVOX offline")
+        return "ok.wav", 1.0
+
+    q = SynthesisQueue(synthesize, SynthesisConfig(worker_count=1, queue_size=5))
+    q.submit(1)
+    q.submit(2)
+
+    deadline = time.time() + 2
+    while len(calls) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert calls == [1, 2]
+    q.shutdown()
+
+
+def test_clear_and_shutdown(slow_synth):
+    """Queued jobs are dropped on clear() and submit is refused after shutdown."""
+    synthesize, release, done = slow_synth
+    q = SynthesisQueue(synthesize, SynthesisConfig(worker_count=1, queue_size=10))
+
+    q.submit(1)
+    time.sleep(0.05)
+    q.submit(2)
+    q.submit(3)
+    assert q.pending_count() == 2
+
+    q.clear()
+    assert q.pending_count() == 0
+
+    release.set()
+    q.shutdown()
+    assert done == [1]
+    assert q.submit(4) is False
+
+
+def test_discard_drops_only_given_queued_jobs(slow_synth):
+    synthesize, release, done = slow_synth
+    q = SynthesisQueue(synthesize, SynthesisConfig(worker_count=1, queue_size=10))
+
+    q.submit(1)
+    time.sleep(0.05)
+    for db_id in (2, 3, 4):
+        q.submit(db_id)
+
+    # 1 is already running and cannot be discarded
+    assert q.discard([1, 3, 4]) == 2
+    assert q.pending_count() == 1
+
+    release.set()
+    q._queue.join()
+    q.shutdown()
+    assert done == [1, 2]
@@ -12,14 +12,7 @@ def vv_client():
     return VoiceVoxClient(mock_config)
 
 
-@patch("urllib.request.urlopen")
-@patch("urllib.request.Request")
-def test_get_speakers_success(mock_request, mock_urlopen, vv_client):
-    # Mock API response
-    mock_res = MagicMock()
-    mock_res.getcode.return_value = 200
-    mock_res.__enter__.return_value = mock_res
-
+def test_get_speakers_success(vv_client):
     speakers_data = [
         {
             "name": "ずんだもん",
@@ -27,13 +20,19 @@ def test_get_speakers_success(mock_request, mock_urlopen, vv_client):
             "styles": [{"name": "ノーマル", "id": 1}, {"name": "あまあま", "id": 3}],
         }
     ]
-    mock_res.read.return_value = json.dumps(speakers_data).encode("utf-8")
-    mock_urlopen.return_value = mock_res
 
     # Use a dummy is_available returning True to allow communication
-    with patch.object(VoiceVoxClient, "is_available", return_value=True):
+    with (
+        patch.object(VoiceVoxClient, "is_available", return_value=True),
+        patch.object(
+            VoiceVoxClient,
+            "_request",
+            return_value=json.dumps(speakers_data).encode("utf-8"),
+        ) as mock_request,
+    ):
         result = vv_client.get_speakers(force_refresh=True)
 
+    mock_request.assert_called_once_with("GET", "/speakers")
     assert len(result) == 1
     assert isinstance(result[0], VoiceVoxSpeaker)
     assert result[0].name == "ずんだもん"
@@ -0,0 +1,211 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.scheduler import Priority
+from app.core.voicevox import VoiceVoxClient
+
+AUDIO_QUERY = {
+    "accent_phrases": [],
+    "speedScale": 1.0,
+    "pitchScale": 0.0,
+    "intonationScale": 1.0,
+    "volumeScale": 1.0,
+    "prePhonemeLength": 0.1,
+    "postPhonemeLength": 0.1,
+    "outputSamplingRate": 24000,
+    "outputStereo": False,
+    "kana": "テスト",
+}
+
+
+class FakeEngine(ThreadingHTTPServer):
+    """Minimal VOICEVOX stand-in that records TCP connections and requests."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeEngineHandler)
+        self.connections = 0
+        self.paths = []
+        self.fail_next = 0
+
+
+class FakeEngineHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body: bytes, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        if self.path == "/version":
+            self._reply(200, b'"0.0.0"')
+        else:
+            self._reply(404, b"{}")
+
+    def do_POST(self):
+        self.server.paths.append(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+
+        if self.server.fail_next > 0:
+            self.server.fail_next -= 1
+            self._reply(503, b"{}")
+        elif self.path.startswith("/audio_query"):
+            self._reply(200, json.dumps(AUDIO_QUERY).encode("utf-8"))
+        elif self.path.startswith("/synthesis"):
+            self._reply(200, b"RIFF....WAVE", content_type="audio/wav")
+        else:
+            self._reply(404, b"{}")
+
+
+@pytest.fixture
+def engine():
+    server = FakeEngine()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def vv_client(engine):
+    cfg = MagicMock()
+    cfg.host = "127.0.0.1"
+    cfg.port = engine.server_address[1]
+    cfg.max_concurrency = 2
+    client = VoiceVoxClient(cfg)
+    client.RETRY_BACKOFF = 0.01
+    yield client
+    client.close()
+
+
+def test_requests_reuse_one_connection(engine, vv_client):
+    """audio_query and synthesis share a persistent keep-alive connection."""
+    for _ in range(3):
+        query = vv_client.audio_query("テスト", 1)
+        audio = vv_client.synthesis(query, 1)
+        assert audio == b"RIFF....WAVE"
+
+    assert engine.connections == 1
+    assert len([p for p in engine.paths if p.startswith("/synthesis")]) == 3
+
+
+def test_retry_with_backoff_on_server_error(engine, vv_client):
+    engine.fail_next = 2
+
+    query = vv_client.audio_query("テスト", 1)
+
+    assert query.kana == "テスト"
+    assert len([p for p in engine.paths if p.startswith("/audio_query")]) == 3
+
+
+def test_client_error_is_not_retried(engine, vv_client):
+    with pytest.raises(RuntimeError, match="HTTP 404"):
+        vv_client._request("POST", "/unknown")
+
+    assert engine.paths.count("/unknown") == 1
+
+
+def test_audio_query_is_memoized(engine, vv_client):
+    """Re-synthesizing with different scales skips /audio_query."""
+    for speed in (1.0, 1.2, 0.8):
+        query = vv_client.audio_query("テスト", 1)
+        query.speedScale = speed
+        vv_client.synthesis(query, 1)
+
+    assert len([p for p in engine.paths if p.startswith("/audio_query")]) == 1
+    assert len([p for p in engine.paths if p.startswith("/synthesis")]) == 3
+
+    # Caller mutations never leak into the cached query
+    assert vv_client.audio_query("テスト", 1).speedScale == 1.0
+
+    # Different speaker or text is a separate entry
+    vv_client.audio_query("テスト", 2)
+    vv_client.audio_query("別の文", 1)
+    assert len([p for p in engine.paths if p.startswith("/audio_query")]) == 3
+
+
+def test_audio_query_cache_is_bounded(engine, vv_client):
+    vv_client.QUERY_CACHE_SIZE = 2
+    for text in ("a", "b", "c"):
+        vv_client.audio_query(text, 1)
+
+    vv_client.audio_query("a", 1)  # evicted, queried again
+
+    assert len([p for p in engine.paths if p.startswith("/audio_query")]) == 4
+
+
+def test_audio_query_cache_expires(engine, vv_client, monkeypatch):
+    """User dictionary edits and engine restarts are picked up."""
+    now = [1000.0]
+    monkeypatch.setattr("app.core.voicevox.time.monotonic", lambda: now[0])
+    count = lambda: len([p for p in engine.paths if p.startswith("/audio_query")])
+
+    vv_client.audio_query("テスト", 1)
+    now[0] += vv_client.QUERY_CACHE_TTL - 1
+    vv_client.audio_query("テスト", 1)
+    assert count() == 1
+
+    now[0] += 2
+    vv_client.audio_query("テスト", 1)
+    assert count() == 2
+
+    # Back from unavailable: the engine may have restarted with other data
+    vv_client._set_health(False)
+    vv_client.refresh_health()
+    vv_client.audio_query("テスト", 1)
+    assert count() == 3
+
+
+def test_cached_health_avoids_probe(engine, vv_client):
+    """is_available() uses the poller-refreshed state instead of probing."""
+    assert vv_client.refresh_health() is True
+    probes = engine.paths.count("/version")
+
+    for _ in range(10):
+        assert vv_client.is_available() is True
+
+    assert engine.paths.count("/version") == probes
+
+
+def test_health_probe_priority(vv_client):
+    """The probe runs at least at LIVE, but never below its caller."""
+    levels = []
+    vv_client._request = lambda *args, **kwargs: levels.append(
+        vv_client.scheduler.current().level
+    )
+
+    for caller in (Priority.INTERACTIVE, Priority.LIVE, Priority.BACKGROUND):
+        with vv_client.scheduler.priority(caller):
+            vv_client.refresh_health()
+
+    assert levels == [Priority.INTERACTIVE, Priority.LIVE, Priority.LIVE]
+
+
+def test_unreachable_engine_marks_unavailable(vv_client, engine):
+    engine.shutdown()
+    engine.server_close()
+    vv_client.close()
+
+    assert vv_client.refresh_health() is False
+    assert vv_client.is_available() is False
+    with pytest.raises(OSError):
+        vv_client.audio_query("テスト", 1)
@@ -0,0 +1,66 @@
+import io
+import struct
+import wave
+
+import pytest
+
+from app.core.wav import parse_wav_header, read_wav_header
+
+
+def make_wav(frames=48000, rate=48000, channels=2, width=2) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(width)
+        w.setframerate(rate)
+        w.writeframes(b"\0" * frames * channels * width)
+    return buf.getvalue()
+
+
+def with_extra_chunk(data: bytes, chunk: bytes) -> bytes:
+    """Inserts a chunk (e.g. LIST) between the fmt and data chunks."""
+    fmt_end = 12 + 8 + 16
+    body = data[:fmt_end] + chunk + data[fmt_end:]
+    return body[:4] + struct.pack("<I", len(body) - 8) + body[8:]
+
+
+def test_duration_from_memory():
+    info = parse_wav_header(make_wav(frames=24000, rate=48000))
+
+    assert info.sample_rate == 48000
+    assert info.channels == 2
+    assert info.bits_per_sample == 16
+    assert info.duration == pytest.approx(0.5)
+
+
+def test_skips_unknown_chunks_with_padding():
+    data = with_extra_chunk(make_wav(frames=12000, rate=24000), b"LIST\x03\0\0\0abc\0")
+
+    assert parse_wav_header(data).duration == pytest.approx(0.5)
+
+
+def test_streamed_data_size_is_clamped():
+    data = bytearray(make_wav(frames=48000, rate=48000))
+    struct.pack_into("<I", data, 40, 0xFFFFFFFF)
+
+    assert parse_wav_header(bytes(data)).duration == pytest.approx(1.0)
+
+
+def test_file_header_matches_memory(tmp_path):
+    data = with_extra_chunk(
+        make_wav(frames=7200, rate=24000, channels=1), b"junk\x02\0\0\0xx"
+    )
+    path = tmp_path / "a.wav"
+    path.write_bytes(data)
+
+    assert read_wav_header(str(path)) == parse_wav_header(data)
+    assert read_wav_header(str(path)).duration == pytest.approx(0.3)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"RIFF\0\0\0\0WAVE", b"OggS" + b"\0" * 40, make_wav()[:30]],
+)
+def test_invalid_headers_raise(data):
+    with pytest.raises(ValueError):
+        parse_wav_header(data)
@@ -92,6 +92,32 @@ def monitor_activity():
             os._exit(0)
 
 
+def run_asgi(app, host, port) -> bool:
+    """
+    Serves the app in asyncio mode (SSE and the whisper receiver as
+    coroutines). Returns False if uvicorn is not installed.
+    """
+    try:
+        import uvicorn
+    except ImportError:
+        print(
+            "[Startup] server.mode is 'asgi' but uvicorn is not installed "
+            "(pip install uvicorn). Using the threaded server."
+        )
+        return False
+
+    from app.asgi import create_asgi_app
+
+    print("[Startup] Serving in ASGI mode (uvicorn)")
+    uvicorn.run(
+        create_asgi_app(app, on_request=update_activity),
+        host=host,
+        port=port,
+        log_level="warning",
+    )
+    return True
+
+
 if __name__ == "__main__":
     # 0. Single Instance Check
     kill_previous_instances()
@@ -118,7 +144,8 @@ if __name__ == "__main__":
 
     print(f"Starting server on {host}:{port}")
     try:
-        app.run(host=host, port=port, debug=False, threaded=True)
+        if not (config.server.mode == "asgi" and run_asgi(app, host, port)):
+            app.run(host=host, port=port, debug=False, threaded=True)
     finally:
         # Cleanup on exit (whether checking, error, or clean return)
         print("[Startup] Server stopping...")